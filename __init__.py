@@ -3,16 +3,20 @@
 from __future__ import annotations
 
 from datetime import datetime
+from functools import partial
 import logging
 import os
+from typing import Any
 
 import voluptuous as vol
 
 from homeassistant.components.http import StaticPathConfig
-from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP, Platform
+from homeassistant.core import Event, HomeAssistant, ServiceCall, ServiceResponse
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.event import async_track_time_change
+from homeassistant.helpers.start import async_at_started
 from homeassistant.util import dt as dt_util
 
 from .const import (
@@ -55,6 +59,7 @@ from .const import (
     CONF_PET_ID,
     CONF_PET_NAME,
     CONF_PET_TYPE,
+    CONF_RETENTION,
     DOMAIN,
     EVENT_PET_HEALTH_DATA_UPDATED,
     SERVICE_AMEND_VISIT,
@@ -106,6 +111,11 @@ from .models import (
     WeightRecord,
     WellbeingRecord,
 )
+from .coordinator import (
+    SUMMARY_RECORD_TYPES,
+    PetHealthCoordinator,
+    PetHealthScheduler,
+)
 from .store import PetHealthStore
 from . import panel
 from . import websocket
@@ -354,7 +364,23 @@ async def async_setup(hass: HomeAssistant, config: dict) -> bool:
     # Initialize storage
     store = PetHealthStore(hass)
     await store.async_load()
-    hass.data[DOMAIN] = {"store": store}
+    hass.data[DOMAIN] = {"store": store, "scheduler": PetHealthScheduler(hass)}
+
+    async def _async_flush_store(_event: Event) -> None:
+        """Write pending changes before Home Assistant stops."""
+        await store.async_flush()
+
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, _async_flush_store)
+
+    async def _async_apply_retention(*_: Any) -> None:
+        """Compact records past each pet's retention into daily rollups."""
+        for entry in hass.config_entries.async_entries(DOMAIN):
+            if retention := entry.options.get(CONF_RETENTION):
+                await store.async_apply_retention(entry.data[CONF_PET_ID], retention)
+
+    # Once after startup, then nightly while little else is running
+    async_at_started(hass, _async_apply_retention)
+    async_track_time_change(hass, _async_apply_retention, hour=3, minute=0, second=0)
 
     # Register the www directory for serving panel assets
     www_dir = os.path.join(os.path.dirname(__file__), "www")
@@ -523,6 +549,7 @@ async def async_setup(hass: HomeAssistant, config: dict) -> bool:
             unit=call.data.get(ATTR_UNIT) or medication_config.get(CONF_MEDICATION_UNIT),
             reason=None,  # Not storing reason per dose
             notes=call.data.get(ATTR_NOTES),
+            medication_id=medication_id,
         )
 
         # Save to storage
@@ -552,7 +579,7 @@ async def async_setup(hass: HomeAssistant, config: dict) -> bool:
         visit_id = call.data[ATTR_VISIT_ID]
 
         # Get the visit before updating to retrieve pet_id for event
-        result = store.find_visit(visit_id)
+        result = await store.async_find_visit(visit_id)
         if not result:
             raise HomeAssistantError(f"Visit {visit_id} not found")
         
@@ -596,27 +623,31 @@ async def async_setup(hass: HomeAssistant, config: dict) -> bool:
                 for entry in hass.config_entries.async_entries(DOMAIN)
             ]
 
-        confirmed_visits = 0
         removed_unknown_visits = 0
-        changed_pet_ids: set[str] = set()
 
         def confirm(updated_visit: BathroomVisit) -> None:
             updated_visit.confirmed = True
 
-        for pet_id in pet_ids:
-            for visit in store.get_visits(pet_id):
-                if visit.confirmed:
-                    continue
-
-                if await store.async_update_visit(visit.visit_id, confirm):
-                    confirmed_visits += 1
-                    changed_pet_ids.add(pet_id)
+        # Apply all changes in memory and persist them with a single save
+        confirmed = await store.async_bulk_update_visits(
+            [
+                visit.visit_id
+                for pet_id in pet_ids
+                for visit in store.get_visits(pet_id)
+                if not visit.confirmed
+            ],
+            confirm,
+        )
+        confirmed_visits = len(confirmed)
+        changed_pet_ids = {visit.pet_id for visit in confirmed}
 
         if remove_unknown_visits:
-            for visit in list(store.get_visits(UNKNOWN_ENTRY_ID)):
-                if await store.async_delete_visit(visit.visit_id):
-                    removed_unknown_visits += 1
-                    changed_pet_ids.add(UNKNOWN_ENTRY_ID)
+            removed = await store.async_bulk_delete_visits(
+                [visit.visit_id for visit in store.get_visits(UNKNOWN_ENTRY_ID)]
+            )
+            removed_unknown_visits = len(removed)
+            if removed:
+                changed_pet_ids.add(UNKNOWN_ENTRY_ID)
 
         for pet_id in changed_pet_ids:
             hass.bus.async_fire(
@@ -681,7 +712,7 @@ async def async_setup(hass: HomeAssistant, config: dict) -> bool:
         visit_id = call.data[ATTR_VISIT_ID]
 
         # Get the visit before deleting to retrieve pet_id for event
-        result = store.find_visit(visit_id)
+        result = await store.async_find_visit(visit_id)
         if not result:
             raise HomeAssistantError(f"Visit {visit_id} not found")
         
@@ -705,7 +736,7 @@ async def async_setup(hass: HomeAssistant, config: dict) -> bool:
         visit_id = call.data[ATTR_VISIT_ID]
 
         # Get the visit before updating to retrieve pet_id for event
-        result = store.find_visit(visit_id)
+        result = await store.async_find_visit(visit_id)
         if not result:
             raise HomeAssistantError(f"Visit {visit_id} not found")
         
@@ -1024,30 +1055,17 @@ async def async_setup(hass: HomeAssistant, config: dict) -> bool:
         await store.async_save_weight(record)
 
         # Calculate weight change over last 7 and 30 days
-        weight_records = store.get_weight_records(pet_data.pet_id)
+        weight_stats = store.get_weight_stats(pet_data.pet_id)
         weight_change_7d = None
         weight_change_30d = None
 
-        if len(weight_records) >= 2:
-            # Sort by timestamp descending
-            sorted_records = sorted(
-                weight_records, key=lambda r: r.timestamp, reverse=True
-            )
-            current_weight = sorted_records[0].weight_grams
-
-            # Find weight from 7 days ago
-            for old_record in reversed(sorted_records[1:]):
-                days_ago = (logged_at - old_record.timestamp).days
-                if days_ago >= 7:
-                    weight_change_7d = current_weight - old_record.weight_grams
-                    break
-
-            # Find weight from 30 days ago
-            for old_record in reversed(sorted_records[1:]):
-                days_ago = (logged_at - old_record.timestamp).days
-                if days_ago >= 30:
-                    weight_change_30d = current_weight - old_record.weight_grams
-                    break
+        if weight_stats and weight_stats.count >= 2:
+            # Compare the latest weight with the oldest one
+            days_ago = (logged_at - weight_stats.first_time).days
+            if days_ago >= 7:
+                weight_change_7d = int(weight_stats.change)
+            if days_ago >= 30:
+                weight_change_30d = int(weight_stats.change)
 
         _LOGGER.info(
             "Logged weight (%d grams) for %s at %s",
@@ -1587,9 +1605,26 @@ async def async_setup_entry(hass: HomeAssistant, entry: PetHealthConfigEntry) ->
     )
 
     # Store in runtime_data for access by platforms
-    # This is where a coordinator would go in the future for event handling
     entry.runtime_data = pet_data
 
+    # One summary per change is shared by all sensors of the pet
+    store: PetHealthStore = hass.data[DOMAIN]["store"]
+    coordinator = PetHealthCoordinator(hass, entry, store, pet_data.pet_id)
+    await coordinator.async_config_entry_first_refresh()
+    store.register_update_callback(
+        pet_data.pet_id, coordinator.async_store_updated, SUMMARY_RECORD_TYPES
+    )
+    entry.async_on_unload(
+        partial(
+            store.unregister_update_callback,
+            pet_data.pet_id,
+            coordinator.async_store_updated,
+        )
+    )
+    # Refreshed when time dependent values change, e.g. at midnight
+    entry.async_on_unload(hass.data[DOMAIN]["scheduler"].async_add(coordinator))
+    pet_data.coordinator = coordinator
+
     # Forward to platforms when they exist
     if _PLATFORMS:
         await hass.config_entries.async_forward_entry_setups(entry, _PLATFORMS)
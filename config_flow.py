@@ -18,6 +18,9 @@ from homeassistant.config_entries import (
 from homeassistant.core import callback
 from homeassistant.helpers.selector import (
     DateSelector,
+    NumberSelector,
+    NumberSelectorConfig,
+    NumberSelectorMode,
     SelectSelector,
     SelectSelectorConfig,
     SelectSelectorMode,
@@ -44,7 +47,9 @@ from .const import (
     CONF_PET_IMAGE_PATH,
     CONF_PET_NAME,
     CONF_PET_TYPE,
+    CONF_RETENTION,
     DOMAIN,
+    HOT_WINDOW_DAYS,
     MedicationFrequency,
     PetType,
 )
@@ -147,6 +152,8 @@ class PetHealthOptionsFlow(OptionsFlow):
         Menu actions:
             - edit_image: Navigate to edit pet image path
             - medications: Navigate to medication management
+            - categories: Navigate to log category management
+            - retention: Navigate to history retention settings
             - done: Complete configuration
         """
         if user_input is not None:
@@ -157,7 +164,11 @@ class PetHealthOptionsFlow(OptionsFlow):
                 return await self.async_step_medication_list()
             if action == "categories":
                 return await self.async_step_category_list()
-            return self.async_create_entry(title="", data={})
+            if action == "retention":
+                return await self.async_step_retention()
+            return self.async_create_entry(
+                title="", data={**self.config_entry.options}
+            )
 
         return self.async_show_form(
             step_id="init",
@@ -169,6 +180,7 @@ class PetHealthOptionsFlow(OptionsFlow):
                                 {"label": "Edit pet image", "value": "edit_image"},
                                 {"label": "Manage medications", "value": "medications"},
                                 {"label": "Manage log categories", "value": "categories"},
+                                {"label": "History retention", "value": "retention"},
                                 {"label": "Done", "value": "done"},
                             ],
                             mode=SelectSelectorMode.LIST,
@@ -207,7 +219,9 @@ class PetHealthOptionsFlow(OptionsFlow):
             self.hass.config_entries.async_update_entry(
                 self.config_entry, data=new_data
             )
-            return self.async_create_entry(title="", data={})
+            return self.async_create_entry(
+                title="", data={**self.config_entry.options}
+            )
 
         current_image_path = self.config_entry.data.get(CONF_PET_IMAGE_PATH, "")
 
@@ -223,6 +237,54 @@ class PetHealthOptionsFlow(OptionsFlow):
             description_placeholders={"pet_name": self.config_entry.title},
         )
 
+    async def async_step_retention(
+        self, user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        """Set how many days raw records of each type are kept.
+
+        Older records are compacted into daily rollups. 0 keeps them forever.
+        """
+        record_types = self.hass.data[DOMAIN]["store"].record_types()
+
+        if user_input is not None:
+            retention = {
+                record_type: int(days)
+                for record_type, days in user_input.items()
+                if days
+            }
+            # Keep the medications and categories, the data replaces all options
+            return self.async_create_entry(
+                title="",
+                data={**self.config_entry.options, CONF_RETENTION: retention},
+            )
+
+        current = self.config_entry.options.get(CONF_RETENTION, {})
+        days_selector = NumberSelector(
+            NumberSelectorConfig(
+                min=0,
+                max=3650,
+                step=1,
+                mode=NumberSelectorMode.BOX,
+                unit_of_measurement="days",
+            )
+        )
+
+        return self.async_show_form(
+            step_id="retention",
+            data_schema=vol.Schema(
+                {
+                    vol.Optional(
+                        record_type, default=current.get(record_type, 0)
+                    ): days_selector
+                    for record_type in record_types
+                }
+            ),
+            description_placeholders={
+                "pet_name": self.config_entry.title,
+                "hot_window_days": str(HOT_WINDOW_DAYS),
+            },
+        )
+
     async def async_step_medication_list(
         self, user_input: dict[str, Any] | None = None
     ) -> ConfigFlowResult:
@@ -251,9 +313,11 @@ class PetHealthOptionsFlow(OptionsFlow):
                 ]
                 return self.async_create_entry(
                     title="",
-                    data={CONF_MEDICATIONS: medications},
+                    data={**self.config_entry.options, CONF_MEDICATIONS: medications},
                 )
-            return self.async_create_entry(title="", data={})
+            return self.async_create_entry(
+                title="", data={**self.config_entry.options}
+            )
 
         # Build medication list options
         medications = self.config_entry.options.get(CONF_MEDICATIONS, [])
@@ -318,7 +382,7 @@ class PetHealthOptionsFlow(OptionsFlow):
 
                 return self.async_create_entry(
                     title="",
-                    data={CONF_MEDICATIONS: medications},
+                    data={**self.config_entry.options, CONF_MEDICATIONS: medications},
                 )
 
         return self.async_show_form(
@@ -390,7 +454,7 @@ class PetHealthOptionsFlow(OptionsFlow):
 
                 return self.async_create_entry(
                     title="",
-                    data={CONF_MEDICATIONS: medications},
+                    data={**self.config_entry.options, CONF_MEDICATIONS: medications},
                 )
 
         if not self._editing_medication:
@@ -476,9 +540,14 @@ class PetHealthOptionsFlow(OptionsFlow):
                 ]
                 return self.async_create_entry(
                     title="",
-                    data={CONF_GENERIC_LOG_CATEGORIES: categories},
+                    data={
+                        **self.config_entry.options,
+                        CONF_GENERIC_LOG_CATEGORIES: categories,
+                    },
                 )
-            return self.async_create_entry(title="", data={})
+            return self.async_create_entry(
+                title="", data={**self.config_entry.options}
+            )
 
         # Build category list options
         categories = self.config_entry.options.get(CONF_GENERIC_LOG_CATEGORIES, [])
@@ -545,7 +614,10 @@ class PetHealthOptionsFlow(OptionsFlow):
 
                     return self.async_create_entry(
                         title="",
-                        data={CONF_GENERIC_LOG_CATEGORIES: categories},
+                        data={
+                            **self.config_entry.options,
+                            CONF_GENERIC_LOG_CATEGORIES: categories,
+                        },
                     )
         return self.async_show_form(
             step_id="add_category",
@@ -578,7 +650,10 @@ class PetHealthOptionsFlow(OptionsFlow):
 
                 return self.async_create_entry(
                     title="",
-                    data={CONF_GENERIC_LOG_CATEGORIES: categories},
+                    data={
+                        **self.config_entry.options,
+                        CONF_GENERIC_LOG_CATEGORIES: categories,
+                    },
                 )
 
         if not self._editing_category:
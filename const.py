@@ -19,6 +19,8 @@ CONF_PET_IMAGE_PATH = "pet_image_path"
 # Options keys
 CONF_MEDICATIONS = "medications"
 CONF_GENERIC_LOG_CATEGORIES = "generic_log_categories"
+# Days raw records are kept per record type, 0 keeps them forever
+CONF_RETENTION = "retention"
 
 # Medication config keys
 CONF_MEDICATION_ID = "medication_id"
@@ -36,7 +38,7 @@ CONF_CATEGORY_ID = "category_id"
 CONF_CATEGORY_NAME = "category_name"
 
 # Storage
-STORAGE_VERSION = 1
+STORAGE_VERSION = 2
 STORAGE_KEY_VISITS = "pet_health_visits"
 STORAGE_KEY_MEDICATIONS = "pet_health_medications"
 STORAGE_KEY_DRINKS = "pet_health_drinks"
@@ -50,6 +52,23 @@ STORAGE_KEY_GENERIC_LOGS = "pet_health_generic_logs"
 STORAGE_KEY_BLOOD_GLUCOSE = "pet_health_blood_glucose"
 STORAGE_KEY_GLYCATED_HEMOGLOBIN = "pet_health_glycated_hemoglobin"
 STORAGE_KEY_KETONES = "pet_health_ketones"
+# Daily rollups of records past their retention
+STORAGE_KEY_ROLLUPS = "pet_health_rollups"
+# Index of the per-pet shard files, e.g. pet_health_visits.<pet_id>
+STORAGE_KEY_MANIFEST = "pet_health_manifest"
+
+# Append-only journal written next to the shards of each record type
+STORAGE_JOURNAL_SUFFIX = "journal"
+# Number of journaled records before they are folded into the shards
+JOURNAL_COMPACT_THRESHOLD = 500
+# Seconds pending changes are held before they are written to disk
+DEFAULT_SAVE_DELAY = 5
+# Days of records kept in memory, older months are frozen into segment files
+HOT_WINDOW_DAYS = 31
+# Record changes kept in memory for pet_health/get_changes_since
+CHANGE_LOG_SIZE = 5000
+# Record IDs remembered as missing from the frozen segments
+MISSING_ID_CACHE_SIZE = 1000
 
 # Service names
 SERVICE_LOG_BATHROOM_VISIT = "log_bathroom_visit"
@@ -0,0 +1,323 @@
+"""Per-pet data coordinator for the Pet Health integration."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass, replace
+from datetime import datetime, timedelta
+from functools import partial
+import logging
+from typing import Any, TypeVar
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_point_in_utc_time
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    CONF_MEDICATION_ID,
+    CONF_MEDICATION_NAME,
+    CONF_MEDICATIONS,
+    DOMAIN,
+)
+from .models import (
+    AppetiteLevelRecord,
+    BathroomVisit,
+    DrinkRecord,
+    MealRecord,
+    MedicationRecord,
+    PetHealthConfigEntry,
+    ThirstLevelRecord,
+    WeightRecord,
+    WellbeingRecord,
+)
+from .series import SeriesStats
+from .store import PetHealthStore
+
+_LOGGER = logging.getLogger(__name__)
+
+_T = TypeVar("_T")
+
+WEEK = timedelta(days=7)
+HOUR = timedelta(hours=1)
+
+
+@dataclass(slots=True, frozen=True)
+class PetSummary:
+    """What the sensors of one pet show, computed once per change."""
+
+    last_visit: BathroomVisit | None
+    # Most recent visits that recorded each detail
+    last_poop_consistency_visit: BathroomVisit | None
+    last_poop_color_visit: BathroomVisit | None
+    last_urine_amount_visit: BathroomVisit | None
+    visits_today: int
+    pee_today: int
+    poop_today: int
+    visits_last_7_days: int
+    # Oldest first
+    unconfirmed_visits: tuple[BathroomVisit, ...]
+    # By configured medication ID
+    last_medications: Mapping[str, MedicationRecord]
+    medications_today: Mapping[str, int]
+    last_drink: DrinkRecord | None
+    drinks_today: int
+    last_meal: MealRecord | None
+    meals_today: int
+    last_thirst_level: ThirstLevelRecord | None
+    last_appetite_level: AppetiteLevelRecord | None
+    last_wellbeing: WellbeingRecord | None
+    last_weight: WeightRecord | None
+    weight_stats: SeriesStats | None
+    # When a value that depends on the time changes next
+    stale_at: datetime
+
+
+def _last(records: list[_T]) -> _T | None:
+    """Return the newest of records sorted by time."""
+    return records[-1] if records else None
+
+
+def _stale_at(
+    now: datetime,
+    last_visit: BathroomVisit | None,
+    week: list[BathroomVisit],
+) -> datetime:
+    """Return when a summary made at now goes stale.
+
+    Daily counts change at local midnight, the 7-day count when its oldest
+    visit leaves the window and hours since the last visit on each whole
+    hour after it.
+    """
+    candidates = [dt_util.start_of_local_day(now.date() + timedelta(days=1))]
+    if week:
+        candidates.append(week[0].timestamp + WEEK)
+    if last_visit is not None:
+        hours = max((now - last_visit.timestamp) // HOUR, -1)
+        candidates.append(last_visit.timestamp + (hours + 1) * HOUR)
+    return min(candidate for candidate in candidates if candidate > now)
+
+
+def _summarize_visits(
+    store: PetHealthStore, pet_id: str, now: datetime
+) -> dict[str, Any]:
+    """Summarize a pet's bathroom visits."""
+    visits = store.get_visits(pet_id)
+    return {
+        "last_visit": _last(visits),
+        "last_poop_consistency_visit": next(
+            (visit for visit in reversed(visits) if visit.poop_consistencies), None
+        ),
+        "last_poop_color_visit": next(
+            (visit for visit in reversed(visits) if visit.poop_color), None
+        ),
+        "last_urine_amount_visit": next(
+            (visit for visit in reversed(visits) if visit.urine_amount), None
+        ),
+        "visits_today": store.get_daily_count("visits", pet_id),
+        "pee_today": store.get_daily_count("visits", pet_id, "pee"),
+        "poop_today": store.get_daily_count("visits", pet_id, "poop"),
+        "visits_last_7_days": len(store.get_visits_between(pet_id, now - WEEK)),
+        "unconfirmed_visits": tuple(visit for visit in visits if not visit.confirmed),
+    }
+
+
+def _summarize_medications(
+    store: PetHealthStore,
+    pet_id: str,
+    now: datetime,
+    *,
+    medications: Mapping[str, str] | None = None,
+) -> dict[str, Any]:
+    """Summarize a pet's doses of the configured medications.
+
+    medications maps medication IDs to names, doses logged before they
+    were stored with an ID are found by name.
+    """
+    last_medications: dict[str, MedicationRecord] = {}
+    medications_today: dict[str, int] = {}
+    for medication_id, name in (medications or {}).items():
+        doses = [
+            dose
+            for key in (medication_id, name)
+            if (dose := store.get_latest_record("medications", pet_id, key))
+        ]
+        if doses:
+            last_medications[medication_id] = max(
+                doses, key=lambda dose: dose.timestamp
+            )
+        medications_today[medication_id] = store.get_daily_count(
+            "medications", pet_id, medication_id
+        ) + store.get_daily_count("medications", pet_id, name)
+    return {
+        "last_medications": last_medications,
+        "medications_today": medications_today,
+    }
+
+
+# Record types the summary is built from, with what each contributes
+_SUMMARIZERS: dict[
+    str, Callable[[PetHealthStore, str, datetime], dict[str, Any]]
+] = {
+    "visits": _summarize_visits,
+    "medications": _summarize_medications,
+    "drinks": lambda store, pet_id, now: {
+        "last_drink": _last(store.get_drink_records(pet_id)),
+        "drinks_today": store.get_daily_count("drinks", pet_id),
+    },
+    "meals": lambda store, pet_id, now: {
+        "last_meal": _last(store.get_meal_records(pet_id)),
+        "meals_today": store.get_daily_count("meals", pet_id),
+    },
+    "thirst_levels": lambda store, pet_id, now: {
+        "last_thirst_level": _last(store.get_thirst_level_records(pet_id)),
+    },
+    "appetite_levels": lambda store, pet_id, now: {
+        "last_appetite_level": _last(store.get_appetite_level_records(pet_id)),
+    },
+    "wellbeing": lambda store, pet_id, now: {
+        "last_wellbeing": _last(store.get_wellbeing_records(pet_id)),
+    },
+    "weight": lambda store, pet_id, now: {
+        "last_weight": _last(store.get_weight_records(pet_id)),
+        "weight_stats": store.get_weight_stats(pet_id),
+    },
+}
+
+# Record types sensors are built from, other changes don't wake them
+SUMMARY_RECORD_TYPES = frozenset(_SUMMARIZERS)
+
+
+class PetHealthCoordinator(DataUpdateCoordinator[PetSummary]):
+    """Summarize one pet's records for all of its sensors.
+
+    The store notifies the coordinator when the pet's records change, the
+    summary is then rebuilt once and pushed to every sensor. Values that
+    depend on the time are refreshed by the PetHealthScheduler.
+    """
+
+    config_entry: PetHealthConfigEntry
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry: PetHealthConfigEntry,
+        store: PetHealthStore,
+        pet_id: str,
+    ) -> None:
+        """Initialize the coordinator."""
+        super().__init__(
+            hass,
+            _LOGGER,
+            config_entry=entry,
+            name=f"{DOMAIN}_{pet_id}",
+        )
+        self.store = store
+        self.pet_id = pet_id
+        self._summarizers = {
+            **_SUMMARIZERS,
+            "medications": partial(
+                _summarize_medications,
+                medications={
+                    medication[CONF_MEDICATION_ID]: medication[CONF_MEDICATION_NAME]
+                    for medication in entry.options.get(CONF_MEDICATIONS, [])
+                },
+            ),
+        }
+        # Sensor state writes skipped because nothing changed
+        self.suppressed_writes = 0
+
+    async def _async_update_data(self) -> PetSummary:
+        """Build the first summary."""
+        return self._summarize()
+
+    @callback
+    def async_store_updated(self, record_type: str | None = None) -> None:
+        """Rebuild the summary after the pet's records of a type changed.
+
+        Without a record_type the whole summary is rebuilt.
+        """
+        self.async_set_updated_data(self._summarize(record_type))
+
+    def _summarize(self, record_type: str | None = None) -> PetSummary:
+        """Compute the summary from the records kept in memory.
+
+        With a record_type only the fields built from that type are
+        recomputed, the others are kept from the current summary.
+        """
+        store = self.store
+        pet_id = self.pet_id
+        now = dt_util.now()
+        if record_type is None or self.data is None:
+            values: dict[str, Any] = {}
+            for summarize in self._summarizers.values():
+                values.update(summarize(store, pet_id, now))
+        else:
+            values = self._summarizers[record_type](store, pet_id, now)
+            if record_type != "visits":
+                return replace(self.data, **values)
+
+        values["stale_at"] = _stale_at(
+            now,
+            _last(store.get_visits(pet_id)),
+            store.get_visits_between(pet_id, now - WEEK),
+        )
+        if record_type is None or self.data is None:
+            return PetSummary(**values)
+        return replace(self.data, **values)
+
+
+class PetHealthScheduler:
+    """Refresh summaries when a value that depends on the time changes.
+
+    One timer serves the whole integration. It is set for the earliest
+    time any pet's summary goes stale and only refreshes those pets.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the scheduler."""
+        self.hass = hass
+        self._coordinators: set[PetHealthCoordinator] = set()
+        self._unsub: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_add(self, coordinator: PetHealthCoordinator) -> CALLBACK_TYPE:
+        """Schedule a coordinator's refreshes, returns a function removing it."""
+        self._coordinators.add(coordinator)
+        remove_listener = coordinator.async_add_listener(self.async_reschedule)
+        self.async_reschedule()
+
+        @callback
+        def remove() -> None:
+            remove_listener()
+            self._coordinators.discard(coordinator)
+            self.async_reschedule()
+
+        return remove
+
+    @callback
+    def async_reschedule(self) -> None:
+        """Set the timer for the earliest stale summary."""
+        if self._unsub is not None:
+            self._unsub()
+            self._unsub = None
+        stale_at = [
+            coordinator.data.stale_at
+            for coordinator in self._coordinators
+            if coordinator.data is not None
+        ]
+        if stale_at:
+            self._unsub = async_track_point_in_utc_time(
+                self.hass, self._async_refresh, dt_util.as_utc(min(stale_at))
+            )
+
+    @callback
+    def _async_refresh(self, now: datetime) -> None:
+        """Refresh the summaries that went stale."""
+        self._unsub = None
+        for coordinator in list(self._coordinators):
+            if coordinator.data is not None and coordinator.data.stale_at <= now:
+                # Reschedules through the coordinator's listener
+                coordinator.async_store_updated()
+        self.async_reschedule()
+
@@ -0,0 +1,31 @@
+"""Diagnostics support for Pet Health."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN
+from .models import PetHealthConfigEntry
+from .store import PetHealthStore
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: PetHealthConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    store: PetHealthStore = hass.data[DOMAIN]["store"]
+    pet_id = entry.runtime_data.pet_id
+
+    return {
+        "pet_id": pet_id,
+        "pet_type": entry.runtime_data.pet_type,
+        "store": {
+            "load_duration": store.load_duration,
+            "records_in_memory": store.record_counts(pet_id),
+        },
+        "sensors": {
+            "suppressed_writes": entry.runtime_data.coordinator.suppressed_writes,
+        },
+    }
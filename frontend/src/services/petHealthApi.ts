@@ -7,6 +7,15 @@ import type {
   LogBathroomVisitData,
   LogMedicationData,
   AmendVisitData,
+  DailyRollups,
+  AggregateOptions,
+  Aggregates,
+  UnconfirmedVisitsPage,
+  ChangeSet,
+  ChangeEvent,
+  PageOptions,
+  DumpOptions,
+  VisitsPage,
 } from '../types';
 
 export class PetHealthAPI {
@@ -33,13 +42,16 @@ export class PetHealthAPI {
     return this.petDataCache;
   }
 
-  async getStoreDump(entryId?: string): Promise<StoreData> {
+  // Without paging options only the recent records kept in memory are
+  // returned, next_before pages into the older ones
+  async getStoreDump(entryId?: string, options?: DumpOptions): Promise<StoreData> {
     await this.ensurePetDataCache();
     const petId = entryId ? this.getPetIdFromEntryId(entryId) : undefined;
 
     const result = await this.hass.callWS<{ data: Record<string, StoreData> }>({
       type: 'pet_health/get_store_dump',
       pet_id: petId,
+      ...options,
     });
 
     // If specific pet requested, return just that pet's data
@@ -51,20 +63,37 @@ export class PetHealthAPI {
     return result?.data || {};
   }
 
-  async getVisits(entryId: string): Promise<Visit[]> {
+  async getChangesSince(cursor?: string, entryId?: string): Promise<ChangeSet> {
+    await this.ensurePetDataCache();
+    const petId = entryId ? this.getPetIdFromEntryId(entryId) : undefined;
+
+    return await this.hass.callWS<ChangeSet>({
+      type: 'pet_health/get_changes_since',
+      cursor,
+      pet_id: petId,
+    });
+  }
+
+  async getVisits(entryId: string, page?: PageOptions): Promise<Visit[]> {
+    return (await this.getVisitsPage(entryId, page)).visits;
+  }
+
+  // Pass next_before back as before to load the older visits
+  async getVisitsPage(entryId: string, page?: PageOptions): Promise<VisitsPage> {
     await this.ensurePetDataCache();
     const petId = this.getPetIdFromEntryId(entryId);
 
     if (!petId) {
       console.warn('No pet_id found for entry_id:', entryId);
-      return [];
+      return { visits: [], next_before: null };
     }
 
-    const result = await this.hass.callWS<{ visits: Visit[] }>({
+    const result = await this.hass.callWS<VisitsPage>({
       type: 'pet_health/get_visits',
       pet_id: petId,
+      ...page,
     });
-    return result?.visits || [];
+    return { visits: result?.visits || [], next_before: result?.next_before ?? null };
   }
 
   async getUnknownVisits(): Promise<Visit[]> {
@@ -74,7 +103,7 @@ export class PetHealthAPI {
     return result?.visits || [];
   }
 
-  async getMedications(entryId: string): Promise<MedicationLog[]> {
+  async getMedications(entryId: string, page?: PageOptions): Promise<MedicationLog[]> {
     await this.ensurePetDataCache();
     const petId = this.getPetIdFromEntryId(entryId);
 
@@ -86,10 +115,72 @@ export class PetHealthAPI {
     const result = await this.hass.callWS<{ medications: MedicationLog[] }>({
       type: 'pet_health/get_medications',
       pet_id: petId,
+      ...page,
     });
     return result?.medications || [];
   }
 
+  async getDailyRollups(entryId: string, recordType?: string): Promise<DailyRollups> {
+    await this.ensurePetDataCache();
+    const petId = this.getPetIdFromEntryId(entryId);
+
+    if (!petId) {
+      console.warn('No pet_id found for entry_id:', entryId);
+      return {};
+    }
+
+    const result = await this.hass.callWS<{ rollups: DailyRollups }>({
+      type: 'pet_health/get_daily_rollups',
+      pet_id: petId,
+      record_type: recordType,
+    });
+    return result?.rollups || {};
+  }
+
+  async getAggregates(
+    entryId: string,
+    recordType: string,
+    options?: AggregateOptions
+  ): Promise<Aggregates> {
+    await this.ensurePetDataCache();
+    const petId = this.getPetIdFromEntryId(entryId);
+
+    if (!petId) {
+      console.warn('No pet_id found for entry_id:', entryId);
+      return { bucket: options?.bucket ?? 'day', buckets: {} };
+    }
+
+    return await this.hass.callWS<Aggregates>({
+      type: 'pet_health/get_aggregates',
+      pet_id: petId,
+      record_type: recordType,
+      ...options,
+    });
+  }
+
+  async getUnconfirmedVisits(
+    entryId?: string,
+    offset = 0,
+    limit = 50,
+  ): Promise<UnconfirmedVisitsPage> {
+    let petId: string | undefined;
+    if (entryId) {
+      await this.ensurePetDataCache();
+      petId = this.getPetIdFromEntryId(entryId);
+      if (!petId) {
+        console.warn('No pet_id found for entry_id:', entryId);
+        return { visits: [], total: 0, offset, has_more: false };
+      }
+    }
+
+    return await this.hass.callWS<UnconfirmedVisitsPage>({
+      type: 'pet_health/get_unconfirmed_visits',
+      pet_id: petId,
+      offset,
+      limit,
+    });
+  }
+
   async logBathroomVisit(data: LogBathroomVisitData): Promise<void> {
     await this.hass.callService('pet_health', 'log_bathroom_visit', data);
   }
@@ -290,4 +381,19 @@ export class PetHealthAPI {
   subscribeToDataUpdates(callback: () => void): Promise<() => void> {
     return this.hass.connection.subscribeEvents(callback, 'pet_health_data_updated');
   }
+
+  async subscribeToChanges(
+    callback: (changes: ChangeEvent) => void,
+    entryId?: string,
+    recordTypes?: string[],
+  ): Promise<() => void> {
+    await this.ensurePetDataCache();
+    const petId = entryId ? this.getPetIdFromEntryId(entryId) : undefined;
+
+    return this.hass.connection.subscribeMessage<ChangeEvent>(callback, {
+      type: 'pet_health/subscribe',
+      pet_id: petId,
+      record_types: recordTypes,
+    });
+  }
 }
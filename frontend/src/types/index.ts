@@ -4,6 +4,10 @@ export interface HomeAssistant {
   callService: (domain: string, service: string, data?: Record<string, unknown>) => Promise<void>;
   connection: {
     subscribeEvents: (callback: (event: unknown) => void, eventType: string) => Promise<() => void>;
+    subscribeMessage: <T = unknown>(
+      callback: (message: T) => void,
+      params: Record<string, unknown>,
+    ) => Promise<() => void>;
   };
   states: Record<string, unknown>;
 }
@@ -19,6 +23,8 @@ export interface PetEntry {
   pet_image_path?: string;
   medications?: Medication[];
   generic_log_categories?: Category[];
+  // Sensor state writes skipped because nothing changed, null until loaded
+  suppressed_writes?: number | null;
 }
 
 export interface Category {
@@ -64,6 +70,7 @@ export interface Medication {
 export interface MedicationLog {
   timestamp: string;
   pet_id?: string;
+  medication_id?: string;  // Missing on doses logged before IDs were stored
   medication_name: string;  // API returns this field name
   dosage?: string;
   unit?: string;
@@ -174,6 +181,86 @@ export interface KetoneRecord {
   notes?: string;
 }
 
+// Daily summary of records compacted by the retention setting. Boolean
+// fields hold counts, other fields a histogram of their values.
+export interface DailyRollup {
+  count: number;
+  min?: number;
+  mean?: number;
+  max?: number;
+  [field: string]: number | Record<string, number> | undefined;
+}
+
+// Rollups per record type, keyed by local date (YYYY-MM-DD)
+export type DailyRollups = Record<string, Record<string, DailyRollup>>;
+
+export type AggregateBucket = 'hour' | 'day' | 'week' | 'month';
+
+// A pet's records of one type per bucket: the range (end exclusive, at local
+// midnight unless bucket is 'hour'), the bucket size and the metrics to
+// return (rollup fields, or 'value' for min/mean/max)
+export interface AggregateOptions {
+  bucket?: AggregateBucket;
+  start_time?: string;
+  end_time?: string;
+  metrics?: string[];
+}
+
+// Aggregates keyed by the local start time of each bucket, oldest first
+export interface Aggregates {
+  bucket: AggregateBucket;
+  buckets: Record<string, DailyRollup>;
+}
+
+// Reads records newest first: start_time/end_time bound the range, limit the
+// page size, and before (exclusive) is the next_before of the previous page
+export interface PageOptions {
+  start_time?: string;
+  end_time?: string;
+  before?: string;
+  limit?: number;
+}
+
+// Selects the record types of a store dump and the fields of each record,
+// the timestamp is always returned
+export interface DumpOptions extends PageOptions {
+  types?: string[];
+  fields?: string[];
+}
+
+export interface VisitsPage {
+  visits: Visit[];
+  next_before: string | null;
+}
+
+// A record changed after a pet_health/get_changes_since cursor
+export interface RecordChange {
+  record_type: string;
+  pet_id: string;
+  record: Record<string, unknown>;
+}
+
+// Apply deleted first: a record moved to another pet is deleted and inserted.
+// With reset the changes are unknown and the store dump must be reloaded.
+export interface ChangeSet {
+  cursor: string;
+  reset: boolean;
+  deleted: RecordChange[];
+  inserted: RecordChange[];
+  updated: RecordChange[];
+}
+
+// Records pushed by pet_health/subscribe as they change
+export type ChangeEvent = Omit<ChangeSet, 'reset'>;
+
+// One page of the unconfirmed visit queue, oldest first
+export interface UnconfirmedVisitsPage {
+  visits: Visit[];
+  total: number;
+  offset: number;
+  has_more: boolean;
+}
+
 export interface StoreData {
   visits?: Visit[];
   medications?: Record<string, MedicationLog[]>;
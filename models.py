@@ -2,9 +2,22 @@
 
 from __future__ import annotations
 
+from collections.abc import Container
+from dataclasses import MISSING, dataclass, field, fields
+from datetime import UTC, datetime
+from enum import Enum
+from sys import intern
+from types import NoneType, UnionType
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    ClassVar,
+    Self,
+    get_args,
+    get_origin,
+    get_type_hints,
+)
 import uuid
-from dataclasses import dataclass, field
-from datetime import datetime
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.helpers.device_registry import DeviceInfo
@@ -24,6 +37,9 @@ from .const import (
     WellbeingScore,
 )
 
+if TYPE_CHECKING:
+    from .coordinator import PetHealthCoordinator
+
 
 @dataclass
 class PetData:
@@ -32,6 +48,10 @@ class PetData:
     pet_id: str
     name: str
     pet_type: PetType
+    # Set when the config entry is set up
+    coordinator: PetHealthCoordinator | None = field(
+        default=None, repr=False, compare=False
+    )
 
     def device_info(self) -> DeviceInfo:
         """Return device info for this pet."""
@@ -43,8 +63,130 @@ class PetData:
         )
 
 
-@dataclass
-class BathroomVisit:
+_TIMESTAMP = "timestamp"
+_ENUM = "enum"
+_ENUM_LIST = "enum_list"
+
+_StorageField = tuple[str, str | None, list[Enum], bool]
+
+# Per record class: name, encoding, enum members and whether it is required
+_STORAGE_FIELDS: dict[type, list[_StorageField]] = {}
+
+
+def _enum_members(hint: Any) -> list[Enum] | None:
+    """Return the members if the type hint is an enum."""
+    if isinstance(hint, type) and issubclass(hint, Enum):
+        return list(hint)
+    return None
+
+
+def _storage_fields(cls: type) -> list[_StorageField]:
+    """Return how each field of a record class is encoded in storage."""
+    if (storage_fields := _STORAGE_FIELDS.get(cls)) is not None:
+        return storage_fields
+
+    hints = get_type_hints(cls)
+    storage_fields = []
+    for record_field in fields(cls):
+        hint = hints[record_field.name]
+        if isinstance(hint, UnionType):
+            hint = next(arg for arg in get_args(hint) if arg is not NoneType)
+        required = (
+            record_field.default is MISSING
+            and record_field.default_factory is MISSING
+        )
+        kind: str | None = None
+        members: list[Enum] = []
+        if hint is datetime:
+            kind = _TIMESTAMP
+        elif (enum_members := _enum_members(hint)) is not None:
+            kind, members = _ENUM, enum_members
+        elif get_origin(hint) is list and (
+            enum_members := _enum_members(get_args(hint)[0])
+        ) is not None:
+            kind, members = _ENUM_LIST, enum_members
+        storage_fields.append((record_field.name, kind, members, required))
+    _STORAGE_FIELDS[cls] = storage_fields
+    return storage_fields
+
+
+class _StoredRecord:
+    """Compact storage encoding shared by all record models.
+
+    Storage version 2 writes timestamps as UTC epoch milliseconds and enums
+    as their position in the enum, and leaves out null fields. Enum members
+    must therefore only ever be appended, never reordered or removed.
+    """
+
+    __slots__ = ()
+
+    # Fields besides the pet_id whose strings repeat between records
+    _interned_fields: ClassVar[tuple[str, ...]] = ()
+
+    def __post_init__(self) -> None:
+        """Share repeated strings between records."""
+        for name in ("pet_id", *self._interned_fields):
+            if (value := getattr(self, name)) is not None:
+                setattr(self, name, intern(value))
+
+    def to_storage_dict(self, *, with_pet_id: bool = False) -> dict[str, Any]:
+        """Convert to the compact storage format.
+
+        The pet_id is only included on request, shards and segments imply it.
+        """
+        data: dict[str, Any] = {}
+        for name, kind, members, _required in _storage_fields(type(self)):
+            value = getattr(self, name)
+            if value is None or (name == "pet_id" and not with_pet_id):
+                continue
+            if kind is _TIMESTAMP:
+                value = round(value.timestamp() * 1000)
+            elif kind is _ENUM:
+                value = members.index(value)
+            elif kind is _ENUM_LIST:
+                value = [members.index(item) for item in value]
+            data[name] = value
+        return data
+
+    @classmethod
+    def from_storage_dict(cls, data: dict[str, Any], pet_id: str | None = None) -> Self:
+        """Create from the compact storage format."""
+        values: dict[str, Any] = {}
+        for name, kind, members, required in _storage_fields(cls):
+            if (value := data.get(name)) is None:
+                # Null fields are left out, restore them as the model would
+                if required:
+                    values[name] = None
+                continue
+            if kind is _TIMESTAMP:
+                value = datetime.fromtimestamp(value / 1000, UTC)
+            elif kind is _ENUM:
+                value = members[value]
+            elif kind is _ENUM_LIST:
+                value = [members[item] for item in value]
+            values[name] = value
+        if pet_id is not None:
+            values["pet_id"] = pet_id
+        return cls(**values)
+
+    def to_partial_dict(self, names: Container[str]) -> dict[str, Any]:
+        """Convert only the named fields, in the format of to_dict.
+
+        Names the record type doesn't have are left out.
+        """
+        data: dict[str, Any] = {}
+        for name, kind, _members, _required in _storage_fields(type(self)):
+            if name not in names:
+                continue
+            value = getattr(self, name)
+            if kind is _TIMESTAMP and value is not None:
+                value = value.isoformat()
+            data[name] = value
+        return data
+
+
+@dataclass(slots=True)
+class BathroomVisit(_StoredRecord):
     """Data model for a bathroom visit."""
 
     timestamp: datetime
@@ -107,8 +249,8 @@ class BathroomVisit:
         )
 
 
-@dataclass
-class MedicationRecord:
+@dataclass(slots=True)
+class MedicationRecord(_StoredRecord):
     """Data model for a medication record."""
 
     timestamp: datetime
@@ -118,6 +260,10 @@ class MedicationRecord:
     unit: str | None = None
     reason: str | None = None
     notes: str | None = None
+    # ID of the configured medication, missing on doses logged before it
+    medication_id: str | None = None
+
+    _interned_fields = ("medication_name", "medication_id", "dosage", "unit")
 
     def to_dict(self) -> dict:
         """Convert to dictionary for storage."""
@@ -129,6 +275,7 @@ class MedicationRecord:
             "unit": self.unit,
             "reason": self.reason,
             "notes": self.notes,
+            "medication_id": self.medication_id,
         }
 
     @staticmethod
@@ -142,11 +289,12 @@ class MedicationRecord:
             unit=data.get("unit"),
             reason=data.get("reason"),
             notes=data.get("notes"),
+            medication_id=data.get("medication_id"),
         )
 
 
-@dataclass
-class DrinkRecord:
+@dataclass(slots=True)
+class DrinkRecord(_StoredRecord):
     """Data model for a drinking record."""
 
     timestamp: datetime
@@ -174,8 +322,8 @@ class DrinkRecord:
         )
 
 
-@dataclass
-class MealRecord:
+@dataclass(slots=True)
+class MealRecord(_StoredRecord):
     """Data model for an eating record."""
 
     timestamp: datetime
@@ -206,8 +354,8 @@ class MealRecord:
         )
 
 
-@dataclass
-class ThirstLevelRecord:
+@dataclass(slots=True)
+class ThirstLevelRecord(_StoredRecord):
     """Data model for a thirst level assessment."""
 
     timestamp: datetime
@@ -235,8 +383,8 @@ class ThirstLevelRecord:
         )
 
 
-@dataclass
-class AppetiteLevelRecord:
+@dataclass(slots=True)
+class AppetiteLevelRecord(_StoredRecord):
     """Data model for an appetite level assessment."""
 
     timestamp: datetime
@@ -264,8 +412,8 @@ class AppetiteLevelRecord:
         )
 
 
-@dataclass
-class WellbeingRecord:
+@dataclass(slots=True)
+class WellbeingRecord(_StoredRecord):
     """Data model for a wellbeing assessment."""
 
     timestamp: datetime
@@ -296,8 +444,8 @@ class WellbeingRecord:
         )
 
 
-@dataclass
-class WeightRecord:
+@dataclass(slots=True)
+class WeightRecord(_StoredRecord):
     """Data model for a weight measurement."""
 
     timestamp: datetime
@@ -325,8 +473,8 @@ class WeightRecord:
         )
 
 
-@dataclass
-class VomitRecord:
+@dataclass(slots=True)
+class VomitRecord(_StoredRecord):
     """Data model for a vomiting incident."""
 
     timestamp: datetime
@@ -354,8 +502,8 @@ class VomitRecord:
         )
 
 
-@dataclass
-class GenericLog:
+@dataclass(slots=True)
+class GenericLog(_StoredRecord):
     """Data model for a generic log entry."""
 
     timestamp: datetime
@@ -364,6 +512,8 @@ class GenericLog:
     notes: str
     log_id: str = field(default_factory=lambda: str(uuid.uuid4()))
 
+    _interned_fields = ("category",)
+
     def to_dict(self) -> dict:
         """Convert to dictionary for storage."""
         return {
@@ -386,8 +536,8 @@ class GenericLog:
         )
 
 
-@dataclass
-class BloodGlucoseRecord:
+@dataclass(slots=True)
+class BloodGlucoseRecord(_StoredRecord):
     """Data model for a blood glucose measurement."""
 
     timestamp: datetime
@@ -423,8 +573,8 @@ class BloodGlucoseRecord:
         )
 
 
-@dataclass
-class GlycatedHemoglobinRecord:
+@dataclass(slots=True)
+class GlycatedHemoglobinRecord(_StoredRecord):
     """Data model for a glycated hemoglobin (HbA1c / långtidssocker) measurement."""
 
     timestamp: datetime
@@ -457,8 +607,8 @@ class GlycatedHemoglobinRecord:
         )
 
 
-@dataclass
-class KetoneRecord:
+@dataclass(slots=True)
+class KetoneRecord(_StoredRecord):
     """Data model for a ketone measurement."""
 
     timestamp: datetime
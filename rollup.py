@@ -0,0 +1,111 @@
+"""Daily rollups of records that are past their retention."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable, Mapping
+from datetime import datetime, timedelta
+from typing import Any
+
+from homeassistant.util import dt as dt_util
+
+# Sizes of the buckets records are aggregated into
+BUCKETS = ("hour", "day", "week", "month")
+
+
+def rollup_day(timestamp: datetime) -> str:
+    """Return the local date (YYYY-MM-DD) a timestamp is rolled up into."""
+    return dt_util.as_local(timestamp).date().isoformat()
+
+
+def bucket_start(timestamp: datetime, bucket: str) -> datetime:
+    """Return the local start of the hour, day, week or month of a timestamp.
+
+    Weeks start on Monday.
+    """
+    local = dt_util.as_local(timestamp)
+    if bucket == "hour":
+        return local.replace(minute=0, second=0, microsecond=0)
+    day = local.date()
+    if bucket == "week":
+        day -= timedelta(days=day.weekday())
+    elif bucket == "month":
+        day = day.replace(day=1)
+    return dt_util.start_of_local_day(day)
+
+
+def add_to_rollups(
+    rollups: dict[str, dict[str, Any]],
+    records: Iterable[Any],
+    fields: Iterable[str],
+    value_attr: str | None = None,
+    key: Callable[[datetime], str] = rollup_day,
+) -> None:
+    """Fold records into their daily rollups, or the rollups key puts them in.
+
+    Every day counts its records. Boolean fields count the records where
+    they are set, other fields become a histogram of their values, list
+    fields counting each item. The value_attr gets its min, mean and max.
+    """
+    fields = tuple(fields)
+    for record in records:
+        day = rollups.setdefault(key(record.timestamp), {"count": 0})
+        day["count"] += 1
+        for name in fields:
+            value = getattr(record, name)
+            if isinstance(value, bool):
+                day[name] = day.get(name, 0) + value
+                continue
+            if not value:
+                continue
+            histogram: dict[str, int] = day.setdefault(name, {})
+            for item in value if isinstance(value, list) else (value,):
+                histogram[str(item)] = histogram.get(str(item), 0) + 1
+
+        if value_attr is None:
+            continue
+        value = getattr(record, value_attr)
+        if "mean" not in day:
+            day["min"] = day["max"] = day["mean"] = value
+            continue
+        day["min"] = min(day["min"], value)
+        day["max"] = max(day["max"], value)
+        # The measurement is required, so every counted record has a value
+        day["mean"] += (value - day["mean"]) / day["count"]
+
+
+def merge_rollups(
+    rollups: dict[str, dict[str, Any]],
+    days: Mapping[str, dict[str, Any]],
+    fields: Iterable[str],
+    value: bool,
+    key: Callable[[str], str],
+) -> None:
+    """Fold daily rollups into the rollups key puts each day in.
+
+    Only the fields, and with value the min, mean and max, are kept.
+    """
+    fields = tuple(fields)
+    for day, rollup in days.items():
+        target = rollups.setdefault(key(day), {"count": 0})
+        count = target["count"] + rollup["count"]
+        if value and "mean" in rollup:
+            if "mean" not in target:
+                target["min"] = rollup["min"]
+                target["max"] = rollup["max"]
+                target["mean"] = rollup["mean"]
+            else:
+                target["min"] = min(target["min"], rollup["min"])
+                target["max"] = max(target["max"], rollup["max"])
+                target["mean"] += (
+                    (rollup["mean"] - target["mean"]) * rollup["count"] / count
+                )
+        target["count"] = count
+        for name in fields:
+            if name not in rollup:
+                continue
+            if not isinstance(rollup[name], dict):
+                target[name] = target.get(name, 0) + rollup[name]
+                continue
+            histogram: dict[str, int] = target.setdefault(name, {})
+            for item, item_count in rollup[name].items():
+                histogram[item] = histogram.get(item, 0) + item_count
@@ -2,8 +2,6 @@
 
 from __future__ import annotations
 
-from datetime import datetime, timedelta
-
 from homeassistant.components.sensor import (
     SensorDeviceClass,
     SensorEntity,
@@ -11,12 +9,25 @@ from homeassistant.components.sensor import (
 )
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.util import dt as dt_util
 
 from .const import CONF_MEDICATIONS, DOMAIN
-from .models import BathroomVisit, MedicationRecord, PetHealthConfigEntry
-from .store import PetHealthStore
+from .coordinator import WEEK, PetHealthCoordinator, PetSummary
+from .models import PetHealthConfigEntry
+
+# Unconfirmed visits listed in the attributes, the full queue is served by
+# the pet_health/get_unconfirmed_visits WebSocket command
+MAX_ATTRIBUTE_VISITS = 10
+# Characters of free text, like notes, kept in the attributes
+MAX_ATTRIBUTE_TEXT = 255
+
+
+def _truncate(text: str | None) -> str | None:
+    """Cap free text shown in the state attributes."""
+    if text is None or len(text) <= MAX_ATTRIBUTE_TEXT:
+        return text
+    return text[: MAX_ATTRIBUTE_TEXT - 1] + "…"
 
 
 async def async_setup_entry(
@@ -25,37 +36,38 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up Pet Health sensors."""
-    store: PetHealthStore = hass.data[DOMAIN]["store"]
     pet_data = entry.runtime_data
+    # All sensors of the pet share one summary
+    coordinator = pet_data.coordinator
 
     sensors: list[SensorEntity] = [
-        LastVisitTimestampSensor(entry, store, pet_data.pet_id),
-        DailyVisitCountSensor(entry, store, pet_data.pet_id),
-        WeeklyVisitCountSensor(entry, store, pet_data.pet_id),
-        HoursSinceLastVisitSensor(entry, store, pet_data.pet_id),
-        LastPoopConsistencySensor(entry, store, pet_data.pet_id),
-        LastPoopColorSensor(entry, store, pet_data.pet_id),
-        LastUrineAmountSensor(entry, store, pet_data.pet_id),
-        DailyPeeCountSensor(entry, store, pet_data.pet_id),
-        DailyPoopCountSensor(entry, store, pet_data.pet_id),
-        UnconfirmedVisitsCountSensor(entry, store, pet_data.pet_id),
+        LastVisitTimestampSensor(entry, coordinator, pet_data.pet_id),
+        DailyVisitCountSensor(entry, coordinator, pet_data.pet_id),
+        WeeklyVisitCountSensor(entry, coordinator, pet_data.pet_id),
+        HoursSinceLastVisitSensor(entry, coordinator, pet_data.pet_id),
+        LastPoopConsistencySensor(entry, coordinator, pet_data.pet_id),
+        LastPoopColorSensor(entry, coordinator, pet_data.pet_id),
+        LastUrineAmountSensor(entry, coordinator, pet_data.pet_id),
+        DailyPeeCountSensor(entry, coordinator, pet_data.pet_id),
+        DailyPoopCountSensor(entry, coordinator, pet_data.pet_id),
+        UnconfirmedVisitsCountSensor(entry, coordinator, pet_data.pet_id),
         # Drink sensors (consumption)
-        LastDrinkTimestampSensor(entry, store, pet_data.pet_id),
-        DailyDrinkCountSensor(entry, store, pet_data.pet_id),
-        LastDrinkAmountSensor(entry, store, pet_data.pet_id),
+        LastDrinkTimestampSensor(entry, coordinator, pet_data.pet_id),
+        DailyDrinkCountSensor(entry, coordinator, pet_data.pet_id),
+        LastDrinkAmountSensor(entry, coordinator, pet_data.pet_id),
         # Meal sensors (consumption)
-        LastMealTimestampSensor(entry, store, pet_data.pet_id),
-        DailyMealCountSensor(entry, store, pet_data.pet_id),
-        LastMealAmountSensor(entry, store, pet_data.pet_id),
+        LastMealTimestampSensor(entry, coordinator, pet_data.pet_id),
+        DailyMealCountSensor(entry, coordinator, pet_data.pet_id),
+        LastMealAmountSensor(entry, coordinator, pet_data.pet_id),
         # Thirst level sensors (symptoms/state)
-        LastThirstLevelTimestampSensor(entry, store, pet_data.pet_id),
-        CurrentThirstLevelSensor(entry, store, pet_data.pet_id),
+        LastThirstLevelTimestampSensor(entry, coordinator, pet_data.pet_id),
+        CurrentThirstLevelSensor(entry, coordinator, pet_data.pet_id),
         # Appetite level sensors (symptoms/state)
-        LastAppetiteLevelTimestampSensor(entry, store, pet_data.pet_id),
-        CurrentAppetiteLevelSensor(entry, store, pet_data.pet_id),
+        LastAppetiteLevelTimestampSensor(entry, coordinator, pet_data.pet_id),
+        CurrentAppetiteLevelSensor(entry, coordinator, pet_data.pet_id),
         # Wellbeing sensors
-        LastWellbeingAssessmentSensor(entry, store, pet_data.pet_id),
-        CurrentWellbeingScoreSensor(entry, store, pet_data.pet_id),
+        LastWellbeingAssessmentSensor(entry, coordinator, pet_data.pet_id),
+        CurrentWellbeingScoreSensor(entry, coordinator, pet_data.pet_id),
     ]
 
     # Add medication sensors for each configured medication
@@ -66,10 +78,10 @@ async def async_setup_entry(
         sensors.extend(
             [
                 LastMedicationDoseSensor(
-                    entry, store, pet_data.pet_id, med_id, med_name
+                    entry, coordinator, pet_data.pet_id, med_id, med_name
                 ),
                 DailyMedicationCountSensor(
-                    entry, store, pet_data.pet_id, med_id, med_name
+                    entry, coordinator, pet_data.pet_id, med_id, med_name
                 ),
             ]
         )
@@ -77,22 +89,27 @@ async def async_setup_entry(
     async_add_entities(sensors)
 
 
-class PetHealthSensorBase(SensorEntity):
+class PetHealthSensorBase(CoordinatorEntity[PetHealthCoordinator], SensorEntity):
     """Base class for Pet Health sensors."""
 
     _attr_has_entity_name = True
-    _attr_should_poll = False
+    # Bulky attributes are not written to the recorder database
+    _unrecorded_attributes = frozenset(
+        {"notes", "symptoms", "consistencies", "unconfirmed_visits"}
+    )
 
     def __init__(
-        self, entry: PetHealthConfigEntry, store: PetHealthStore, pet_id: str
+        self,
+        entry: PetHealthConfigEntry,
+        coordinator: PetHealthCoordinator,
+        pet_id: str,
     ) -> None:
         """Initialize the sensor."""
+        super().__init__(coordinator)
         self._entry = entry
-        self._store = store
         self._pet_id = pet_id
         self._pet_data = entry.runtime_data
         self._attr_device_info = self._pet_data.device_info()
-        self._remove_update_tracker = None
         # Common attributes for all pet health sensors
         self._attr_extra_state_attributes = {
             "pet": self._pet_data.name,
@@ -100,72 +117,33 @@ class PetHealthSensorBase(SensorEntity):
         }
 
     async def async_added_to_hass(self) -> None:
-        """Register callbacks when entity is added."""
-        # Update every minute to refresh time-based sensors
-        self._remove_update_tracker = async_track_time_interval(
-            self.hass, self._async_update, timedelta(minutes=1)
-        )
-        # Listen for storage updates
-        self._store.register_update_callback(self._pet_id, self._async_update)
-        # Initial update
-        self._update_from_store()
-
-    async def async_will_remove_from_hass(self) -> None:
-        """Clean up when entity is removed."""
-        if self._remove_update_tracker:
-            self._remove_update_tracker()
-        self._store.unregister_update_callback(self._pet_id, self._async_update)
+        """Show the current summary when the entity is added."""
+        await super().async_added_to_hass()
+        self._update_from_summary(self.coordinator.data)
 
     @callback
-    def _async_update(self, _=None) -> None:
-        """Update the sensor."""
-        self._update_from_store()
+    def _handle_coordinator_update(self) -> None:
+        """Update the sensor from a new summary, writing only changed states.
+
+        Sensors build new attribute dicts, with copies of any lists, so the
+        previous ones still hold the values that were written.
+        """
+        previous = (
+            self._attr_native_value,
+            self._attr_extra_state_attributes or {},
+        )
+        self._update_from_summary(self.coordinator.data)
+        if previous == (
+            self._attr_native_value,
+            self._attr_extra_state_attributes or {},
+        ):
+            self.coordinator.suppressed_writes += 1
+            return
         self.async_write_ha_state()
 
-    def _update_from_store(self) -> None:
-        """Update sensor value from store."""
+    def _update_from_summary(self, summary: PetSummary) -> None:
+        """Update sensor value from the pet's summary."""
         # Override in subclasses
-        pass
-
-    def _get_visits(self) -> list[BathroomVisit]:
-        """Get all visits for this pet."""
-        return self._store.get_visits(self._pet_id)
-
-    def _get_visits_since(self, since: datetime) -> list[BathroomVisit]:
-        """Get visits since a given time."""
-        visits = self._get_visits()
-        # Ensure both timestamps are timezone-aware for comparison
-        since_aware = dt_util.as_utc(since) if since.tzinfo is None else since
-        return [
-            v
-            for v in visits
-            if (
-                dt_util.as_utc(v.timestamp)
-                if v.timestamp.tzinfo is None
-                else v.timestamp
-            )
-            >= since_aware
-        ]
-
-    def _get_medications(self) -> list[MedicationRecord]:
-        """Get all medication records for this pet."""
-        return self._store.get_medications(self._pet_id)
-
-    def _get_medications_since(self, since: datetime) -> list[MedicationRecord]:
-        """Get medication records since a given time."""
-        medications = self._get_medications()
-        # Ensure both timestamps are timezone-aware for comparison
-        since_aware = dt_util.as_utc(since) if since.tzinfo is None else since
-        return [
-            m
-            for m in medications
-            if (
-                dt_util.as_utc(m.timestamp)
-                if m.timestamp.tzinfo is None
-                else m.timestamp
-            )
-            >= since_aware
-        ]
 
 
 class LastVisitTimestampSensor(PetHealthSensorBase):
@@ -173,19 +151,23 @@ class LastVisitTimestampSensor(PetHealthSensorBase):
 
     _attr_translation_key = "last_bathroom_visit"
     _attr_device_class = SensorDeviceClass.TIMESTAMP
+    _unrecorded_attributes = PetHealthSensorBase._unrecorded_attributes | {
+        "poop_consistencies"
+    }
 
     def __init__(
-        self, entry: PetHealthConfigEntry, store: PetHealthStore, pet_id: str
+        self,
+        entry: PetHealthConfigEntry,
+        coordinator: PetHealthCoordinator,
+        pet_id: str,
     ) -> None:
         """Initialize the sensor."""
-        super().__init__(entry, store, pet_id)
+        super().__init__(entry, coordinator, pet_id)
         self._attr_unique_id = f"{pet_id}_last_bathroom_visit"
 
-    def _update_from_store(self) -> None:
+    def _update_from_summary(self, summary: PetSummary) -> None:
         """Update the sensor value."""
-        visits = self._get_visits()
-        if visits:
-            last_visit = visits[-1]
+        if (last_visit := summary.last_visit) is not None:
             # Ensure timestamp is timezone-aware
             timestamp = last_visit.timestamp
             if timestamp.tzinfo is None:
@@ -198,10 +180,10 @@ class LastVisitTimestampSensor(PetHealthSensorBase):
                 "confirmed": last_visit.confirmed,
                 "did_pee": last_visit.did_pee,
                 "did_poop": last_visit.did_poop,
-                "poop_consistencies": last_visit.poop_consistencies,
+                "poop_consistencies": list(last_visit.poop_consistencies),
                 "poop_color": last_visit.poop_color,
                 "urine_amount": last_visit.urine_amount,
-                "notes": last_visit.notes,
+                "notes": _truncate(last_visit.notes),
             }
         else:
             self._attr_native_value = None
@@ -221,18 +203,18 @@ class DailyVisitCountSensor(PetHealthSensorBase):
     _attr_icon = "mdi:counter"
 
     def __init__(
-        self, entry: PetHealthConfigEntry, store: PetHealthStore, pet_id: str
+        self,
+        entry: PetHealthConfigEntry,
+        coordinator: PetHealthCoordinator,
+        pet_id: str,
     ) -> None:
         """Initialize the sensor."""
-        super().__init__(entry, store, pet_id)
+        super().__init__(entry, coordinator, pet_id)
         self._attr_unique_id = f"{pet_id}_daily_visit_count"
 
-    def _update_from_store(self) -> None:
+    def _update_from_summary(self, summary: PetSummary) -> None:
         """Update the sensor value."""
-        now = dt_util.now()
-        today_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
-        visits_today = self._get_visits_since(today_start)
-        self._attr_native_value = len(visits_today)
+        self._attr_native_value = summary.visits_today
 
 
 class WeeklyVisitCountSensor(PetHealthSensorBase):
@@ -244,18 +226,18 @@ class WeeklyVisitCountSensor(PetHealthSensorBase):
     _attr_icon = "mdi:calendar-week"
 
     def __init__(
-        self, entry: PetHealthConfigEntry, store: PetHealthStore, pet_id: str
+        self,
+        entry: PetHealthConfigEntry,
+        coordinator: PetHealthCoordinator,
+        pet_id: str,
     ) -> None:
         """Initialize the sensor."""
-        super().__init__(entry, store, pet_id)
+        super().__init__(entry, coordinator, pet_id)
         self._attr_unique_id = f"{pet_id}_weekly_visit_count"
 
-    def _update_from_store(self) -> None:
+    def _update_from_summary(self, summary: PetSummary) -> None:
         """Update the sensor value."""
-        now = dt_util.now()
-        week_start = now - timedelta(days=7)
-        visits_this_week = self._get_visits_since(week_start)
-        self._attr_native_value = len(visits_this_week)
+        self._attr_native_value = summary.visits_last_7_days
 
 
 class HoursSinceLastVisitSensor(PetHealthSensorBase):
@@ -268,17 +250,18 @@ class HoursSinceLastVisitSensor(PetHealthSensorBase):
     _attr_suggested_display_precision = 1
 
     def __init__(
-        self, entry: PetHealthConfigEntry, store: PetHealthStore, pet_id: str
+        self,
+        entry: PetHealthConfigEntry,
+        coordinator: PetHealthCoordinator,
+        pet_id: str,
     ) -> None:
         """Initialize the sensor."""
-        super().__init__(entry, store, pet_id)
+        super().__init__(entry, coordinator, pet_id)
         self._attr_unique_id = f"{pet_id}_hours_since_last_visit"
 
-    def _update_from_store(self) -> None:
+    def _update_from_summary(self, summary: PetSummary) -> None:
         """Update the sensor value."""
-        visits = self._get_visits()
-        if visits:
-            last_visit = visits[-1]
+        if (last_visit := summary.last_visit) is not None:
             # Ensure both timestamps are timezone-aware
             last_timestamp = (
                 dt_util.as_utc(last_visit.timestamp)
@@ -298,26 +281,27 @@ class LastPoopConsistencySensor(PetHealthSensorBase):
     _attr_icon = "mdi:texture"
 
     def __init__(
-        self, entry: PetHealthConfigEntry, store: PetHealthStore, pet_id: str
+        self,
+        entry: PetHealthConfigEntry,
+        coordinator: PetHealthCoordinator,
+        pet_id: str,
     ) -> None:
         """Initialize the sensor."""
-        super().__init__(entry, store, pet_id)
+        super().__init__(entry, coordinator, pet_id)
         self._attr_unique_id = f"{pet_id}_last_poop_consistency"
 
-    def _update_from_store(self) -> None:
+    def _update_from_summary(self, summary: PetSummary) -> None:
         """Update the sensor value."""
-        visits = self._get_visits()
-        # Find most recent visit with poop
-        for visit in reversed(visits):
-            if visit.poop_consistencies:
-                # Join multiple consistencies with arrow to show progression
-                # Order matters: enter them chronologically (e.g., normal, then diarrhea)
-                self._attr_native_value = " → ".join(visit.poop_consistencies)
-                self._attr_extra_state_attributes = {
-                    "consistencies": visit.poop_consistencies,
-                    "visit_timestamp": visit.timestamp.isoformat(),
-                }
-                return
+        # Most recent visit with poop
+        if (visit := summary.last_poop_consistency_visit) is not None:
+            # Join multiple consistencies with arrow to show progression
+            # Order matters: enter them chronologically (e.g., normal, then diarrhea)
+            self._attr_native_value = " → ".join(visit.poop_consistencies)
+            self._attr_extra_state_attributes = {
+                "consistencies": list(visit.poop_consistencies),
+                "visit_timestamp": visit.timestamp.isoformat(),
+            }
+            return
         self._attr_native_value = None
         self._attr_extra_state_attributes = {}
 
@@ -329,23 +313,24 @@ class LastPoopColorSensor(PetHealthSensorBase):
     _attr_icon = "mdi:palette"
 
     def __init__(
-        self, entry: PetHealthConfigEntry, store: PetHealthStore, pet_id: str
+        self,
+        entry: PetHealthConfigEntry,
+        coordinator: PetHealthCoordinator,
+        pet_id: str,
     ) -> None:
         """Initialize the sensor."""
-        super().__init__(entry, store, pet_id)
+        super().__init__(entry, coordinator, pet_id)
         self._attr_unique_id = f"{pet_id}_last_poop_color"
 
-    def _update_from_store(self) -> None:
+    def _update_from_summary(self, summary: PetSummary) -> None:
         """Update the sensor value."""
-        visits = self._get_visits()
-        # Find most recent visit with poop color
-        for visit in reversed(visits):
-            if visit.poop_color:
-                self._attr_native_value = visit.poop_color
-                self._attr_extra_state_attributes = {
-                    "visit_timestamp": visit.timestamp.isoformat()
-                }
-                return
+        # Most recent visit with poop color
+        if (visit := summary.last_poop_color_visit) is not None:
+            self._attr_native_value = visit.poop_color
+            self._attr_extra_state_attributes = {
+                "visit_timestamp": visit.timestamp.isoformat()
+            }
+            return
         self._attr_native_value = None
         self._attr_extra_state_attributes = {}
 
@@ -357,23 +342,24 @@ class LastUrineAmountSensor(PetHealthSensorBase):
     _attr_icon = "mdi:water"
 
     def __init__(
-        self, entry: PetHealthConfigEntry, store: PetHealthStore, pet_id: str
+        self,
+        entry: PetHealthConfigEntry,
+        coordinator: PetHealthCoordinator,
+        pet_id: str,
     ) -> None:
         """Initialize the sensor."""
-        super().__init__(entry, store, pet_id)
+        super().__init__(entry, coordinator, pet_id)
         self._attr_unique_id = f"{pet_id}_last_urine_amount"
 
-    def _update_from_store(self) -> None:
+    def _update_from_summary(self, summary: PetSummary) -> None:
         """Update the sensor value."""
-        visits = self._get_visits()
-        # Find most recent visit with urine amount
-        for visit in reversed(visits):
-            if visit.urine_amount:
-                self._attr_native_value = visit.urine_amount
-                self._attr_extra_state_attributes = {
-                    "visit_timestamp": visit.timestamp.isoformat()
-                }
-                return
+        # Most recent visit with urine amount
+        if (visit := summary.last_urine_amount_visit) is not None:
+            self._attr_native_value = visit.urine_amount
+            self._attr_extra_state_attributes = {
+                "visit_timestamp": visit.timestamp.isoformat()
+            }
+            return
         self._attr_native_value = None
         self._attr_extra_state_attributes = {}
 
@@ -387,19 +373,18 @@ class DailyPeeCountSensor(PetHealthSensorBase):
     _attr_icon = "mdi:water"
 
     def __init__(
-        self, entry: PetHealthConfigEntry, store: PetHealthStore, pet_id: str
+        self,
+        entry: PetHealthConfigEntry,
+        coordinator: PetHealthCoordinator,
+        pet_id: str,
     ) -> None:
         """Initialize the sensor."""
-        super().__init__(entry, store, pet_id)
+        super().__init__(entry, coordinator, pet_id)
         self._attr_unique_id = f"{pet_id}_daily_pee_count"
 
-    def _update_from_store(self) -> None:
+    def _update_from_summary(self, summary: PetSummary) -> None:
         """Update the sensor value."""
-        now = dt_util.now()
-        today_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
-        visits_today = self._get_visits_since(today_start)
-        pee_visits = [v for v in visits_today if v.did_pee]
-        self._attr_native_value = len(pee_visits)
+        self._attr_native_value = summary.pee_today
 
 
 class DailyPoopCountSensor(PetHealthSensorBase):
@@ -411,19 +396,18 @@ class DailyPoopCountSensor(PetHealthSensorBase):
     _attr_icon = "mdi:texture"
 
     def __init__(
-        self, entry: PetHealthConfigEntry, store: PetHealthStore, pet_id: str
+        self,
+        entry: PetHealthConfigEntry,
+        coordinator: PetHealthCoordinator,
+        pet_id: str,
     ) -> None:
         """Initialize the sensor."""
-        super().__init__(entry, store, pet_id)
+        super().__init__(entry, coordinator, pet_id)
         self._attr_unique_id = f"{pet_id}_daily_poop_count"
 
-    def _update_from_store(self) -> None:
+    def _update_from_summary(self, summary: PetSummary) -> None:
         """Update the sensor value."""
-        now = dt_util.now()
-        today_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
-        visits_today = self._get_visits_since(today_start)
-        poop_visits = [v for v in visits_today if v.did_poop]
-        self._attr_native_value = len(poop_visits)
+        self._attr_native_value = summary.poop_today
 
 
 class UnconfirmedVisitsCountSensor(PetHealthSensorBase):
@@ -435,21 +419,23 @@ class UnconfirmedVisitsCountSensor(PetHealthSensorBase):
     _attr_icon = "mdi:alert-circle"
 
     def __init__(
-        self, entry: PetHealthConfigEntry, store: PetHealthStore, pet_id: str
+        self,
+        entry: PetHealthConfigEntry,
+        coordinator: PetHealthCoordinator,
+        pet_id: str,
     ) -> None:
         """Initialize the sensor."""
-        super().__init__(entry, store, pet_id)
+        super().__init__(entry, coordinator, pet_id)
         self._attr_unique_id = f"{pet_id}_unconfirmed_visits_count"
 
-    def _update_from_store(self) -> None:
+    def _update_from_summary(self, summary: PetSummary) -> None:
         """Update the sensor value."""
-        visits = self._get_visits()
-        unconfirmed_visits = [v for v in visits if not v.confirmed]
+        unconfirmed_visits = summary.unconfirmed_visits
         self._attr_native_value = len(unconfirmed_visits)
 
-        # Add list of unconfirmed visits with details to attributes
+        # Add the oldest unconfirmed visits with details to attributes
         visits_list = []
-        for visit in unconfirmed_visits:
+        for visit in unconfirmed_visits[:MAX_ATTRIBUTE_VISITS]:
             visit_info = {
                 "visit_id": visit.visit_id,
                 "timestamp": visit.timestamp.isoformat(),
@@ -457,18 +443,21 @@ class UnconfirmedVisitsCountSensor(PetHealthSensorBase):
                 "did_poop": visit.did_poop,
             }
             if visit.poop_consistencies:
-                visit_info["poop_consistencies"] = visit.poop_consistencies
+                visit_info["poop_consistencies"] = list(visit.poop_consistencies)
             if visit.poop_color:
                 visit_info["poop_color"] = visit.poop_color
             if visit.urine_amount:
                 visit_info["urine_amount"] = visit.urine_amount
             if visit.notes:
-                visit_info["notes"] = visit.notes
+                visit_info["notes"] = _truncate(visit.notes)
             visits_list.append(visit_info)
 
         # Sort by timestamp (oldest first)
         visits_list.sort(key=lambda x: x["timestamp"])
-        self._attr_extra_state_attributes["unconfirmed_visits"] = visits_list
+        self._attr_extra_state_attributes = {
+            **self._attr_extra_state_attributes,
+            "unconfirmed_visits": visits_list,
+        }
 
 
 class LastMedicationDoseSensor(PetHealthSensorBase):
@@ -479,13 +468,13 @@ class LastMedicationDoseSensor(PetHealthSensorBase):
     def __init__(
         self,
         entry: PetHealthConfigEntry,
-        store: PetHealthStore,
+        coordinator: PetHealthCoordinator,
         pet_id: str,
         medication_id: str,
         medication_name: str,
     ) -> None:
         """Initialize the sensor."""
-        super().__init__(entry, store, pet_id)
+        super().__init__(entry, coordinator, pet_id)
         self._medication_id = medication_id
         self._medication_name = medication_name
         self._attr_unique_id = f"{pet_id}_medication_{medication_id}_last_dose"
@@ -494,16 +483,11 @@ class LastMedicationDoseSensor(PetHealthSensorBase):
             "medication_name": medication_name,
         }
 
-    def _update_from_store(self) -> None:
+    def _update_from_summary(self, summary: PetSummary) -> None:
         """Update the sensor value."""
-        medications = self._get_medications()
-        # Filter by medication name
-        med_doses = [
-            m for m in medications if m.medication_name == self._medication_name
-        ]
-
-        if med_doses:
-            last_dose = max(med_doses, key=lambda m: m.timestamp)
+        last_dose = summary.last_medications.get(self._medication_id)
+
+        if last_dose is not None:
             self._attr_native_value = dt_util.as_utc(last_dose.timestamp)
             # Update attributes while preserving base attributes
             self._attr_extra_state_attributes = {
@@ -513,7 +497,7 @@ class LastMedicationDoseSensor(PetHealthSensorBase):
                 "medication_name": last_dose.medication_name,
                 "dosage": last_dose.dosage,
                 "unit": last_dose.unit,
-                "notes": last_dose.notes,
+                "notes": _truncate(last_dose.notes),
             }
         else:
             self._attr_native_value = None
@@ -534,13 +518,13 @@ class DailyMedicationCountSensor(PetHealthSensorBase):
     def __init__(
         self,
         entry: PetHealthConfigEntry,
-        store: PetHealthStore,
+        coordinator: PetHealthCoordinator,
         pet_id: str,
         medication_id: str,
         medication_name: str,
     ) -> None:
         """Initialize the sensor."""
-        super().__init__(entry, store, pet_id)
+        super().__init__(entry, coordinator, pet_id)
         self._medication_id = medication_id
         self._medication_name = medication_name
         self._attr_unique_id = f"{pet_id}_medication_{medication_id}_daily_count"
@@ -549,16 +533,11 @@ class DailyMedicationCountSensor(PetHealthSensorBase):
             "medication_name": medication_name,
         }
 
-    def _update_from_store(self) -> None:
+    def _update_from_summary(self, summary: PetSummary) -> None:
         """Update the sensor value."""
-        now = dt_util.now()
-        today_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
-        medications_today = self._get_medications_since(today_start)
-        # Filter by medication name
-        med_doses_today = [
-            m for m in medications_today if m.medication_name == self._medication_name
-        ]
-        self._attr_native_value = len(med_doses_today)
+        self._attr_native_value = summary.medications_today.get(
+            self._medication_id, 0
+        )
 
 
 # Thirst Sensors
@@ -571,17 +550,18 @@ class LastDrinkTimestampSensor(PetHealthSensorBase):
     _attr_device_class = SensorDeviceClass.TIMESTAMP
 
     def __init__(
-        self, entry: PetHealthConfigEntry, store: PetHealthStore, pet_id: str
+        self,
+        entry: PetHealthConfigEntry,
+        coordinator: PetHealthCoordinator,
+        pet_id: str,
     ) -> None:
         """Initialize the sensor."""
-        super().__init__(entry, store, pet_id)
+        super().__init__(entry, coordinator, pet_id)
         self._attr_unique_id = f"{pet_id}_last_drink"
 
-    def _update_from_store(self) -> None:
+    def _update_from_summary(self, summary: PetSummary) -> None:
         """Update the sensor value."""
-        records = self._store.get_drink_records(self._pet_id)
-        if records:
-            last_record = records[-1]
+        if (last_record := summary.last_drink) is not None:
             timestamp = last_record.timestamp
             if timestamp.tzinfo is None:
                 timestamp = dt_util.as_utc(timestamp)
@@ -589,7 +569,7 @@ class LastDrinkTimestampSensor(PetHealthSensorBase):
             self._attr_extra_state_attributes = {
                 **self._attr_extra_state_attributes,
                 "amount": last_record.amount,
-                "notes": last_record.notes,
+                "notes": _truncate(last_record.notes),
             }
         else:
             self._attr_native_value = None
@@ -608,28 +588,18 @@ class DailyDrinkCountSensor(PetHealthSensorBase):
     _attr_icon = "mdi:cup-water"
 
     def __init__(
-        self, entry: PetHealthConfigEntry, store: PetHealthStore, pet_id: str
+        self,
+        entry: PetHealthConfigEntry,
+        coordinator: PetHealthCoordinator,
+        pet_id: str,
     ) -> None:
         """Initialize the sensor."""
-        super().__init__(entry, store, pet_id)
+        super().__init__(entry, coordinator, pet_id)
         self._attr_unique_id = f"{pet_id}_daily_drink_count"
 
-    def _update_from_store(self) -> None:
+    def _update_from_summary(self, summary: PetSummary) -> None:
         """Update the sensor value."""
-        records = self._store.get_drink_records(self._pet_id)
-        now = dt_util.now()
-        today_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
-        drinks_today = [
-            r
-            for r in records
-            if (
-                dt_util.as_utc(r.timestamp)
-                if r.timestamp.tzinfo is None
-                else r.timestamp
-            )
-            >= today_start
-        ]
-        self._attr_native_value = len(drinks_today)
+        self._attr_native_value = summary.drinks_today
 
 
 class LastDrinkAmountSensor(PetHealthSensorBase):
@@ -639,17 +609,18 @@ class LastDrinkAmountSensor(PetHealthSensorBase):
     _attr_icon = "mdi:water"
 
     def __init__(
-        self, entry: PetHealthConfigEntry, store: PetHealthStore, pet_id: str
+        self,
+        entry: PetHealthConfigEntry,
+        coordinator: PetHealthCoordinator,
+        pet_id: str,
     ) -> None:
         """Initialize the sensor."""
-        super().__init__(entry, store, pet_id)
+        super().__init__(entry, coordinator, pet_id)
         self._attr_unique_id = f"{pet_id}_last_drink_amount"
 
-    def _update_from_store(self) -> None:
+    def _update_from_summary(self, summary: PetSummary) -> None:
         """Update the sensor value."""
-        records = self._store.get_drink_records(self._pet_id)
-        if records:
-            last_record = records[-1]
+        if (last_record := summary.last_drink) is not None:
             self._attr_native_value = last_record.amount
         else:
             self._attr_native_value = None
@@ -665,17 +636,18 @@ class LastMealTimestampSensor(PetHealthSensorBase):
     _attr_device_class = SensorDeviceClass.TIMESTAMP
 
     def __init__(
-        self, entry: PetHealthConfigEntry, store: PetHealthStore, pet_id: str
+        self,
+        entry: PetHealthConfigEntry,
+        coordinator: PetHealthCoordinator,
+        pet_id: str,
     ) -> None:
         """Initialize the sensor."""
-        super().__init__(entry, store, pet_id)
+        super().__init__(entry, coordinator, pet_id)
         self._attr_unique_id = f"{pet_id}_last_meal"
 
-    def _update_from_store(self) -> None:
+    def _update_from_summary(self, summary: PetSummary) -> None:
         """Update the sensor value."""
-        records = self._store.get_meal_records(self._pet_id)
-        if records:
-            last_record = records[-1]
+        if (last_record := summary.last_meal) is not None:
             timestamp = last_record.timestamp
             if timestamp.tzinfo is None:
                 timestamp = dt_util.as_utc(timestamp)
@@ -684,7 +656,7 @@ class LastMealTimestampSensor(PetHealthSensorBase):
                 **self._attr_extra_state_attributes,
                 "amount": last_record.amount,
                 "food_type": last_record.food_type,
-                "notes": last_record.notes,
+                "notes": _truncate(last_record.notes),
             }
         else:
             self._attr_native_value = None
@@ -703,28 +675,18 @@ class DailyMealCountSensor(PetHealthSensorBase):
     _attr_icon = "mdi:food"
 
     def __init__(
-        self, entry: PetHealthConfigEntry, store: PetHealthStore, pet_id: str
+        self,
+        entry: PetHealthConfigEntry,
+        coordinator: PetHealthCoordinator,
+        pet_id: str,
     ) -> None:
         """Initialize the sensor."""
-        super().__init__(entry, store, pet_id)
+        super().__init__(entry, coordinator, pet_id)
         self._attr_unique_id = f"{pet_id}_daily_meal_count"
 
-    def _update_from_store(self) -> None:
+    def _update_from_summary(self, summary: PetSummary) -> None:
         """Update the sensor value."""
-        records = self._store.get_meal_records(self._pet_id)
-        now = dt_util.now()
-        today_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
-        meals_today = [
-            r
-            for r in records
-            if (
-                dt_util.as_utc(r.timestamp)
-                if r.timestamp.tzinfo is None
-                else r.timestamp
-            )
-            >= today_start
-        ]
-        self._attr_native_value = len(meals_today)
+        self._attr_native_value = summary.meals_today
 
 
 class LastMealAmountSensor(PetHealthSensorBase):
@@ -734,17 +696,18 @@ class LastMealAmountSensor(PetHealthSensorBase):
     _attr_icon = "mdi:food-variant"
 
     def __init__(
-        self, entry: PetHealthConfigEntry, store: PetHealthStore, pet_id: str
+        self,
+        entry: PetHealthConfigEntry,
+        coordinator: PetHealthCoordinator,
+        pet_id: str,
     ) -> None:
         """Initialize the sensor."""
-        super().__init__(entry, store, pet_id)
+        super().__init__(entry, coordinator, pet_id)
         self._attr_unique_id = f"{pet_id}_last_meal_amount"
 
-    def _update_from_store(self) -> None:
+    def _update_from_summary(self, summary: PetSummary) -> None:
         """Update the sensor value."""
-        records = self._store.get_meal_records(self._pet_id)
-        if records:
-            last_record = records[-1]
+        if (last_record := summary.last_meal) is not None:
             self._attr_native_value = last_record.amount
         else:
             self._attr_native_value = None
@@ -760,17 +723,18 @@ class LastWellbeingAssessmentSensor(PetHealthSensorBase):
     _attr_device_class = SensorDeviceClass.TIMESTAMP
 
     def __init__(
-        self, entry: PetHealthConfigEntry, store: PetHealthStore, pet_id: str
+        self,
+        entry: PetHealthConfigEntry,
+        coordinator: PetHealthCoordinator,
+        pet_id: str,
     ) -> None:
         """Initialize the sensor."""
-        super().__init__(entry, store, pet_id)
+        super().__init__(entry, coordinator, pet_id)
         self._attr_unique_id = f"{pet_id}_last_wellbeing_assessment"
 
-    def _update_from_store(self) -> None:
+    def _update_from_summary(self, summary: PetSummary) -> None:
         """Update the sensor value."""
-        records = self._store.get_wellbeing_records(self._pet_id)
-        if records:
-            last_record = records[-1]
+        if (last_record := summary.last_wellbeing) is not None:
             timestamp = last_record.timestamp
             if timestamp.tzinfo is None:
                 timestamp = dt_util.as_utc(timestamp)
@@ -778,8 +742,8 @@ class LastWellbeingAssessmentSensor(PetHealthSensorBase):
             self._attr_extra_state_attributes = {
                 **self._attr_extra_state_attributes,
                 "wellbeing_score": last_record.wellbeing_score,
-                "symptoms": last_record.symptoms,
-                "notes": last_record.notes,
+                "symptoms": list(last_record.symptoms),
+                "notes": _truncate(last_record.notes),
             }
         else:
             self._attr_native_value = None
@@ -796,17 +760,18 @@ class CurrentWellbeingScoreSensor(PetHealthSensorBase):
     _attr_icon = "mdi:heart-pulse"
 
     def __init__(
-        self, entry: PetHealthConfigEntry, store: PetHealthStore, pet_id: str
+        self,
+        entry: PetHealthConfigEntry,
+        coordinator: PetHealthCoordinator,
+        pet_id: str,
     ) -> None:
         """Initialize the sensor."""
-        super().__init__(entry, store, pet_id)
+        super().__init__(entry, coordinator, pet_id)
         self._attr_unique_id = f"{pet_id}_current_wellbeing_score"
 
-    def _update_from_store(self) -> None:
+    def _update_from_summary(self, summary: PetSummary) -> None:
         """Update the sensor value."""
-        records = self._store.get_wellbeing_records(self._pet_id)
-        if records:
-            last_record = records[-1]
+        if (last_record := summary.last_wellbeing) is not None:
             self._attr_native_value = last_record.wellbeing_score
         else:
             self._attr_native_value = None
@@ -822,17 +787,18 @@ class LastThirstLevelTimestampSensor(PetHealthSensorBase):
     _attr_device_class = SensorDeviceClass.TIMESTAMP
 
     def __init__(
-        self, entry: PetHealthConfigEntry, store: PetHealthStore, pet_id: str
+        self,
+        entry: PetHealthConfigEntry,
+        coordinator: PetHealthCoordinator,
+        pet_id: str,
     ) -> None:
         """Initialize the sensor."""
-        super().__init__(entry, store, pet_id)
+        super().__init__(entry, coordinator, pet_id)
         self._attr_unique_id = f"{pet_id}_last_thirst_level"
 
-    def _update_from_store(self) -> None:
+    def _update_from_summary(self, summary: PetSummary) -> None:
         """Update the sensor value."""
-        records = self._store.get_thirst_level_records(self._pet_id)
-        if records:
-            last_record = records[-1]
+        if (last_record := summary.last_thirst_level) is not None:
             timestamp = last_record.timestamp
             if timestamp.tzinfo is None:
                 timestamp = dt_util.as_utc(timestamp)
@@ -840,7 +806,7 @@ class LastThirstLevelTimestampSensor(PetHealthSensorBase):
             self._attr_extra_state_attributes = {
                 **self._attr_extra_state_attributes,
                 "level": last_record.level,
-                "notes": last_record.notes,
+                "notes": _truncate(last_record.notes),
             }
         else:
             self._attr_native_value = None
@@ -857,17 +823,18 @@ class CurrentThirstLevelSensor(PetHealthSensorBase):
     _attr_icon = "mdi:water"
 
     def __init__(
-        self, entry: PetHealthConfigEntry, store: PetHealthStore, pet_id: str
+        self,
+        entry: PetHealthConfigEntry,
+        coordinator: PetHealthCoordinator,
+        pet_id: str,
     ) -> None:
         """Initialize the sensor."""
-        super().__init__(entry, store, pet_id)
+        super().__init__(entry, coordinator, pet_id)
         self._attr_unique_id = f"{pet_id}_current_thirst_level"
 
-    def _update_from_store(self) -> None:
+    def _update_from_summary(self, summary: PetSummary) -> None:
         """Update the sensor value."""
-        records = self._store.get_thirst_level_records(self._pet_id)
-        if records:
-            last_record = records[-1]
+        if (last_record := summary.last_thirst_level) is not None:
             self._attr_native_value = last_record.level
         else:
             self._attr_native_value = None
@@ -883,17 +850,18 @@ class LastAppetiteLevelTimestampSensor(PetHealthSensorBase):
     _attr_device_class = SensorDeviceClass.TIMESTAMP
 
     def __init__(
-        self, entry: PetHealthConfigEntry, store: PetHealthStore, pet_id: str
+        self,
+        entry: PetHealthConfigEntry,
+        coordinator: PetHealthCoordinator,
+        pet_id: str,
     ) -> None:
         """Initialize the sensor."""
-        super().__init__(entry, store, pet_id)
+        super().__init__(entry, coordinator, pet_id)
         self._attr_unique_id = f"{pet_id}_last_appetite_level"
 
-    def _update_from_store(self) -> None:
+    def _update_from_summary(self, summary: PetSummary) -> None:
         """Update the sensor value."""
-        records = self._store.get_appetite_level_records(self._pet_id)
-        if records:
-            last_record = records[-1]
+        if (last_record := summary.last_appetite_level) is not None:
             timestamp = last_record.timestamp
             if timestamp.tzinfo is None:
                 timestamp = dt_util.as_utc(timestamp)
@@ -901,7 +869,7 @@ class LastAppetiteLevelTimestampSensor(PetHealthSensorBase):
             self._attr_extra_state_attributes = {
                 **self._attr_extra_state_attributes,
                 "level": last_record.level,
-                "notes": last_record.notes,
+                "notes": _truncate(last_record.notes),
             }
         else:
             self._attr_native_value = None
@@ -918,17 +886,18 @@ class CurrentAppetiteLevelSensor(PetHealthSensorBase):
     _attr_icon = "mdi:food-apple"
 
     def __init__(
-        self, entry: PetHealthConfigEntry, store: PetHealthStore, pet_id: str
+        self,
+        entry: PetHealthConfigEntry,
+        coordinator: PetHealthCoordinator,
+        pet_id: str,
     ) -> None:
         """Initialize the sensor."""
-        super().__init__(entry, store, pet_id)
+        super().__init__(entry, coordinator, pet_id)
         self._attr_unique_id = f"{pet_id}_current_appetite_level"
 
-    def _update_from_store(self) -> None:
+    def _update_from_summary(self, summary: PetSummary) -> None:
         """Update the sensor value."""
-        records = self._store.get_appetite_level_records(self._pet_id)
-        if records:
-            last_record = records[-1]
+        if (last_record := summary.last_appetite_level) is not None:
             self._attr_native_value = last_record.level
         else:
             self._attr_native_value = None
@@ -944,17 +913,18 @@ class LastWeightTimestampSensor(PetHealthSensorBase):
     _attr_device_class = SensorDeviceClass.TIMESTAMP
 
     def __init__(
-        self, entry: PetHealthConfigEntry, store: PetHealthStore, pet_id: str
+        self,
+        entry: PetHealthConfigEntry,
+        coordinator: PetHealthCoordinator,
+        pet_id: str,
     ) -> None:
         """Initialize the sensor."""
-        super().__init__(entry, store, pet_id)
+        super().__init__(entry, coordinator, pet_id)
         self._attr_unique_id = f"{pet_id}_last_weight"
 
-    def _update_from_store(self) -> None:
+    def _update_from_summary(self, summary: PetSummary) -> None:
         """Update the sensor value."""
-        records = self._store.get_weight_records(self._pet_id)
-        if records:
-            last_record = records[-1]
+        if (last_record := summary.last_weight) is not None:
             timestamp = last_record.timestamp
             if timestamp.tzinfo is None:
                 timestamp = dt_util.as_utc(timestamp)
@@ -962,7 +932,7 @@ class LastWeightTimestampSensor(PetHealthSensorBase):
             self._attr_extra_state_attributes = {
                 **self._attr_extra_state_attributes,
                 "weight_grams": last_record.weight_grams,
-                "notes": last_record.notes,
+                "notes": _truncate(last_record.notes),
             }
         else:
             self._attr_native_value = None
@@ -981,17 +951,18 @@ class CurrentWeightSensor(PetHealthSensorBase):
     _attr_state_class = SensorStateClass.MEASUREMENT
 
     def __init__(
-        self, entry: PetHealthConfigEntry, store: PetHealthStore, pet_id: str
+        self,
+        entry: PetHealthConfigEntry,
+        coordinator: PetHealthCoordinator,
+        pet_id: str,
     ) -> None:
         """Initialize the sensor."""
-        super().__init__(entry, store, pet_id)
+        super().__init__(entry, coordinator, pet_id)
         self._attr_unique_id = f"{pet_id}_current_weight"
 
-    def _update_from_store(self) -> None:
+    def _update_from_summary(self, summary: PetSummary) -> None:
         """Update the sensor value."""
-        records = self._store.get_weight_records(self._pet_id)
-        if records:
-            last_record = records[-1]
+        if (last_record := summary.last_weight) is not None:
             self._attr_native_value = last_record.weight_grams
         else:
             self._attr_native_value = None
@@ -1007,26 +978,26 @@ class WeightChange7DSensor(PetHealthSensorBase):
     _attr_icon = "mdi:trending-up"
 
     def __init__(
-        self, entry: PetHealthConfigEntry, store: PetHealthStore, pet_id: str
+        self,
+        entry: PetHealthConfigEntry,
+        coordinator: PetHealthCoordinator,
+        pet_id: str,
     ) -> None:
         """Initialize the sensor."""
-        super().__init__(entry, store, pet_id)
+        super().__init__(entry, coordinator, pet_id)
         self._attr_unique_id = f"{pet_id}_weight_change_7d"
 
-    def _update_from_store(self) -> None:
+    def _update_from_summary(self, summary: PetSummary) -> None:
         """Update the sensor value."""
-        records = self._store.get_weight_records(self._pet_id)
-        if len(records) >= 2:
-            sorted_records = sorted(records, key=lambda r: r.timestamp, reverse=True)
-            current_weight = sorted_records[0].weight_grams
-            current_time = sorted_records[0].timestamp
-
-            # Find weight from 7 days ago or closest
-            for old_record in reversed(sorted_records[1:]):
-                days_ago = (current_time - old_record.timestamp).days
-                if days_ago >= 7:
-                    self._attr_native_value = current_weight - old_record.weight_grams
-                    return
+        stats = summary.weight_stats
+        # Compare with the oldest weighing once it is at least 7 days old
+        if (
+            stats
+            and stats.count >= 2
+            and (stats.last_time - stats.first_time).days >= 7
+        ):
+            self._attr_native_value = int(stats.change)
+            return
 
         self._attr_native_value = None
 
@@ -1041,31 +1012,32 @@ class WeightChange30DSensor(PetHealthSensorBase):
     _attr_icon = "mdi:trending-up"
 
     def __init__(
-        self, entry: PetHealthConfigEntry, store: PetHealthStore, pet_id: str
+        self,
+        entry: PetHealthConfigEntry,
+        coordinator: PetHealthCoordinator,
+        pet_id: str,
     ) -> None:
         """Initialize the sensor."""
-        super().__init__(entry, store, pet_id)
+        super().__init__(entry, coordinator, pet_id)
         self._attr_unique_id = f"{pet_id}_weight_change_30d"
 
-    def _update_from_store(self) -> None:
+    def _update_from_summary(self, summary: PetSummary) -> None:
         """Update the sensor value."""
-        records = self._store.get_weight_records(self._pet_id)
-        if len(records) >= 2:
-            sorted_records = sorted(records, key=lambda r: r.timestamp, reverse=True)
-            current_weight = sorted_records[0].weight_grams
-            current_time = sorted_records[0].timestamp
-
-            # Find weight from 30 days ago or closest
-            for old_record in reversed(sorted_records[1:]):
-                days_ago = (current_time - old_record.timestamp).days
-                if days_ago >= 30:
-                    self._attr_native_value = current_weight - old_record.weight_grams
-                    return
+        stats = summary.weight_stats
+        # Compare with the oldest weighing once it is at least 30 days old
+        if (
+            stats
+            and stats.count >= 2
+            and (stats.last_time - stats.first_time).days >= 30
+        ):
+            self._attr_native_value = int(stats.change)
+            return
 
         self._attr_native_value = None
 
 
-# Vomiting Tracking Sensors
+# Vomiting Tracking Sensors, read from the store as vomit records are not
+# part of the summary
 
 
 class LastVomitTimestampSensor(PetHealthSensorBase):
@@ -1075,15 +1047,18 @@ class LastVomitTimestampSensor(PetHealthSensorBase):
     _attr_device_class = SensorDeviceClass.TIMESTAMP
 
     def __init__(
-        self, entry: PetHealthConfigEntry, store: PetHealthStore, pet_id: str
+        self,
+        entry: PetHealthConfigEntry,
+        coordinator: PetHealthCoordinator,
+        pet_id: str,
     ) -> None:
         """Initialize the sensor."""
-        super().__init__(entry, store, pet_id)
+        super().__init__(entry, coordinator, pet_id)
         self._attr_unique_id = f"{pet_id}_last_vomit"
 
-    def _update_from_store(self) -> None:
+    def _update_from_summary(self, summary: PetSummary) -> None:
         """Update the sensor value."""
-        records = self._store.get_vomit_records(self._pet_id)
+        records = self.coordinator.store.get_vomit_records(self._pet_id)
         if records:
             last_record = records[-1]
             timestamp = last_record.timestamp
@@ -1093,7 +1068,7 @@ class LastVomitTimestampSensor(PetHealthSensorBase):
             self._attr_extra_state_attributes = {
                 **self._attr_extra_state_attributes,
                 "vomit_type": last_record.vomit_type,
-                "notes": last_record.notes,
+                "notes": _truncate(last_record.notes),
             }
         else:
             self._attr_native_value = None
@@ -1110,18 +1085,20 @@ class LastVomitTypeSensor(PetHealthSensorBase):
     _attr_icon = "mdi:alert-circle"
 
     def __init__(
-        self, entry: PetHealthConfigEntry, store: PetHealthStore, pet_id: str
+        self,
+        entry: PetHealthConfigEntry,
+        coordinator: PetHealthCoordinator,
+        pet_id: str,
     ) -> None:
         """Initialize the sensor."""
-        super().__init__(entry, store, pet_id)
+        super().__init__(entry, coordinator, pet_id)
         self._attr_unique_id = f"{pet_id}_last_vomit_type"
 
-    def _update_from_store(self) -> None:
+    def _update_from_summary(self, summary: PetSummary) -> None:
         """Update the sensor value."""
-        records = self._store.get_vomit_records(self._pet_id)
+        records = self.coordinator.store.get_vomit_records(self._pet_id)
         if records:
-            last_record = records[-1]
-            self._attr_native_value = last_record.vomit_type
+            self._attr_native_value = records[-1].vomit_type
         else:
             self._attr_native_value = None
 
@@ -1134,21 +1111,20 @@ class DailyVomitCountSensor(PetHealthSensorBase):
     _attr_icon = "mdi:counter"
 
     def __init__(
-        self, entry: PetHealthConfigEntry, store: PetHealthStore, pet_id: str
+        self,
+        entry: PetHealthConfigEntry,
+        coordinator: PetHealthCoordinator,
+        pet_id: str,
     ) -> None:
         """Initialize the sensor."""
-        super().__init__(entry, store, pet_id)
+        super().__init__(entry, coordinator, pet_id)
         self._attr_unique_id = f"{pet_id}_daily_vomit_count"
 
-    def _update_from_store(self) -> None:
+    def _update_from_summary(self, summary: PetSummary) -> None:
         """Update the sensor value."""
-        records = self._store.get_vomit_records(self._pet_id)
-        today = dt_util.start_of_local_day()
-
-        count = sum(
-            1 for record in records if dt_util.as_local(record.timestamp) >= today
+        self._attr_native_value = self.coordinator.store.get_daily_count(
+            "vomit", self._pet_id
         )
-        self._attr_native_value = count
 
 
 class WeeklyVomitCountSensor(PetHealthSensorBase):
@@ -1159,26 +1135,19 @@ class WeeklyVomitCountSensor(PetHealthSensorBase):
     _attr_icon = "mdi:counter"
 
     def __init__(
-        self, entry: PetHealthConfigEntry, store: PetHealthStore, pet_id: str
+        self,
+        entry: PetHealthConfigEntry,
+        coordinator: PetHealthCoordinator,
+        pet_id: str,
     ) -> None:
         """Initialize the sensor."""
-        super().__init__(entry, store, pet_id)
+        super().__init__(entry, coordinator, pet_id)
         self._attr_unique_id = f"{pet_id}_weekly_vomit_count"
 
-    def _update_from_store(self) -> None:
+    def _update_from_summary(self, summary: PetSummary) -> None:
         """Update the sensor value."""
-        records = self._store.get_vomit_records(self._pet_id)
-        week_ago = dt_util.now() - timedelta(days=7)
-
-        count = sum(1 for record in records if record.timestamp >= week_ago)
-        self._attr_native_value = count
-        self._attr_unique_id = f"{pet_id}_current_wellbeing_score"
-
-    def _update_from_store(self) -> None:
-        """Update the sensor value."""
-        records = self._store.get_wellbeing_records(self._pet_id)
-        if records:
-            last_record = records[-1]
-            self._attr_native_value = last_record.wellbeing_score
-        else:
-            self._attr_native_value = None
+        self._attr_native_value = len(
+            self.coordinator.store.get_vomit_records_between(
+                self._pet_id, dt_util.now() - WEEK
+            )
+        )
@@ -0,0 +1,103 @@
+"""Columnar time series for numeric measurements."""
+
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import datetime
+from math import fsum
+
+from homeassistant.util import dt as dt_util
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+@dataclass(slots=True, frozen=True)
+class SeriesStats:
+    """Summary of a numeric series within a time window."""
+
+    count: int
+    minimum: float
+    maximum: float
+    mean: float
+    first: float
+    last: float
+    first_time: datetime
+    last_time: datetime
+
+    @property
+    def change(self) -> float:
+        """Return the difference between the last and first value."""
+        return self.last - self.first
+
+
+class NumericSeries:
+    """Timestamps and values of one measurement in parallel typed arrays.
+
+    Times are epoch seconds (int64) and values float64, both sorted by time.
+    Window statistics run on NumPy views of the arrays when NumPy is
+    available and on the arrays themselves otherwise.
+    """
+
+    __slots__ = ("_times", "_values")
+
+    def __init__(self, points: Iterable[tuple[datetime, float]] = ()) -> None:
+        """Initialize the series from points sorted by time."""
+        self._times = array("q")
+        self._values = array("d")
+        for timestamp, value in points:
+            self._times.append(int(timestamp.timestamp()))
+            self._values.append(value)
+
+    def __len__(self) -> int:
+        """Return the number of points."""
+        return len(self._times)
+
+    def add(self, timestamp: datetime, value: float) -> None:
+        """Insert a point at its place in time."""
+        seconds = int(timestamp.timestamp())
+        index = bisect_right(self._times, seconds)
+        self._times.insert(index, seconds)
+        self._values.insert(index, value)
+
+    def stats(
+        self, start: datetime | None = None, end: datetime | None = None
+    ) -> SeriesStats | None:
+        """Summarize the points within an inclusive window, None if empty."""
+        low, high = 0, len(self._times)
+        if start is not None:
+            low = bisect_left(self._times, int(start.timestamp()))
+        if end is not None:
+            high = bisect_right(self._times, int(end.timestamp()))
+        if low >= high:
+            return None
+
+        if np is not None:
+            # A view shares the buffer, it must not outlive this call since
+            # the array cannot grow while it is exported
+            values = np.frombuffer(self._values, dtype=np.float64)[low:high]
+            minimum = float(values.min())
+            maximum = float(values.max())
+            mean = float(values.mean())
+            del values
+        else:
+            window = self._values[low:high]
+            minimum = min(window)
+            maximum = max(window)
+            mean = fsum(window) / len(window)
+
+        return SeriesStats(
+            count=high - low,
+            minimum=minimum,
+            maximum=maximum,
+            mean=mean,
+            first=self._values[low],
+            last=self._values[high - 1],
+            first_time=dt_util.utc_from_timestamp(self._times[low]),
+            last_time=dt_util.utc_from_timestamp(self._times[high - 1]),
+        )
@@ -2,20 +2,46 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
+import asyncio
+from bisect import bisect_left, bisect_right, insort
+from collections import Counter, deque
+from collections.abc import Awaitable, Callable, Iterable
+import contextlib
+from dataclasses import fields
+from datetime import date, datetime, timedelta
+from functools import partial
+from itertools import islice
+import logging
+from operator import attrgetter
+import os
+import time
+from typing import Any, Generic, Protocol, Self, TypeVar
+import uuid
 
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.storage import Store
+from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.json import json_dumps
+from homeassistant.helpers.storage import STORAGE_DIR, Store
+from homeassistant.util import dt as dt_util
+from homeassistant.util.json import json_loads
 
 from .const import (
+    CHANGE_LOG_SIZE,
+    DEFAULT_SAVE_DELAY,
+    HOT_WINDOW_DAYS,
+    JOURNAL_COMPACT_THRESHOLD,
+    MISSING_ID_CACHE_SIZE,
+    STORAGE_JOURNAL_SUFFIX,
     STORAGE_KEY_APPETITE_LEVELS,
     STORAGE_KEY_BLOOD_GLUCOSE,
     STORAGE_KEY_DRINKS,
     STORAGE_KEY_GENERIC_LOGS,
     STORAGE_KEY_GLYCATED_HEMOGLOBIN,
     STORAGE_KEY_KETONES,
+    STORAGE_KEY_MANIFEST,
     STORAGE_KEY_MEALS,
     STORAGE_KEY_MEDICATIONS,
+    STORAGE_KEY_ROLLUPS,
     STORAGE_KEY_THIRST_LEVELS,
     STORAGE_KEY_VISITS,
     STORAGE_KEY_VOMIT,
@@ -38,508 +64,2019 @@ from .models import (
     WeightRecord,
     WellbeingRecord,
 )
+from .rollup import add_to_rollups, bucket_start, merge_rollups, rollup_day
+from .series import NumericSeries, SeriesStats
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class _Record(Protocol):
+    """Interface shared by all stored record models."""
+
+    pet_id: str
+    timestamp: datetime
+
+    def to_dict(self) -> dict: ...
+
+    def to_storage_dict(self, *, with_pet_id: bool = False) -> dict: ...
+
+    @classmethod
+    def from_dict(cls, data: dict) -> Self: ...
+
+    @classmethod
+    def from_storage_dict(cls, data: dict, pet_id: str | None = None) -> Self: ...
+
+
+_RecordT = TypeVar("_RecordT", bound=_Record)
+
+_timestamp = attrgetter("timestamp")
+
+# Versions of files that kept their format when records moved to version 2
+_MANIFEST_VERSION = 1
+_LEGACY_VERSION = 1
+_ROLLUPS_VERSION = 1
+# Shards wrap their records with the generation of the journal they include
+_SHARD_VERSION = 3
+
+
+def _read_journal(path: str) -> tuple[int | None, list[dict[str, Any]]]:
+    """Read the journal's generation and records.
+
+    Lines torn by an interrupted write are skipped.
+    """
+    try:
+        with open(path, encoding="utf-8") as file:
+            lines = file.readlines()
+    except FileNotFoundError:
+        return None, []
+
+    generation: int | None = None
+    records: list[dict[str, Any]] = []
+    for line in lines:
+        if not line.strip():
+            continue
+        try:
+            record = json_loads(line)
+        except ValueError:
+            _LOGGER.warning("Skipping unreadable line in journal %s", path)
+            continue
+        if "generation" in record:
+            generation = record["generation"]
+        else:
+            records.append(record)
+    return generation, records
+
+
+def _append_journal(path: str, lines: list[str], generation: int | None) -> None:
+    """Append record lines to the journal and make them durable.
+
+    A new journal starts with a line holding its generation.
+    """
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    if generation is not None:
+        lines = [json_dumps({"generation": generation}), *lines]
+    with open(path, "a", encoding="utf-8") as file:
+        file.write("".join(f"{line}\n" for line in lines))
+        file.flush()
+        os.fsync(file.fileno())
+
+
+def _remove_journal(path: str) -> None:
+    """Remove a journal once its records are part of the snapshot."""
+    with contextlib.suppress(FileNotFoundError):
+        os.remove(path)
+
+
+def _normalize(record: _RecordT) -> _RecordT:
+    """Make a record's timestamp timezone-aware, naive ones are UTC."""
+    if record.timestamp.tzinfo is None:
+        record.timestamp = dt_util.as_utc(record.timestamp)
+    return record
+
+
+def _upgrade(
+    record_type: type[_RecordT], data: dict, *, with_pet_id: bool = False
+) -> dict:
+    """Convert a version 1 record dict with ISO timestamps to version 2."""
+    record = _normalize(record_type.from_dict(data))
+    return record.to_storage_dict(with_pet_id=with_pet_id)
+
+
+class _RecordStore(Store[list[dict]]):
+    """Store of one pet's records that upgrades older storage versions."""
+
+    def __init__(
+        self, hass: HomeAssistant, key: str, record_type: type[_Record]
+    ) -> None:
+        """Initialize the store."""
+        super().__init__(hass, STORAGE_VERSION, key)
+        self._record_type = record_type
+        # Set when the file on disk is still in an older version
+        self.migrated = False
+
+    async def _async_migrate_func(
+        self, old_major_version: int, old_minor_version: int, old_data: list[dict]
+    ) -> list[dict]:
+        """Convert ISO timestamps and enum values to the compact format."""
+        self.migrated = True
+        return [_upgrade(self._record_type, record) for record in old_data]
+
+
+class _ShardStore(Store[dict[str, Any]]):
+    """Store of one pet's hot records and the journal generation they include.
+
+    Compaction saves the shards before removing the journal, so a restart in
+    between leaves a journal whose lines some shards already hold. A shard's
+    "journal" is the generation of the newest journal it includes.
+    """
+
+    def __init__(
+        self, hass: HomeAssistant, key: str, record_type: type[_Record]
+    ) -> None:
+        """Initialize the store."""
+        super().__init__(hass, _SHARD_VERSION, key)
+        self._record_type = record_type
+        # Set when the file on disk is still in an older version
+        self.migrated = False
+
+    async def _async_migrate_func(
+        self, old_major_version: int, old_minor_version: int, old_data: Any
+    ) -> dict[str, Any]:
+        """Wrap the records of an older shard, upgrading version 1 records."""
+        self.migrated = True
+        if old_major_version < STORAGE_VERSION:
+            old_data = [_upgrade(self._record_type, record) for record in old_data]
+        return {"journal": 0, "records": old_data}
+
+
+def _visit_daily_keys(visit: BathroomVisit) -> tuple[str, ...]:
+    """Return the daily counts a visit adds to besides the total."""
+    return (("pee",) if visit.did_pee else ()) + (("poop",) if visit.did_poop else ())
+
+
+def _medication_daily_keys(medication: MedicationRecord) -> tuple[str, ...]:
+    """Return the medication a dose is counted for, by name for older doses."""
+    return (medication.medication_id or medication.medication_name,)
+
+
+def _visit_detail_keys(visit: BathroomVisit) -> tuple[str, ...]:
+    """Return the details of a visit the summary shows the latest of."""
+    return tuple(
+        name
+        for name in ("poop_consistencies", "poop_color", "urine_amount")
+        if getattr(visit, name)
+    )
+
+
+def _no_daily_keys(record: Any) -> tuple[str, ...]:
+    """Count records per day in total only."""
+    return ()
+
+
+def merge_changes(
+    changes: Iterable[tuple[str, str, str, Any]],
+) -> list[tuple[str, str, str, Any]]:
+    """Merge changes to the same record of a pet into one.
+
+    Takes and returns (operation, record type, pet ID, record) tuples, in
+    the order of each record's last change. A record inserted and deleted
+    again is left out.
+    """
+    merged: dict[tuple[int, str], tuple[str, str, str, Any]] = {}
+    for operation, record_type, pet_id, record in changes:
+        key = (id(record), pet_id)
+        # Popped to keep the result in the order of the last change
+        if (previous := merged.pop(key, None)) is not None:
+            if previous[0] == "inserted":
+                if operation == "deleted":
+                    continue
+                operation = "inserted"
+            elif previous[0] == "deleted":
+                # Moved away and back again
+                operation = "updated"
+        merged[key] = (operation, record_type, pet_id, record)
+    return list(merged.values())
+
+
+def _segment_month(timestamp: datetime) -> str:
+    """Return the monthly segment (YYYY-MM, local time) a timestamp belongs to."""
+    return dt_util.as_local(timestamp).strftime("%Y-%m")
+
+
+def _first_hot_month() -> str:
+    """Return the oldest month that is still kept in memory."""
+    return _segment_month(dt_util.now() - timedelta(days=HOT_WINDOW_DAYS))
+
+
+def hot_window_start() -> datetime:
+    """Return the start of the oldest month that is still kept in memory.
+
+    Records from then on are never frozen, reading them reads no segments.
+    """
+    now = dt_util.now()
+    return dt_util.start_of_local_day(
+        (now - timedelta(days=HOT_WINDOW_DAYS)).date().replace(day=1)
+    )
+
+
+def _in_range(
+    timestamp: datetime, start: datetime | None, end: datetime | None
+) -> bool:
+    """Return True if a timestamp lies within an optional inclusive range."""
+    timestamp = dt_util.as_utc(timestamp)
+    return (start is None or timestamp >= start) and (end is None or timestamp <= end)
+
+
+class _ShardManifest:
+    """Index of the per-pet shard and segment files of each record type.
+
+    A record type missing from the shard index has not been split into shards
+    yet and is still stored in its legacy single file. Each segment's records
+    are also kept summarized as daily rollups, so aggregates never read them.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the manifest."""
+        self._store = Store[dict[str, dict[str, Any]]](
+            hass, _MANIFEST_VERSION, STORAGE_KEY_MANIFEST
+        )
+        self.shards: dict[str, set[str]] = {}
+        self.segments: dict[str, dict[str, set[str]]] = {}
+        # Daily rollups per record type, pet and segment month
+        self.segment_rollups: dict[str, dict[str, dict[str, dict[str, Any]]]] = {}
+        self.dirty = False
+        self._lock = asyncio.Lock()
+
+    async def async_load(self) -> None:
+        """Load the manifest."""
+        stored = await self._store.async_load() or {}
+        self.shards = {
+            key: set(pet_ids) for key, pet_ids in stored.get("shards", {}).items()
+        }
+        self.segments = {
+            key: {pet_id: set(months) for pet_id, months in pets.items()}
+            for key, pets in stored.get("segments", {}).items()
+        }
+        self.segment_rollups = stored.get("segment_rollups", {})
+
+    def add(self, key: str, pet_id: str) -> None:
+        """Register a shard, it is persisted by the next async_save."""
+        pet_ids = self.shards.setdefault(key, set())
+        if pet_id not in pet_ids:
+            pet_ids.add(pet_id)
+            self.dirty = True
+
+    def add_segment(
+        self, key: str, pet_id: str, month: str, rollups: dict[str, Any]
+    ) -> None:
+        """Register a frozen monthly segment and the daily rollups of its records."""
+        self.segments.setdefault(key, {}).setdefault(pet_id, set()).add(month)
+        self.segment_rollups.setdefault(key, {}).setdefault(pet_id, {})[month] = (
+            rollups
+        )
+        self.dirty = True
+
+    def remove_segment(self, key: str, pet_id: str, month: str) -> None:
+        """Forget a monthly segment that no longer holds any records."""
+        months = self.segments.get(key, {}).get(pet_id, set())
+        if month in months:
+            months.discard(month)
+            self.segment_rollups.get(key, {}).get(pet_id, {}).pop(month, None)
+            self.dirty = True
+
+    async def async_save(self) -> None:
+        """Write the manifest if it changed.
+
+        Record types load and compact concurrently, a caller returns only once
+        a write covering its own changes has finished.
+        """
+        async with self._lock:
+            if not self.dirty:
+                return
+            self.dirty = False
+            await self._store.async_save(
+                {
+                    "shards": {
+                        key: sorted(pet_ids) for key, pet_ids in self.shards.items()
+                    },
+                    "segments": {
+                        key: {
+                            pet_id: sorted(months) for pet_id, months in pets.items()
+                        }
+                        for key, pets in self.segments.items()
+                    },
+                    "segment_rollups": self.segment_rollups,
+                }
+            )
+
+
+class _RecordCollection(Generic[_RecordT]):
+    """Records of one type, persisted per pet plus an append-only journal.
+
+    Every pet has its own shard file, so writing one pet's records never
+    rewrites another pet's history. Changes are kept in memory and written
+    behind: new records are queued as journal lines and changed or removed
+    records mark their pet's shard dirty. Everything queued within one save
+    delay is flushed in a single write. Shards are only rewritten when they
+    are dirty or when the journal grows past JOURNAL_COMPACT_THRESHOLD lines.
+
+    Only the hot tier, the last HOT_WINDOW_DAYS days, is kept in memory and
+    in the shard. Older records are frozen into monthly segment files, such
+    as pet_health_visits.<pet_id>.2024-05, that are read on demand. The
+    newest record of each pet and records matching keep_hot always stay hot,
+    as does the newest record under each key newest_keys returns for it.
+
+    Frozen records past a retention horizon can be expired into daily
+    rollups that summarize the rollup_fields and the value_attr. The
+    manifest keeps the same rollups of each segment's records.
+
+    With daily_keys, hot records are also counted per pet and local day, in
+    total and under each key daily_keys returns for a record, as they are
+    added, changed and removed. The newest record under each key is kept
+    too. counted_fields maps the boolean rollup fields these counts cover to
+    their key.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        key: str,
+        record_type: type[_RecordT],
+        save_delay: float,
+        manifest: _ShardManifest,
+        keep_hot: Callable[[_RecordT], bool] | None = None,
+        lazy: bool = False,
+        id_attr: str | None = None,
+        value_attr: str | None = None,
+        rollup_fields: tuple[str, ...] = (),
+        daily_keys: Callable[[_RecordT], Iterable[str]] | None = None,
+        counted_fields: dict[str, str] | None = None,
+        newest_keys: Callable[[_RecordT], Iterable[str]] | None = None,
+    ) -> None:
+        """Initialize the collection."""
+        self._hass = hass
+        self._key = key
+        self._record_type = record_type
+        self._manifest = manifest
+        self._keep_hot = keep_hot
+        self._lazy = lazy
+        self._id_attr = id_attr
+        self._value_attr = value_attr
+        self._rollup_fields = rollup_fields
+        self._daily_keys = daily_keys
+        self._counted_fields = counted_fields or {}
+        self._newest_keys = newest_keys
+        self._shards: dict[str, _RecordStore] = {}
+        self._journal_path = hass.config.path(
+            STORAGE_DIR, f"{key}.{STORAGE_JOURNAL_SUFFIX}"
+        )
+        self._journal_size = 0
+        # Generation of the journal lines are appended to, incremented each
+        # time it is compacted into the shards
+        self._generation = 1
+        self._pending_lines: list[str] = []
+        # Pets whose shard is behind memory: journaled or changed records
+        self._journaled_pets: set[str] = set()
+        self._dirty_pets: set[str] = set()
+        # Segments loaded back into memory, rewritten when frozen again
+        self._thawed: dict[str, set[str]] = {}
+        # IDs no frozen segment holds, forgotten when segments are written
+        self._missing_ids: dict[str, None] = {}
+        self._first_hot_month: str | None = None
+        self._lock = asyncio.Lock()
+        self._debouncer = Debouncer(
+            hass,
+            _LOGGER,
+            cooldown=save_delay,
+            immediate=False,
+            function=self.async_flush,
+        )
+        self._data: dict[str, list[_RecordT]] = {}
+        # Hot records by their ID, for record types that have one
+        self._index: dict[str, _RecordT] = {}
+        # Hot values per pet as columns, for numeric measurements
+        self._series: dict[str, NumericSeries] = {}
+        # Hot records per pet and local day, the None key counts all of them
+        self._daily: dict[str, dict[date, Counter[str | None]]] = {}
+        # Newest hot record per pet and daily key, and pets whose newest
+        # record for a key was changed or removed and must be looked up again
+        self._latest: dict[str, dict[str, _RecordT]] = {}
+        self._stale_latest: set[str] = set()
+        # Stored dicts of a lazy collection that has not been read yet
+        self._raw: dict[str, list[dict]] | None = None
+        # Called with the operation, the record and its pet when a hot
+        # record is inserted, updated or deleted
+        self.on_change: Callable[[str, _RecordT, str], None] | None = None
+
+    @property
+    def data(self) -> dict[str, list[_RecordT]]:
+        """Return the hot records per pet, decoding a lazy collection first."""
+        self._materialize()
+        return self._data
+
+    def _materialize(self) -> None:
+        """Decode the stored dicts of a lazy collection on first access.
+
+        Only reached from synchronous accessors, async ones decode in the
+        executor with async_materialize first.
+        """
+        if self._raw is not None:
+            self._set_data(self._decode_pets(self._raw))
+            self._raw = None
+
+    async def async_materialize(self) -> None:
+        """Decode the stored dicts of a lazy collection in the executor."""
+        if (raw := self._raw) is None:
+            return
+        data = await self._hass.async_add_executor_job(self._decode_pets, raw)
+        # A synchronous accessor may have decoded them meanwhile
+        if self._raw is raw:
+            self._set_data(data)
+            self._raw = None
+
+    def _set_data(self, data: dict[str, list[_RecordT]]) -> None:
+        """Replace the hot records and rebuild the ID index."""
+        self._data = data
+        self._index = {}
+        self._series = {}
+        self._daily = {}
+        self._latest = {}
+        for pet_id, records in data.items():
+            self._add_to_index(records)
+            self._rebuild_pets(pet_id)
+
+    def _add_to_index(self, records: Iterable[_RecordT]) -> None:
+        """Index hot records by their ID."""
+        if self._id_attr is not None:
+            for record in records:
+                self._index[getattr(record, self._id_attr)] = record
+
+    def _remove_from_index(self, records: Iterable[_RecordT]) -> None:
+        """Drop records that are no longer hot from the ID index."""
+        if self._id_attr is not None:
+            for record in records:
+                self._index.pop(getattr(record, self._id_attr), None)
+
+    def _rebuild_series(self, *pet_ids: str) -> None:
+        """Rebuild the value columns of pets whose hot records were replaced."""
+        if self._value_attr is None:
+            return
+        for pet_id in pet_ids:
+            self._series[pet_id] = NumericSeries(
+                (record.timestamp, getattr(record, self._value_attr))
+                for record in self._data.get(pet_id, [])
+            )
+
+    def _count(self, record: _RecordT, delta: int) -> None:
+        """Add a hot record to, or with -1 take it from, its day's counts."""
+        if self._daily_keys is None:
+            return
+        day = dt_util.as_local(record.timestamp).date()
+        counts = self._daily.setdefault(record.pet_id, {}).setdefault(day, Counter())
+        counts[None] += delta
+        latest = self._latest.setdefault(record.pet_id, {})
+        for key in self._daily_keys(record):
+            counts[key] += delta
+            if delta > 0:
+                # Records with the same timestamp are sorted in as they come
+                if key not in latest or latest[key].timestamp <= record.timestamp:
+                    latest[key] = record
+            elif latest.get(key) is record:
+                self._stale_latest.add(record.pet_id)
+
+    def _rebuild_pets(self, *pet_ids: str) -> None:
+        """Rebuild the columns and daily counts of pets whose records changed."""
+        self._rebuild_series(*pet_ids)
+        if self._daily_keys is None:
+            return
+        for pet_id in pet_ids:
+            self._daily.pop(pet_id, None)
+            self._latest.pop(pet_id, None)
+            for record in self._data.get(pet_id, []):
+                self._count(record, 1)
+
+    def _refresh_latest(self) -> None:
+        """Look up the newest records again after some of them changed."""
+        while self._stale_latest:
+            pet_id = self._stale_latest.pop()
+            latest: dict[str, _RecordT] = {}
+            for record in self._data.get(pet_id, []):
+                for key in self._daily_keys(record):
+                    latest[key] = record
+            self._latest[pet_id] = latest
+
+    def daily_count(
+        self, pet_id: str, key: str | None = None, day: date | None = None
+    ) -> int:
+        """Return how many of a pet's records fall on a local day, today by default.
+
+        With a key, only the records daily_keys returned it for are counted.
+        """
+        self._materialize()
+        counts = self._daily.get(pet_id, {}).get(day or dt_util.now().date())
+        return counts[key] if counts else 0
+
+    def latest(self, pet_id: str, key: str) -> _RecordT | None:
+        """Return a pet's newest hot record daily_keys returned a key for."""
+        self._materialize()
+        return self._latest.get(pet_id, {}).get(key)
+
+    def series(self, pet_id: str) -> NumericSeries:
+        """Return the value columns of a pet's hot records."""
+        self._materialize()
+        return self._series.get(pet_id) or NumericSeries()
+
+    def get(self, record_id: str) -> _RecordT | None:
+        """Return a hot record by its ID."""
+        self._materialize()
+        return self._index.get(record_id)
+
+    def pet_ids(self) -> set[str]:
+        """Return the IDs of pets with hot records, without decoding them."""
+        return set(self._data if self._raw is None else self._raw)
+
+    def count(self, pet_id: str) -> int:
+        """Return how many hot records a pet has, without decoding them."""
+        records = self._data if self._raw is None else self._raw
+        return len(records.get(pet_id, []))
+
+    def _stored(self, pet_id: str) -> list[dict]:
+        """Return a pet's hot records as they are written to its shard."""
+        if self._raw is not None:
+            return self._raw.get(pet_id, [])
+        return [record.to_storage_dict() for record in self._data.get(pet_id, [])]
+
+    def _shard(self, pet_id: str) -> _ShardStore:
+        """Return the store holding one pet's hot records."""
+        if (store := self._shards.get(pet_id)) is None:
+            store = self._shards[pet_id] = _ShardStore(
+                self._hass, f"{self._key}.{pet_id}", self._record_type
+            )
+        return store
+
+    def _segment(self, pet_id: str, month: str) -> _RecordStore:
+        """Return the store holding one pet's frozen records of a month.
+
+        Segments in an older version are upgraded when read and written in
+        the current version the next time records are frozen into them.
+        """
+        return _RecordStore(
+            self._hass, f"{self._key}.{pet_id}.{month}", self._record_type
+        )
+
+    def _frozen_months(self, pet_id: str) -> list[str]:
+        """Return the months of a pet that are only stored in segments."""
+        months = self._manifest.segments.get(self._key, {}).get(pet_id, set())
+        return sorted(months - self._thawed.get(pet_id, set()))
+
+    async def async_load(self) -> None:
+        """Load the hot shards and replay any journaled records on top."""
+        if self._key not in self._manifest.shards:
+            await self._async_migrate_legacy()
+
+        pet_ids = list(self._manifest.shards[self._key])
+        shards = await asyncio.gather(
+            *(self._shard(pet_id).async_load() for pet_id in pet_ids)
+        )
+        stored = {
+            pet_id: shard["records"] if shard else []
+            for pet_id, shard in zip(pet_ids, shards)
+        }
+        compacted = {
+            pet_id: shard["journal"] for pet_id, shard in zip(pet_ids, shards) if shard
+        }
+        # Shards upgraded from an older version are rewritten once
+        self._dirty_pets.update(
+            pet_id for pet_id in pet_ids if self._shard(pet_id).migrated
+        )
+
+        generation, journal = await self._hass.async_add_executor_job(
+            _read_journal, self._journal_path
+        )
+        journaled: dict[str, list[dict]] = {}
+        for record in journal:
+            if isinstance(record["timestamp"], str):
+                # Line written before the upgrade to storage version 2
+                record = _upgrade(self._record_type, record, with_pet_id=True)
+            journaled.setdefault(record.pop("pet_id"), []).append(record)
+        for pet_id, records in journaled.items():
+            # Shards saved by an interrupted compaction hold their lines
+            if generation is None or compacted.get(pet_id, 0) < generation:
+                stored.setdefault(pet_id, []).extend(records)
+                self._dirty_pets.add(pet_id)
+        # Stays above every shard's generation, so none skips its lines
+        self._generation = (
+            generation
+            if generation is not None
+            else max(compacted.values(), default=0) + 1
+        )
+
+        if self._lazy:
+            self._raw = stored
+        else:
+            self._set_data(
+                await self._hass.async_add_executor_job(self._decode_pets, stored)
+            )
+
+        if journal:
+            _LOGGER.debug(
+                "Replayed %d journaled records for %s", len(journal), self._key
+            )
+        self._journal_size = len(journal)
+        # Freezes records that left the hot window while we were not running
+        async with self._lock:
+            await self._async_compact()
+
+    async def _async_migrate_legacy(self) -> None:
+        """Split the legacy single file for all pets into per-pet shards.
+
+        The manifest is saved only after every shard is written, so an
+        interrupted migration simply runs again on the next start.
+        """
+        legacy = Store[dict[str, list[dict]]](self._hass, _LEGACY_VERSION, self._key)
+        stored = await legacy.async_load() or {}
+        for pet_id, records in stored.items():
+            await self._shard(pet_id).async_save(
+                {
+                    "journal": 0,
+                    "records": [
+                        _upgrade(self._record_type, record) for record in records
+                    ],
+                }
+            )
+        self._manifest.shards[self._key] = set(stored)
+        if not stored:
+            return
+        self._manifest.dirty = True
+        await self._manifest.async_save()
+        _LOGGER.info(
+            "Migrated %s into per-pet shards for %d pets", self._key, len(stored)
+        )
+        await legacy.async_remove()
+
+    def _decode(self, records: list[dict], pet_id: str) -> list[_RecordT]:
+        """Build a pet's records sorted by timestamp from stored dicts."""
+        from_storage_dict = self._record_type.from_storage_dict
+        decoded = [from_storage_dict(record, pet_id) for record in records]
+        decoded.sort(key=_timestamp)
+        return decoded
+
+    def _decode_pets(self, stored: dict[str, list[dict]]) -> dict[str, list[_RecordT]]:
+        """Build every pet's records from stored dicts, run in the executor."""
+        return {
+            pet_id: self._decode(records, pet_id) for pet_id, records in stored.items()
+        }
+
+    async def async_append(self, record: _RecordT) -> None:
+        """Add a record and queue it as a single journal line.
+
+        Waits for a running compaction, whose shards would otherwise
+        contain the record as well as the journal.
+        """
+        await self.async_materialize()
+        async with self._lock:
+            # Backdated records are inserted at their place in time
+            _normalize(record)
+            insort(self.data.setdefault(record.pet_id, []), record, key=_timestamp)
+            self._add_to_index((record,))
+            if self._value_attr is not None:
+                self._series.setdefault(record.pet_id, NumericSeries()).add(
+                    record.timestamp, getattr(record, self._value_attr)
+                )
+            self._count(record, 1)
+            if self.on_change is not None:
+                self.on_change("inserted", record, record.pet_id)
+            self._pending_lines.append(
+                json_dumps(record.to_storage_dict(with_pet_id=True))
+            )
+            self._journaled_pets.add(record.pet_id)
+        await self._debouncer.async_call()
+
+    def between(
+        self, pet_id: str, start: datetime | None, end: datetime | None
+    ) -> list[_RecordT]:
+        """Return a pet's hot records within an inclusive range."""
+        records = self.data.get(pet_id, [])
+        low, high = 0, len(records)
+        if start is not None:
+            low = bisect_left(records, dt_util.as_utc(start), key=_timestamp)
+        if end is not None:
+            high = bisect_right(records, dt_util.as_utc(end), key=_timestamp)
+        return records[low:high]
+
+    def has_before(self, pet_id: str, end: datetime) -> bool:
+        """Return whether a pet has records before a time in the hot window.
+
+        Frozen months all lie before it, so no segments are read.
+        """
+        if self._frozen_months(pet_id):
+            return True
+        records = self.data.get(pet_id, [])
+        return bool(records) and records[0].timestamp < dt_util.as_utc(end)
+
+    def _is_hot(self, record: _RecordT) -> bool:
+        """Return whether a record is still held in memory."""
+        records = self.data.get(record.pet_id, [])
+        low = bisect_left(records, record.timestamp, key=_timestamp)
+        high = bisect_right(records, record.timestamp, key=_timestamp)
+        return any(hot is record for hot in records[low:high])
+
+    async def async_remove(self, records: Iterable[_RecordT]) -> list[_RecordT]:
+        """Remove hot records, waiting for a running compaction.
+
+        Records frozen since they were looked up are left in their segment
+        and returned, so they can be thawed and removed again.
+        """
+        frozen: list[_RecordT] = []
+        async with self._lock:
+            for record in records:
+                if self._is_hot(record):
+                    self._remove(record)
+                else:
+                    frozen.append(record)
+        return frozen
+
+    async def async_update(
+        self, records: Iterable[_RecordT], update_fn: Callable[[_RecordT], None]
+    ) -> list[_RecordT]:
+        """Change hot records, waiting for a running compaction.
+
+        Records frozen since they were looked up are left unchanged and
+        returned, so they can be thawed and changed again.
+        """
+        frozen: list[_RecordT] = []
+        async with self._lock:
+            for record in records:
+                if self._is_hot(record):
+                    self._update(record, update_fn)
+                else:
+                    frozen.append(record)
+        return frozen
+
+    def _remove(self, record: _RecordT) -> None:
+        """Remove a hot record."""
+        self.data[record.pet_id].remove(record)
+        self._remove_from_index((record,))
+        self._count(record, -1)
+        self._refresh_latest()
+        self._rebuild_series(record.pet_id)
+        if self.on_change is not None:
+            self.on_change("deleted", record, record.pet_id)
+
+    def _update(self, record: _RecordT, update_fn: Callable[[_RecordT], None]) -> None:
+        """Change a hot record, moving it if its pet or timestamp changed."""
+        old_pet_id = record.pet_id
+        old_timestamp = record.timestamp
+        self._count(record, -1)
+        update_fn(record)
+        if record.pet_id != old_pet_id or record.timestamp != old_timestamp:
+            self.data[old_pet_id].remove(record)
+            _normalize(record)
+            insort(self.data.setdefault(record.pet_id, []), record, key=_timestamp)
+        self._count(record, 1)
+        self._refresh_latest()
+        self._rebuild_series(old_pet_id, record.pet_id)
+        if self.on_change is None:
+            return
+        if record.pet_id != old_pet_id:
+            # Moved from one pet to another
+            self.on_change("deleted", record, old_pet_id)
+            self.on_change("inserted", record, record.pet_id)
+        else:
+            self.on_change("updated", record, record.pet_id)
+
+    async def async_schedule_save(self, *pet_ids: str) -> None:
+        """Queue a shard write for pets whose records were changed or removed."""
+        self._dirty_pets.update(pet_ids)
+        await self._debouncer.async_call()
+
+    async def async_get_range(
+        self,
+        pet_id: str,
+        start: datetime | None,
+        end: datetime | None,
+        limit: int | None = None,
+    ) -> list[_RecordT]:
+        """Return a pet's records within a range, reading frozen segments.
+
+        Segments are decoded for this call only and not kept in memory. With
+        a limit only the newest records are returned and segments are read
+        newest first until older months can't add to them. Records sharing
+        the timestamp of the oldest one returned are all included.
+        """
+        start = start and dt_util.as_utc(start)
+        end = end and dt_util.as_utc(end)
+        await self.async_materialize()
+        records = self.between(pet_id, start, end)
+        async with self._lock:
+            for month in reversed(self._frozen_months(pet_id)):
+                if (start and month < _segment_month(start)) or (
+                    end and month > _segment_month(end)
+                ):
+                    continue
+                if limit is not None and len(records) >= limit:
+                    # Thawed segments and records kept hot can predate
+                    # frozen months, so check the records found so far
+                    records.sort(key=_timestamp)
+                    if _segment_month(records[-limit].timestamp) > month:
+                        break
+                stored = await self._segment(pet_id, month).async_load() or []
+                records.extend(
+                    record
+                    for record in await self._hass.async_add_executor_job(
+                        self._decode, stored, pet_id
+                    )
+                    if _in_range(record.timestamp, start, end)
+                )
+        records.sort(key=_timestamp)
+        if limit is not None and len(records) > limit:
+            oldest = records[-limit].timestamp
+            records = records[bisect_left(records, oldest, key=_timestamp) :]
+        return records
+
+    async def async_thaw(self, record_id: str) -> bool:
+        """Load the frozen segment holding a record back into memory.
+
+        IDs found in no segment are remembered until segments are written
+        again, so looking them up again reads nothing. Returns True if a
+        segment was thawed. It is rewritten from memory the next time the
+        pet is compacted, so thawed records can be changed or removed like
+        hot ones.
+        """
+        if record_id in self._missing_ids:
+            return False
+        await self.async_materialize()
+        async with self._lock:
+            for pet_id in list(self._manifest.segments.get(self._key, {})):
+                for month in reversed(self._frozen_months(pet_id)):
+                    stored = await self._segment(pet_id, month).async_load() or []
+                    if not any(
+                        record.get(self._id_attr) == record_id for record in stored
+                    ):
+                        continue
+                    thawed = await self._hass.async_add_executor_job(
+                        self._decode, stored, pet_id
+                    )
+                    self._add_to_index(thawed)
+                    thawed.extend(self.data.get(pet_id, []))
+                    thawed.sort(key=_timestamp)
+                    self.data[pet_id] = thawed
+                    self._rebuild_pets(pet_id)
+                    self._thawed.setdefault(pet_id, set()).add(month)
+                    return True
+            self._missing_ids[record_id] = None
+            if len(self._missing_ids) > MISSING_ID_CACHE_SIZE:
+                del self._missing_ids[next(iter(self._missing_ids))]
+        return False
+
+    async def async_flush(self) -> None:
+        """Write all queued changes now."""
+        self._debouncer.async_cancel()
+        async with self._lock:
+            await self._async_write()
+        if self._pending_lines or self._dirty_pets:
+            # Changed while writing, the debouncer drops calls made while it
+            # runs, so it is called again once this flush has returned
+            self._hass.async_create_task(self._debouncer.async_call())
+
+    async def _async_write(self) -> None:
+        """Append the queued lines to the journal, or compact it."""
+        if (
+            self._dirty_pets
+            or self._journal_size + len(self._pending_lines)
+            >= JOURNAL_COMPACT_THRESHOLD
+            or self._first_hot_month != _first_hot_month()
+        ):
+            await self._async_compact()
+            return
+        if not self._pending_lines:
+            return
+        lines, self._pending_lines = self._pending_lines, []
+        await self._hass.async_add_executor_job(
+            _append_journal,
+            self._journal_path,
+            lines,
+            None if self._journal_size else self._generation,
+        )
+        self._journal_size += len(lines)
+
+    async def _async_compact(self) -> None:
+        """Write the shards that are behind and drop the journal."""
+        # The shards cover every queued line. Appends wait for the lock, so
+        # none are added while they are written, records changed or
+        # removed meanwhile mark their pet dirty for the next flush.
+        pet_ids = self._dirty_pets | self._journaled_pets
+        self._pending_lines.clear()
+        self._dirty_pets = set()
+        self._journaled_pets = set()
+
+        # A lazy collection is only frozen once it has been decoded, the
+        # unset _first_hot_month makes the next flush after that do it
+        if self._raw is None:
+            first_hot_month = _first_hot_month()
+            if first_hot_month != self._first_hot_month:
+                # A month left the hot window, it must be frozen for every pet
+                self._first_hot_month = first_hot_month
+                pet_ids |= await self._async_freeze(list(self.data), first_hot_month)
+            else:
+                pet_ids |= await self._async_freeze(pet_ids, first_hot_month)
+
+        for pet_id in pet_ids:
+            self._manifest.add(self._key, pet_id)
+        # Register new shards first so a written shard is never orphaned
+        await self._manifest.async_save()
+        for pet_id in pet_ids:
+            await self._shard(pet_id).async_save(
+                {"journal": self._generation, "records": self._stored(pet_id)}
+            )
+        if self._journal_size:
+            await self._hass.async_add_executor_job(
+                _remove_journal, self._journal_path
+            )
+            self._journal_size = 0
+        # Lines appended from now on are in no shard yet
+        self._generation += 1
+
+    async def _async_freeze(
+        self, pet_ids: Iterable[str], first_hot_month: str
+    ) -> set[str]:
+        """Move records older than the hot window into monthly segments.
+
+        Returns the pets whose hot records changed.
+        """
+        changed: set[str] = set()
+        for pet_id in pet_ids:
+            records = self.data.get(pet_id, [])
+            thawed = self._thawed.pop(pet_id, set())
+            cold: dict[str, list[_RecordT]] = {month: [] for month in thawed}
+            newest = self._newest(records)
+            for record in records[:-1]:
+                if id(record) in newest:
+                    continue
+                if (self._keep_hot is None or not self._keep_hot(record)) and (
+                    month := _segment_month(record.timestamp)
+                ) < first_hot_month:
+                    cold.setdefault(month, []).append(record)
+            if not cold:
+                continue
+
+            for month, month_records in cold.items():
+                await self._async_write_segment(
+                    pet_id, month, month_records, replace=month in thawed
+                )
+            # Records may have been added while the segments were written
+            frozen = {id(record) for batch in cold.values() for record in batch}
+            for batch in cold.values():
+                self._remove_from_index(batch)
+            self.data[pet_id] = [
+                record
+                for record in self.data.get(pet_id, [])
+                if id(record) not in frozen
+            ]
+            self._rebuild_pets(pet_id)
+            changed.add(pet_id)
+        return changed
+
+    def _newest(self, records: list[_RecordT]) -> set[int]:
+        """Return the ids of the newest record per newest_keys key."""
+        if self._newest_keys is None:
+            return set()
+        newest: dict[str, _RecordT] = {}
+        for record in records:
+            for key in self._newest_keys(record):
+                newest[key] = record
+        return {id(record) for record in newest.values()}
+
+    async def async_expire(
+        self,
+        pet_id: str,
+        horizon: datetime,
+        roll_up: Callable[[list[_RecordT]], Awaitable[None]],
+    ) -> int:
+        """Drop a pet's frozen records older than the horizon.
+
+        Every month's expired records are passed to roll_up before its
+        segment is rewritten without them. Hot records are never expired.
+        Returns the number of expired records.
+        """
+        expired = 0
+        async with self._lock:
+            for month in self._frozen_months(pet_id):
+                if month > _segment_month(horizon):
+                    break
+                stored = await self._segment(pet_id, month).async_load() or []
+                records = await self._hass.async_add_executor_job(
+                    self._decode, stored, pet_id
+                )
+                if not (cut := bisect_left(records, horizon, key=_timestamp)):
+                    continue
+                await roll_up(records[:cut])
+                await self._async_write_segment(
+                    pet_id, month, records[cut:], replace=True
+                )
+                expired += cut
+        return expired
+
+    @property
+    def field_names(self) -> tuple[str, ...]:
+        """Return the names of the record fields."""
+        return tuple(field.name for field in fields(self._record_type))
+
+    @property
+    def metrics(self) -> tuple[str, ...]:
+        """Return what rollups summarize, "value" standing for the value_attr."""
+        if self._value_attr is None:
+            return self._rollup_fields
+        return (*self._rollup_fields, "value")
+
+    def summarize(
+        self,
+        rollups: dict[str, dict[str, Any]],
+        records: list[_RecordT],
+        key: Callable[[datetime], str] = rollup_day,
+        metrics: Iterable[str] | None = None,
+    ) -> None:
+        """Fold records into a pet's daily rollups, or the ones key picks.
+
+        metrics limits what is summarized besides the count.
+        """
+        if metrics is None:
+            add_to_rollups(
+                rollups, records, self._rollup_fields, self._value_attr, key
+            )
+            return
+        metrics = set(metrics)
+        add_to_rollups(
+            rollups,
+            records,
+            [name for name in self._rollup_fields if name in metrics],
+            self._value_attr if "value" in metrics else None,
+            key,
+        )
+
+    async def _async_write_segment(
+        self, pet_id: str, month: str, records: list[_RecordT], replace: bool
+    ) -> None:
+        """Add records to a monthly segment, or replace a thawed segment."""
+        self._missing_ids.clear()
+        store = self._segment(pet_id, month)
+        stored: list[dict] = [] if replace else (await store.async_load() or [])
+        # A shard that was not saved after its records were frozen still
+        # holds them, freezing them again must not duplicate them
+        frozen = {json_dumps(record) for record in stored}
+        for record in records:
+            data = record.to_storage_dict()
+            if json_dumps(data) not in frozen:
+                stored.append(data)
+
+        if not stored:
+            self._manifest.remove_segment(self._key, pet_id, month)
+            await self._manifest.async_save()
+            await store.async_remove()
+            return
+        self._manifest.add_segment(
+            self._key, pet_id, month, await self._async_summarize_stored(stored, pet_id)
+        )
+        await self._manifest.async_save()
+        await store.async_save(stored)
+
+    async def _async_summarize_stored(
+        self, stored: list[dict], pet_id: str
+    ) -> dict[str, dict[str, Any]]:
+        """Return the daily rollups of stored records."""
+        rollups: dict[str, dict[str, Any]] = {}
+        self.summarize(
+            rollups,
+            await self._hass.async_add_executor_job(self._decode, stored, pet_id),
+        )
+        return rollups
+
+    async def async_summarize_days(
+        self,
+        rollups: dict[str, dict[str, Any]],
+        pet_id: str,
+        start: date | None,
+        end: date | None,
+        key: Callable[[str], str],
+        metrics: tuple[str, ...],
+    ) -> None:
+        """Fold a pet's stored records from start to before end into rollups.
+
+        key maps each local date (YYYY-MM-DD) to its rollup. Hot records
+        are taken from the daily counts when they cover the metrics and
+        frozen ones from the rollups of their segments, so no segment is
+        read. Segments frozen before their rollups were kept are summarized
+        once.
+        """
+        start_day = start and start.isoformat()
+        end_day = end and end.isoformat()
+
+        def in_range(day: str) -> bool:
+            return (start_day is None or day >= start_day) and (
+                end_day is None or day < end_day
+            )
+
+        fields = [name for name in self._rollup_fields if name in metrics]
+        await self.async_materialize()
+        if self._daily_keys is not None and set(fields) <= set(self._counted_fields):
+            days: dict[str, dict[str, Any]] = {}
+            for day, counts in self._daily.get(pet_id, {}).items():
+                if counts[None] and in_range(day.isoformat()):
+                    days[day.isoformat()] = {
+                        "count": counts[None],
+                        **{name: counts[self._counted_fields[name]] for name in fields},
+                    }
+            merge_rollups(rollups, days, fields, False, key)
+        else:
+            hot: dict[str, dict[str, Any]] = {}
+            self.summarize(
+                hot,
+                self.between(
+                    pet_id,
+                    start and dt_util.start_of_local_day(start),
+                    end and dt_util.start_of_local_day(end) - timedelta(microseconds=1),
+                ),
+                metrics=metrics,
+            )
+            merge_rollups(rollups, hot, fields, "value" in metrics, key)
+
+        async with self._lock:
+            segments = self._manifest.segment_rollups.setdefault(
+                self._key, {}
+            ).setdefault(pet_id, {})
+            for month in self._frozen_months(pet_id):
+                if (start_day and month < start_day[:7]) or (
+                    end_day and month > end_day[:7]
+                ):
+                    continue
+                if (days := segments.get(month)) is None:
+                    stored = await self._segment(pet_id, month).async_load() or []
+                    days = await self._async_summarize_stored(stored, pet_id)
+                    self._manifest.add_segment(self._key, pet_id, month, days)
+                merge_rollups(
+                    rollups,
+                    {day: rollup for day, rollup in days.items() if in_range(day)},
+                    fields,
+                    "value" in metrics,
+                    key,
+                )
+            await self._manifest.async_save()
 
 
 class PetHealthStore:
     """Store for pet health data."""
 
-    def __init__(self, hass: HomeAssistant) -> None:
-        """Initialize the store."""
+    def __init__(
+        self, hass: HomeAssistant, save_delay: float = DEFAULT_SAVE_DELAY
+    ) -> None:
+        """Initialize the store.
+
+        Changes are written to disk at most once per save_delay seconds.
+        """
         self.hass = hass
-        self._visits_store = Store[dict[str, list[dict]]](
-            hass, STORAGE_VERSION, STORAGE_KEY_VISITS
+        self._manifest = _ShardManifest(hass)
+        self._visits = _RecordCollection(
+            hass,
+            STORAGE_KEY_VISITS,
+            BathroomVisit,
+            save_delay,
+            self._manifest,
+            # Unconfirmed visits are still being worked on
+            keep_hot=lambda visit: not visit.confirmed,
+            id_attr="visit_id",
+            daily_keys=_visit_daily_keys,
+            counted_fields={"did_pee": "pee", "did_poop": "poop"},
+            # The summary shows the latest of each detail, however old
+            newest_keys=_visit_detail_keys,
+            rollup_fields=(
+                "did_pee",
+                "did_poop",
+                "poop_consistencies",
+                "poop_color",
+                "urine_amount",
+            ),
         )
-        self._medications_store = Store[dict[str, list[dict]]](
-            hass, STORAGE_VERSION, STORAGE_KEY_MEDICATIONS
+        self._medications = _RecordCollection(
+            hass,
+            STORAGE_KEY_MEDICATIONS,
+            MedicationRecord,
+            save_delay,
+            self._manifest,
+            rollup_fields=("medication_name",),
+            # Doses per medication, the last dose of each is shown
+            daily_keys=_medication_daily_keys,
+            newest_keys=_medication_daily_keys,
         )
-        self._drinks_store = Store[dict[str, list[dict]]](
-            hass, STORAGE_VERSION, STORAGE_KEY_DRINKS
+        self._drinks = _RecordCollection(
+            hass,
+            STORAGE_KEY_DRINKS,
+            DrinkRecord,
+            save_delay,
+            self._manifest,
+            rollup_fields=("amount",),
+            daily_keys=_no_daily_keys,
         )
-        self._meals_store = Store[dict[str, list[dict]]](
-            hass, STORAGE_VERSION, STORAGE_KEY_MEALS
+        self._meals = _RecordCollection(
+            hass,
+            STORAGE_KEY_MEALS,
+            MealRecord,
+            save_delay,
+            self._manifest,
+            rollup_fields=("amount",),
+            daily_keys=_no_daily_keys,
         )
-        self._thirst_levels_store = Store[dict[str, list[dict]]](
-            hass, STORAGE_VERSION, STORAGE_KEY_THIRST_LEVELS
+        self._thirst_levels = _RecordCollection(
+            hass,
+            STORAGE_KEY_THIRST_LEVELS,
+            ThirstLevelRecord,
+            save_delay,
+            self._manifest,
+            rollup_fields=("level",),
         )
-        self._appetite_levels_store = Store[dict[str, list[dict]]](
-            hass, STORAGE_VERSION, STORAGE_KEY_APPETITE_LEVELS
+        self._appetite_levels = _RecordCollection(
+            hass,
+            STORAGE_KEY_APPETITE_LEVELS,
+            AppetiteLevelRecord,
+            save_delay,
+            self._manifest,
+            rollup_fields=("level",),
         )
-        self._wellbeing_store = Store[dict[str, list[dict]]](
-            hass, STORAGE_VERSION, STORAGE_KEY_WELLBEING
+        self._wellbeing = _RecordCollection(
+            hass,
+            STORAGE_KEY_WELLBEING,
+            WellbeingRecord,
+            save_delay,
+            self._manifest,
+            rollup_fields=("wellbeing_score", "symptoms"),
         )
-        self._weight_store = Store[dict[str, list[dict]]](
-            hass, STORAGE_VERSION, STORAGE_KEY_WEIGHT
+        self._weight = _RecordCollection(
+            hass,
+            STORAGE_KEY_WEIGHT,
+            WeightRecord,
+            save_delay,
+            self._manifest,
+            value_attr="weight_grams",
         )
-        self._vomit_store = Store[dict[str, list[dict]]](
-            hass, STORAGE_VERSION, STORAGE_KEY_VOMIT
+        # Only read by optional features, decoded on first access
+        self._vomit = _RecordCollection(
+            hass,
+            STORAGE_KEY_VOMIT,
+            VomitRecord,
+            save_delay,
+            self._manifest,
+            lazy=True,
+            rollup_fields=("vomit_type",),
+            daily_keys=_no_daily_keys,
         )
-        self._generic_logs_store = Store[dict[str, list[dict]]](
-            hass, STORAGE_VERSION, STORAGE_KEY_GENERIC_LOGS
+        self._generic_logs = _RecordCollection(
+            hass,
+            STORAGE_KEY_GENERIC_LOGS,
+            GenericLog,
+            save_delay,
+            self._manifest,
+            lazy=True,
+            rollup_fields=("category",),
         )
-        self._blood_glucose_store = Store[dict[str, list[dict]]](
-            hass, STORAGE_VERSION, STORAGE_KEY_BLOOD_GLUCOSE
+        self._blood_glucose = _RecordCollection(
+            hass,
+            STORAGE_KEY_BLOOD_GLUCOSE,
+            BloodGlucoseRecord,
+            save_delay,
+            self._manifest,
+            lazy=True,
+            value_attr="value",
         )
-        self._glycated_hemoglobin_store = Store[dict[str, list[dict]]](
-            hass, STORAGE_VERSION, STORAGE_KEY_GLYCATED_HEMOGLOBIN
+        self._glycated_hemoglobin = _RecordCollection(
+            hass,
+            STORAGE_KEY_GLYCATED_HEMOGLOBIN,
+            GlycatedHemoglobinRecord,
+            save_delay,
+            self._manifest,
+            lazy=True,
+            value_attr="value",
         )
-        self._ketones_store = Store[dict[str, list[dict]]](
-            hass, STORAGE_VERSION, STORAGE_KEY_KETONES
+        self._ketones = _RecordCollection(
+            hass,
+            STORAGE_KEY_KETONES,
+            KetoneRecord,
+            save_delay,
+            self._manifest,
+            lazy=True,
+            value_attr="value",
         )
-        self._visits_data: dict[str, list[BathroomVisit]] = {}
-        self._medications_data: dict[str, list[MedicationRecord]] = {}
-        self._drinks_data: dict[str, list[DrinkRecord]] = {}
-        self._meals_data: dict[str, list[MealRecord]] = {}
-        self._thirst_levels_data: dict[str, list[ThirstLevelRecord]] = {}
-        self._appetite_levels_data: dict[str, list[AppetiteLevelRecord]] = {}
-        self._wellbeing_data: dict[str, list[WellbeingRecord]] = {}
-        self._weight_data: dict[str, list[WeightRecord]] = {}
-        self._vomit_data: dict[str, list[VomitRecord]] = {}
-        self._generic_logs_data: dict[str, list[GenericLog]] = {}
-        self._blood_glucose_data: dict[str, list[BloodGlucoseRecord]] = {}
-        self._glycated_hemoglobin_data: dict[str, list[GlycatedHemoglobinRecord]] = {}
-        self._ketones_data: dict[str, list[KetoneRecord]] = {}
-        self._callbacks: dict[str, list[Callable]] = {}
+        # Keyed by the record type names used by the WebSocket API
+        self._collections: dict[str, _RecordCollection] = {
+            "visits": self._visits,
+            "medications": self._medications,
+            "drinks": self._drinks,
+            "meals": self._meals,
+            "thirst_levels": self._thirst_levels,
+            "appetite_levels": self._appetite_levels,
+            "wellbeing": self._wellbeing,
+            "weight": self._weight,
+            "vomit": self._vomit,
+            "generic_logs": self._generic_logs,
+            "blood_glucose": self._blood_glucose,
+            "glycated_hemoglobin": self._glycated_hemoglobin,
+            "ketones": self._ketones,
+        }
+        # Daily rollups of expired records per record type and pet, and the
+        # stored records rolled up but maybe not yet removed from a segment
+        self._rollups = Store[dict[str, Any]](
+            hass, _ROLLUPS_VERSION, STORAGE_KEY_ROLLUPS
+        )
+        self._rollup_data: dict[str, Any] = {"days": {}, "pending": {}}
+        # Per pet, callbacks and the record types they want, None for all
+        self._callbacks: dict[
+            str, list[tuple[Callable[[str], None], frozenset[str] | None]]
+        ] = {}
+        # Seconds the last async_load took
+        self.load_duration: float | None = None
+        # Recent changes for delta syncs: sequence number, operation, record
+        # type, pet and record. Numbered per epoch, a new one every start
+        self._change_epoch = uuid.uuid4().hex[:12]
+        self._change_seq = 0
+        self._changes: deque[tuple[int, str, str, str, Any]] = deque(
+            maxlen=CHANGE_LOG_SIZE
+        )
+        self._change_listeners: list[Callable[[str, str, str, Any], None]] = []
+        for record_type, collection in self._collections.items():
+            collection.on_change = partial(self._log_change, record_type)
 
     async def async_load(self) -> None:
-        """Load data from storage."""
-        # Load visits
-        stored_visits = await self._visits_store.async_load()
-        if stored_visits:
-            # Convert stored dicts back to BathroomVisit objects
-            for pet_id, visits in stored_visits.items():
-                self._visits_data[pet_id] = [
-                    BathroomVisit.from_dict(visit) for visit in visits
-                ]
-
-        # Load medications
-        stored_medications = await self._medications_store.async_load()
-        if stored_medications:
-            # Convert stored dicts back to MedicationRecord objects
-            for pet_id, medications in stored_medications.items():
-                self._medications_data[pet_id] = [
-                    MedicationRecord.from_dict(med) for med in medications
-                ]
-
-        # Load drink records
-        stored_drinks = await self._drinks_store.async_load()
-        if stored_drinks:
-            for pet_id, records in stored_drinks.items():
-                self._drinks_data[pet_id] = [
-                    DrinkRecord.from_dict(record) for record in records
-                ]
-
-        # Load meal records
-        stored_meals = await self._meals_store.async_load()
-        if stored_meals:
-            for pet_id, records in stored_meals.items():
-                self._meals_data[pet_id] = [
-                    MealRecord.from_dict(record) for record in records
-                ]
-
-        # Load thirst level records
-        stored_thirst_levels = await self._thirst_levels_store.async_load()
-        if stored_thirst_levels:
-            for pet_id, records in stored_thirst_levels.items():
-                self._thirst_levels_data[pet_id] = [
-                    ThirstLevelRecord.from_dict(record) for record in records
-                ]
-
-        # Load appetite level records
-        stored_appetite_levels = await self._appetite_levels_store.async_load()
-        if stored_appetite_levels:
-            for pet_id, records in stored_appetite_levels.items():
-                self._appetite_levels_data[pet_id] = [
-                    AppetiteLevelRecord.from_dict(record) for record in records
-                ]
-
-        # Load wellbeing records
-        stored_wellbeing = await self._wellbeing_store.async_load()
-        if stored_wellbeing:
-            for pet_id, records in stored_wellbeing.items():
-                self._wellbeing_data[pet_id] = [
-                    WellbeingRecord.from_dict(record) for record in records
-                ]
-
-        # Load weight records
-        stored_weight = await self._weight_store.async_load()
-        if stored_weight:
-            for pet_id, records in stored_weight.items():
-                self._weight_data[pet_id] = [
-                    WeightRecord.from_dict(record) for record in records
-                ]
-
-        # Load vomit records
-        stored_vomit = await self._vomit_store.async_load()
-        if stored_vomit:
-            for pet_id, records in stored_vomit.items():
-                self._vomit_data[pet_id] = [
-                    VomitRecord.from_dict(record) for record in records
-                ]
-
-        # Load generic logs
-        stored_generic_logs = await self._generic_logs_store.async_load()
-        if stored_generic_logs:
-            for pet_id, logs in stored_generic_logs.items():
-                self._generic_logs_data[pet_id] = [
-                    GenericLog.from_dict(log) for log in logs
-                ]
-
-        # Load blood glucose records
-        stored_blood_glucose = await self._blood_glucose_store.async_load()
-        if stored_blood_glucose:
-            for pet_id, records in stored_blood_glucose.items():
-                self._blood_glucose_data[pet_id] = [
-                    BloodGlucoseRecord.from_dict(record) for record in records
-                ]
-
-        # Load glycated hemoglobin records
-        stored_glycated_hemoglobin = await self._glycated_hemoglobin_store.async_load()
-        if stored_glycated_hemoglobin:
-            for pet_id, records in stored_glycated_hemoglobin.items():
-                self._glycated_hemoglobin_data[pet_id] = [
-                    GlycatedHemoglobinRecord.from_dict(record) for record in records
-                ]
-
-        # Load ketone records
-        stored_ketones = await self._ketones_store.async_load()
-        if stored_ketones:
-            for pet_id, records in stored_ketones.items():
-                self._ketones_data[pet_id] = [
-                    KetoneRecord.from_dict(record) for record in records
-                ]
+        """Load data from storage.
+
+        All record types load concurrently and are decoded in the executor,
+        the time it took is kept in load_duration.
+        """
+        start = time.monotonic()
+        await self._manifest.async_load()
+        await asyncio.gather(
+            *(collection.async_load() for collection in self._collections.values())
+        )
+        if stored := await self._rollups.async_load():
+            self._rollup_data = {
+                "days": stored["days"],
+                "pending": stored.get("pending", {}),
+            }
+        self.load_duration = time.monotonic() - start
+        _LOGGER.debug("Loaded pet health data in %.3f seconds", self.load_duration)
+
+    async def async_flush(self) -> None:
+        """Write all queued changes to disk, e.g. before shutdown."""
+        await asyncio.gather(
+            *(collection.async_flush() for collection in self._collections.values())
+        )
+
+    def pet_ids(self) -> set[str]:
+        """Return the IDs of all pets that have stored records."""
+        pet_ids: set[str] = set()
+        for collection in self._collections.values():
+            pet_ids.update(collection.pet_ids())
+        return pet_ids
+
+    def record_counts(self, pet_id: str) -> dict[str, int]:
+        """Return how many records of each type are kept in memory for a pet."""
+        return {
+            record_type: collection.count(pet_id)
+            for record_type, collection in self._collections.items()
+        }
+
+    def has_records_before(
+        self, record_type: str, pet_id: str, end: datetime
+    ) -> bool:
+        """Return whether a pet has records of a type before a time.
+
+        The time must not lie before hot_window_start, then no frozen
+        segments are read.
+        """
+        return self._collections[record_type].has_before(pet_id, end)
+
+    def record_types(self) -> list[str]:
+        """Return the names of all stored record types."""
+        return list(self._collections)
+
+    async def async_get_records(
+        self,
+        record_type: str,
+        pet_id: str,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        limit: int | None = None,
+    ) -> list[Any]:
+        """Get a pet's records of one type, including frozen history.
+
+        Unlike the get_* methods, which only cover the records kept in
+        memory, this reads the monthly segments overlapping the range. With
+        a limit, only the newest records are read, plus any sharing the
+        timestamp of the oldest of them.
+        """
+        return await self._collections[record_type].async_get_range(
+            pet_id, start, end, limit
+        )
+
+    async def async_apply_retention(
+        self, pet_id: str, retention: dict[str, int]
+    ) -> int:
+        """Expire a pet's records past their retention into daily rollups.
+
+        The retention maps record types to the days their records are kept,
+        0 keeps them forever. Records are always kept for HOT_WINDOW_DAYS.
+        Returns the number of expired records.
+        """
+        now = dt_util.now()
+        expired = 0
+        for record_type, days in retention.items():
+            if not days or record_type not in self._collections:
+                continue
+            horizon = now - timedelta(days=max(days, HOT_WINDOW_DAYS))
+            expired += await self._collections[record_type].async_expire(
+                pet_id, horizon, partial(self._async_roll_up, record_type, pet_id)
+            )
+        # Every segment rolled up from has been rewritten without its records
+        pending = [
+            self._rollup_data["pending"].get(record_type, {}).pop(pet_id, None)
+            for record_type in retention
+        ]
+        if any(records is not None for records in pending):
+            await self._rollups.async_save(self._rollup_data)
+        if expired:
+            _LOGGER.debug("Rolled up %d expired records of pet %s", expired, pet_id)
+        return expired
+
+    async def _async_roll_up(
+        self, record_type: str, pet_id: str, records: list[Any]
+    ) -> None:
+        """Add expired records to the rollups and save them.
+
+        The rollups are saved with the records as pending before they are
+        removed from their segment. When that is interrupted, the pending
+        records are skipped the next time the segment is expired.
+        """
+        pending = self._rollup_data["pending"].setdefault(record_type, {})
+        stored = [record.to_storage_dict() for record in records]
+        rolled_up = Counter(json_dumps(record) for record in pending.get(pet_id, ()))
+        new_records = []
+        for record, stored_record in zip(records, stored, strict=True):
+            if rolled_up[line := json_dumps(stored_record)]:
+                rolled_up[line] -= 1
+            else:
+                new_records.append(record)
+        days = self._rollup_data["days"].setdefault(record_type, {})
+        self._collections[record_type].summarize(
+            days.setdefault(pet_id, {}), new_records
+        )
+        pending[pet_id] = stored
+        await self._rollups.async_save(self._rollup_data)
+
+    def get_daily_rollups(
+        self,
+        record_type: str,
+        pet_id: str,
+        start: date | None = None,
+        end: date | None = None,
+    ) -> dict[str, dict[str, Any]]:
+        """Get a pet's daily rollups of expired records, keyed by local date."""
+        days = self._rollup_data["days"].get(record_type, {}).get(pet_id, {})
+        return {
+            day: rollup
+            for day, rollup in sorted(days.items())
+            if (start is None or day >= start.isoformat())
+            and (end is None or day <= end.isoformat())
+        }
+
+    def get_record_fields(self, record_type: str) -> tuple[str, ...]:
+        """Get the names of the fields records of a type have."""
+        return self._collections[record_type].field_names
+
+    def get_aggregate_metrics(self, record_type: str) -> tuple[str, ...]:
+        """Get the metrics records of a type can be aggregated by.
+
+        Besides their count, these are the rollup fields of the type and,
+        for measurements, "value" for the min, mean and max.
+        """
+        return self._collections[record_type].metrics
+
+    async def async_get_aggregates(
+        self,
+        record_type: str,
+        pet_id: str,
+        bucket: str,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        metrics: Iterable[str] | None = None,
+    ) -> dict[str, dict[str, Any]]:
+        """Aggregate a pet's records of one type per hour, day, week or month.
+
+        Buckets are keyed by their local start time, oldest first, and only
+        those with records are returned. They hold what a daily rollup
+        does, limited to the metrics, for the records from start to before
+        end. Day, week and month buckets are built from daily counts and
+        rollups, so their start and end must be at local midnight. Hour
+        buckets read the records and leave out expired ones.
+        """
+        collection = self._collections[record_type]
+        metrics = collection.metrics if metrics is None else tuple(metrics)
+        buckets: dict[str, dict[str, Any]] = {}
+
+        if bucket == "hour":
+            collection.summarize(
+                buckets,
+                await collection.async_get_range(
+                    pet_id, start, end and end - timedelta(microseconds=1)
+                ),
+                lambda timestamp: bucket_start(timestamp, bucket).isoformat(),
+                metrics,
+            )
+        else:
+            if any(
+                value is not None and bucket_start(value, "day") != value
+                for value in (start, end)
+            ):
+                raise ValueError(
+                    f"{bucket} buckets must start and end at local midnight"
+                )
+            start_day = start and dt_util.as_local(start).date()
+            end_day = end and dt_util.as_local(end).date()
+
+            def day_key(day: str) -> str:
+                return bucket_start(
+                    dt_util.start_of_local_day(date.fromisoformat(day)), bucket
+                ).isoformat()
+
+            merge_rollups(
+                buckets,
+                self.get_daily_rollups(
+                    record_type,
+                    pet_id,
+                    start_day,
+                    end_day and end_day - timedelta(days=1),
+                ),
+                metrics,
+                "value" in metrics,
+                day_key,
+            )
+            await collection.async_summarize_days(
+                buckets, pet_id, start_day, end_day, day_key, metrics
+            )
+        # Local start times sort as text, except around DST changes
+        return dict(
+            sorted(buckets.items(), key=lambda item: datetime.fromisoformat(item[0]))
+        )
+
+    def get_daily_count(
+        self,
+        record_type: str,
+        pet_id: str,
+        key: str | None = None,
+        day: date | None = None,
+    ) -> int:
+        """Get how many records of a type a pet has on a local day, today by default.
+
+        The counts are kept up to date as records change, see daily_keys for
+        the keys each record type is counted under.
+        """
+        return self._collections[record_type].daily_count(pet_id, key, day)
+
+    def get_latest_record(self, record_type: str, pet_id: str, key: str) -> Any | None:
+        """Get a pet's newest record of a type counted under a daily key.
+
+        Medication doses are kept by medication ID, or by name for doses
+        logged without one.
+        """
+        return self._collections[record_type].latest(pet_id, key)
 
     async def async_save_visit(self, visit: BathroomVisit) -> None:
         """Save a bathroom visit."""
-        if visit.pet_id not in self._visits_data:
-            self._visits_data[visit.pet_id] = []
-        self._visits_data[visit.pet_id].append(visit)
-
-        # Convert to storable format
-        store_data = {
-            pet_id: [v.to_dict() for v in visits]
-            for pet_id, visits in self._visits_data.items()
-        }
-        await self._visits_store.async_save(store_data)
+        await self._visits.async_append(visit)
 
         # Notify callbacks to update sensors immediately
-        self._notify_callbacks(visit.pet_id)
+        self._notify_callbacks(visit.pet_id, "visits")
 
     async def async_save_medication(self, medication: MedicationRecord) -> None:
         """Save a medication record."""
-        if medication.pet_id not in self._medications_data:
-            self._medications_data[medication.pet_id] = []
-        self._medications_data[medication.pet_id].append(medication)
-
-        # Convert to storable format
-        store_data = {
-            pet_id: [m.to_dict() for m in meds]
-            for pet_id, meds in self._medications_data.items()
-        }
-        await self._medications_store.async_save(store_data)
+        await self._medications.async_append(medication)
 
         # Notify callbacks to update sensors immediately
-        self._notify_callbacks(medication.pet_id)
+        self._notify_callbacks(medication.pet_id, "medications")
 
     def get_visits(self, pet_id: str) -> list[BathroomVisit]:
         """Get all visits for a pet."""
-        return self._visits_data.get(pet_id, [])
+        return self._visits.data.get(pet_id, [])
+
+    def get_visits_between(
+        self, pet_id: str, start: datetime | None = None, end: datetime | None = None
+    ) -> list[BathroomVisit]:
+        """Get visits for a pet within a time range."""
+        return self._visits.between(pet_id, start, end)
 
     def get_medications(self, pet_id: str) -> list[MedicationRecord]:
         """Get all medications for a pet."""
-        return self._medications_data.get(pet_id, [])
+        return self._medications.data.get(pet_id, [])
+
+    def get_medications_between(
+        self, pet_id: str, start: datetime | None = None, end: datetime | None = None
+    ) -> list[MedicationRecord]:
+        """Get medications for a pet within a time range."""
+        return self._medications.between(pet_id, start, end)
 
     def find_visit(self, visit_id: str) -> tuple[str, BathroomVisit] | None:
         """Find a visit by ID. Returns (pet_id, visit) or None."""
-        for pet_id, visits in self._visits_data.items():
-            for visit in visits:
-                if visit.visit_id == visit_id:
-                    return (pet_id, visit)
+        if (visit := self._visits.get(visit_id)) is None:
+            return None
+        return (visit.pet_id, visit)
+
+    async def async_find_visit(self, visit_id: str) -> tuple[str, BathroomVisit] | None:
+        """Find a visit by ID, including frozen history.
+
+        A visit found in a frozen segment is loaded back into memory so it
+        can be updated or deleted.
+        """
+        if result := self.find_visit(visit_id):
+            return result
+        if await self._visits.async_thaw(visit_id):
+            return self.find_visit(visit_id)
         return None
 
     async def async_update_visit(
         self, visit_id: str, update_fn: Callable[[BathroomVisit], None]
     ) -> bool:
         """Update a visit by ID. Returns True if found and updated."""
-        result = self.find_visit(visit_id)
-        if not result:
-            return False
-
-        old_pet_id, visit = result
-        # Apply the update
-        update_fn(visit)
-
-        # If pet was changed, move visit to new pet's list BEFORE saving
-        if visit.pet_id != old_pet_id:
-            self._visits_data[old_pet_id].remove(visit)
-            if visit.pet_id not in self._visits_data:
-                self._visits_data[visit.pet_id] = []
-            self._visits_data[visit.pet_id].append(visit)
-
-        # Save to storage (after move if needed)
-        visits_dict = {
-            pet_id: [visit.to_dict() for visit in visits]
-            for pet_id, visits in self._visits_data.items()
-        }
-        await self._visits_store.async_save(visits_dict)
-
-        # Notify callbacks for old pet
-        self._notify_callbacks(old_pet_id)
-        # If pet was changed, notify new pet too
-        if visit.pet_id != old_pet_id:
-            self._notify_callbacks(visit.pet_id)
-
-        return True
+        return bool(await self.async_bulk_update_visits([visit_id], update_fn))
 
     async def async_delete_visit(self, visit_id: str) -> bool:
         """Delete a visit by ID. Returns True if found and deleted."""
-        result = self.find_visit(visit_id)
-        if not result:
-            return False
-
-        pet_id, visit = result
-        # Remove from list
-        self._visits_data[pet_id].remove(visit)
-
-        # Save to storage
-        visits_dict = {
-            pet_id: [visit.to_dict() for visit in visits]
-            for pet_id, visits in self._visits_data.items()
-        }
-        await self._visits_store.async_save(visits_dict)
-
-        # Notify callbacks
-        self._notify_callbacks(pet_id)
-
-        return True
+        return bool(await self.async_bulk_delete_visits([visit_id]))
+
+    async def _async_select_visits(
+        self, visits: Iterable[str] | Callable[[BathroomVisit], bool]
+    ) -> list[BathroomVisit]:
+        """Resolve visit IDs, or a predicate over the hot visits, to visits."""
+        if callable(visits):
+            return [
+                visit
+                for pet_visits in self._visits.data.values()
+                for visit in pet_visits
+                if visits(visit)
+            ]
+        selected: list[BathroomVisit] = []
+        for visit_id in dict.fromkeys(visits):
+            if result := await self.async_find_visit(visit_id):
+                selected.append(result[1])
+        return selected
+
+    async def async_bulk_update_visits(
+        self,
+        visits: Iterable[str] | Callable[[BathroomVisit], bool],
+        update_fn: Callable[[BathroomVisit], None],
+    ) -> list[BathroomVisit]:
+        """Update many visits with one save and one notification per pet.
+
+        visits is either a list of visit IDs or a predicate, which is only
+        applied to visits kept in memory. Returns the updated visits.
+        """
+        selected = await self._async_select_visits(visits)
+        updated: list[BathroomVisit] = []
+        changed_pet_ids: set[str] = set()
+        while selected:
+            changed_pet_ids.update(visit.pet_id for visit in selected)
+            # Moves the visit if its pet or time was changed, BEFORE saving
+            frozen = await self._visits.async_update(selected, update_fn)
+            frozen_ids = {visit.visit_id for visit in frozen}
+            for visit in selected:
+                if visit.visit_id not in frozen_ids:
+                    updated.append(visit)
+                    changed_pet_ids.add(visit.pet_id)
+            # Visits frozen while they were looked up are thawed again
+            selected = await self._async_select_visits(frozen_ids)
+
+        if changed_pet_ids:
+            # Changed records can't be journaled, rewrite the affected shards
+            await self._visits.async_schedule_save(*changed_pet_ids)
+            for pet_id in changed_pet_ids:
+                self._notify_callbacks(pet_id, "visits")
+
+        return updated
+
+    async def async_bulk_delete_visits(
+        self, visits: Iterable[str] | Callable[[BathroomVisit], bool]
+    ) -> list[BathroomVisit]:
+        """Delete many visits with one save and one notification per pet.
+
+        visits is either a list of visit IDs or a predicate, which is only
+        applied to visits kept in memory. Returns the deleted visits.
+        """
+        selected = await self._async_select_visits(visits)
+        deleted: list[BathroomVisit] = []
+        while selected:
+            frozen = await self._visits.async_remove(selected)
+            frozen_ids = {visit.visit_id for visit in frozen}
+            deleted.extend(
+                visit for visit in selected if visit.visit_id not in frozen_ids
+            )
+            # Visits frozen while they were looked up are thawed again
+            selected = await self._async_select_visits(frozen_ids)
+
+        if changed_pet_ids := {visit.pet_id for visit in deleted}:
+            await self._visits.async_schedule_save(*changed_pet_ids)
+            for pet_id in changed_pet_ids:
+                self._notify_callbacks(pet_id, "visits")
+
+        return deleted
 
     async def async_save_drink(self, record: DrinkRecord) -> None:
         """Save a drink record."""
-        if record.pet_id not in self._drinks_data:
-            self._drinks_data[record.pet_id] = []
-        self._drinks_data[record.pet_id].append(record)
-
-        # Convert to storable format
-        store_data = {
-            pet_id: [r.to_dict() for r in records]
-            for pet_id, records in self._drinks_data.items()
-        }
-        await self._drinks_store.async_save(store_data)
+        await self._drinks.async_append(record)
 
         # Notify callbacks to update sensors immediately
-        self._notify_callbacks(record.pet_id)
+        self._notify_callbacks(record.pet_id, "drinks")
 
     async def async_save_meal(self, record: MealRecord) -> None:
         """Save a meal record."""
-        if record.pet_id not in self._meals_data:
-            self._meals_data[record.pet_id] = []
-        self._meals_data[record.pet_id].append(record)
-
-        # Convert to storable format
-        store_data = {
-            pet_id: [r.to_dict() for r in records]
-            for pet_id, records in self._meals_data.items()
-        }
-        await self._meals_store.async_save(store_data)
+        await self._meals.async_append(record)
 
         # Notify callbacks to update sensors immediately
-        self._notify_callbacks(record.pet_id)
+        self._notify_callbacks(record.pet_id, "meals")
 
     async def async_save_thirst_level(self, record: ThirstLevelRecord) -> None:
         """Save a thirst level record."""
-        if record.pet_id not in self._thirst_levels_data:
-            self._thirst_levels_data[record.pet_id] = []
-        self._thirst_levels_data[record.pet_id].append(record)
-
-        # Convert to storable format
-        store_data = {
-            pet_id: [r.to_dict() for r in records]
-            for pet_id, records in self._thirst_levels_data.items()
-        }
-        await self._thirst_levels_store.async_save(store_data)
+        await self._thirst_levels.async_append(record)
 
         # Notify callbacks to update sensors immediately
-        self._notify_callbacks(record.pet_id)
+        self._notify_callbacks(record.pet_id, "thirst_levels")
 
     async def async_save_appetite_level(self, record: AppetiteLevelRecord) -> None:
         """Save an appetite level record."""
-        if record.pet_id not in self._appetite_levels_data:
-            self._appetite_levels_data[record.pet_id] = []
-        self._appetite_levels_data[record.pet_id].append(record)
-
-        # Convert to storable format
-        store_data = {
-            pet_id: [r.to_dict() for r in records]
-            for pet_id, records in self._appetite_levels_data.items()
-        }
-        await self._appetite_levels_store.async_save(store_data)
+        await self._appetite_levels.async_append(record)
 
         # Notify callbacks to update sensors immediately
-        self._notify_callbacks(record.pet_id)
+        self._notify_callbacks(record.pet_id, "appetite_levels")
 
     async def async_save_wellbeing(self, record: WellbeingRecord) -> None:
         """Save a wellbeing record."""
-        if record.pet_id not in self._wellbeing_data:
-            self._wellbeing_data[record.pet_id] = []
-        self._wellbeing_data[record.pet_id].append(record)
-
-        # Convert to storable format
-        store_data = {
-            pet_id: [r.to_dict() for r in records]
-            for pet_id, records in self._wellbeing_data.items()
-        }
-        await self._wellbeing_store.async_save(store_data)
+        await self._wellbeing.async_append(record)
 
         # Notify callbacks to update sensors immediately
-        self._notify_callbacks(record.pet_id)
+        self._notify_callbacks(record.pet_id, "wellbeing")
 
     async def async_save_weight(self, record: WeightRecord) -> None:
         """Save a weight record."""
-        if record.pet_id not in self._weight_data:
-            self._weight_data[record.pet_id] = []
-        self._weight_data[record.pet_id].append(record)
-
-        # Convert to storable format
-        store_data = {
-            pet_id: [r.to_dict() for r in records]
-            for pet_id, records in self._weight_data.items()
-        }
-        await self._weight_store.async_save(store_data)
+        await self._weight.async_append(record)
 
         # Notify callbacks to update sensors immediately
-        self._notify_callbacks(record.pet_id)
+        self._notify_callbacks(record.pet_id, "weight")
 
     async def async_save_vomit(self, record: VomitRecord) -> None:
         """Save a vomit record."""
-        if record.pet_id not in self._vomit_data:
-            self._vomit_data[record.pet_id] = []
-        self._vomit_data[record.pet_id].append(record)
-
-        # Convert to storable format
-        store_data = {
-            pet_id: [r.to_dict() for r in records]
-            for pet_id, records in self._vomit_data.items()
-        }
-        await self._vomit_store.async_save(store_data)
+        await self._vomit.async_append(record)
 
         # Notify callbacks to update sensors immediately
-        self._notify_callbacks(record.pet_id)
+        self._notify_callbacks(record.pet_id, "vomit")
 
     def get_drink_records(self, pet_id: str) -> list[DrinkRecord]:
         """Get all drink records for a pet."""
-        return self._drinks_data.get(pet_id, [])
+        return self._drinks.data.get(pet_id, [])
+
+    def get_drink_records_between(
+        self, pet_id: str, start: datetime | None = None, end: datetime | None = None
+    ) -> list[DrinkRecord]:
+        """Get drink records for a pet within a time range."""
+        return self._drinks.between(pet_id, start, end)
 
     def get_meal_records(self, pet_id: str) -> list[MealRecord]:
         """Get all meal records for a pet."""
-        return self._meals_data.get(pet_id, [])
+        return self._meals.data.get(pet_id, [])
+
+    def get_meal_records_between(
+        self, pet_id: str, start: datetime | None = None, end: datetime | None = None
+    ) -> list[MealRecord]:
+        """Get meal records for a pet within a time range."""
+        return self._meals.between(pet_id, start, end)
 
     def get_thirst_level_records(self, pet_id: str) -> list[ThirstLevelRecord]:
         """Get all thirst level records for a pet."""
-        return self._thirst_levels_data.get(pet_id, [])
+        return self._thirst_levels.data.get(pet_id, [])
+
+    def get_thirst_level_records_between(
+        self, pet_id: str, start: datetime | None = None, end: datetime | None = None
+    ) -> list[ThirstLevelRecord]:
+        """Get thirst level records for a pet within a time range."""
+        return self._thirst_levels.between(pet_id, start, end)
 
     def get_appetite_level_records(self, pet_id: str) -> list[AppetiteLevelRecord]:
         """Get all appetite level records for a pet."""
-        return self._appetite_levels_data.get(pet_id, [])
+        return self._appetite_levels.data.get(pet_id, [])
+
+    def get_appetite_level_records_between(
+        self, pet_id: str, start: datetime | None = None, end: datetime | None = None
+    ) -> list[AppetiteLevelRecord]:
+        """Get appetite level records for a pet within a time range."""
+        return self._appetite_levels.between(pet_id, start, end)
 
     def get_wellbeing_records(self, pet_id: str) -> list[WellbeingRecord]:
         """Get all wellbeing records for a pet."""
-        return self._wellbeing_data.get(pet_id, [])
+        return self._wellbeing.data.get(pet_id, [])
+
+    def get_wellbeing_records_between(
+        self, pet_id: str, start: datetime | None = None, end: datetime | None = None
+    ) -> list[WellbeingRecord]:
+        """Get wellbeing records for a pet within a time range."""
+        return self._wellbeing.between(pet_id, start, end)
 
     def get_weight_records(self, pet_id: str) -> list[WeightRecord]:
         """Get all weight records for a pet."""
-        return self._weight_data.get(pet_id, [])
+        return self._weight.data.get(pet_id, [])
+
+    def get_weight_records_between(
+        self, pet_id: str, start: datetime | None = None, end: datetime | None = None
+    ) -> list[WeightRecord]:
+        """Get weight records for a pet within a time range."""
+        return self._weight.between(pet_id, start, end)
+
+    def get_weight_stats(
+        self, pet_id: str, start: datetime | None = None, end: datetime | None = None
+    ) -> SeriesStats | None:
+        """Summarize a pet's weight values within a time range."""
+        return self._weight.series(pet_id).stats(start, end)
 
     def get_vomit_records(self, pet_id: str) -> list[VomitRecord]:
         """Get all vomit records for a pet."""
-        return self._vomit_data.get(pet_id, [])
+        return self._vomit.data.get(pet_id, [])
+
+    def get_vomit_records_between(
+        self, pet_id: str, start: datetime | None = None, end: datetime | None = None
+    ) -> list[VomitRecord]:
+        """Get vomit records for a pet within a time range."""
+        return self._vomit.between(pet_id, start, end)
 
     async def async_save_generic_log(self, log: GenericLog) -> None:
         """Save a generic log."""
-        if log.pet_id not in self._generic_logs_data:
-            self._generic_logs_data[log.pet_id] = []
-        self._generic_logs_data[log.pet_id].append(log)
-
-        # Convert to storable format
-        store_data = {
-            pet_id: [l.to_dict() for l in logs]
-            for pet_id, logs in self._generic_logs_data.items()
-        }
-        await self._generic_logs_store.async_save(store_data)
+        await self._generic_logs.async_append(log)
 
         # Notify callbacks to update sensors immediately
-        self._notify_callbacks(log.pet_id)
+        self._notify_callbacks(log.pet_id, "generic_logs")
 
     def get_generic_logs(self, pet_id: str) -> list[GenericLog]:
         """Get all generic logs for a pet."""
-        return self._generic_logs_data.get(pet_id, [])
+        return self._generic_logs.data.get(pet_id, [])
+
+    def get_generic_logs_between(
+        self, pet_id: str, start: datetime | None = None, end: datetime | None = None
+    ) -> list[GenericLog]:
+        """Get generic logs for a pet within a time range."""
+        return self._generic_logs.between(pet_id, start, end)
 
     async def async_save_blood_glucose(self, record: BloodGlucoseRecord) -> None:
         """Save a blood glucose record."""
-        if record.pet_id not in self._blood_glucose_data:
-            self._blood_glucose_data[record.pet_id] = []
-        self._blood_glucose_data[record.pet_id].append(record)
-
-        store_data = {
-            pet_id: [r.to_dict() for r in records]
-            for pet_id, records in self._blood_glucose_data.items()
-        }
-        await self._blood_glucose_store.async_save(store_data)
-        self._notify_callbacks(record.pet_id)
+        await self._blood_glucose.async_append(record)
+        self._notify_callbacks(record.pet_id, "blood_glucose")
 
     async def async_save_glycated_hemoglobin(
         self, record: GlycatedHemoglobinRecord
     ) -> None:
         """Save a glycated hemoglobin record."""
-        if record.pet_id not in self._glycated_hemoglobin_data:
-            self._glycated_hemoglobin_data[record.pet_id] = []
-        self._glycated_hemoglobin_data[record.pet_id].append(record)
-
-        store_data = {
-            pet_id: [r.to_dict() for r in records]
-            for pet_id, records in self._glycated_hemoglobin_data.items()
-        }
-        await self._glycated_hemoglobin_store.async_save(store_data)
-        self._notify_callbacks(record.pet_id)
+        await self._glycated_hemoglobin.async_append(record)
+        self._notify_callbacks(record.pet_id, "glycated_hemoglobin")
 
     async def async_save_ketones(self, record: KetoneRecord) -> None:
         """Save a ketone record."""
-        if record.pet_id not in self._ketones_data:
-            self._ketones_data[record.pet_id] = []
-        self._ketones_data[record.pet_id].append(record)
-
-        store_data = {
-            pet_id: [r.to_dict() for r in records]
-            for pet_id, records in self._ketones_data.items()
-        }
-        await self._ketones_store.async_save(store_data)
-        self._notify_callbacks(record.pet_id)
+        await self._ketones.async_append(record)
+        self._notify_callbacks(record.pet_id, "ketones")
 
     def get_blood_glucose_records(self, pet_id: str) -> list[BloodGlucoseRecord]:
         """Get all blood glucose records for a pet."""
-        return self._blood_glucose_data.get(pet_id, [])
+        return self._blood_glucose.data.get(pet_id, [])
+
+    def get_blood_glucose_records_between(
+        self, pet_id: str, start: datetime | None = None, end: datetime | None = None
+    ) -> list[BloodGlucoseRecord]:
+        """Get blood glucose records for a pet within a time range."""
+        return self._blood_glucose.between(pet_id, start, end)
+
+    def get_blood_glucose_stats(
+        self, pet_id: str, start: datetime | None = None, end: datetime | None = None
+    ) -> SeriesStats | None:
+        """Summarize a pet's blood glucose values within a time range."""
+        return self._blood_glucose.series(pet_id).stats(start, end)
 
     def get_glycated_hemoglobin_records(
         self, pet_id: str
     ) -> list[GlycatedHemoglobinRecord]:
         """Get all glycated hemoglobin records for a pet."""
-        return self._glycated_hemoglobin_data.get(pet_id, [])
+        return self._glycated_hemoglobin.data.get(pet_id, [])
+
+    def get_glycated_hemoglobin_records_between(
+        self, pet_id: str, start: datetime | None = None, end: datetime | None = None
+    ) -> list[GlycatedHemoglobinRecord]:
+        """Get glycated hemoglobin records for a pet within a time range."""
+        return self._glycated_hemoglobin.between(pet_id, start, end)
+
+    def get_glycated_hemoglobin_stats(
+        self, pet_id: str, start: datetime | None = None, end: datetime | None = None
+    ) -> SeriesStats | None:
+        """Summarize a pet's glycated hemoglobin values within a time range."""
+        return self._glycated_hemoglobin.series(pet_id).stats(start, end)
 
     def get_ketone_records(self, pet_id: str) -> list[KetoneRecord]:
         """Get all ketone records for a pet."""
-        return self._ketones_data.get(pet_id, [])
-
-    def register_update_callback(self, pet_id: str, callback: Callable) -> None:
-        """Register a callback for when data is updated."""
+        return self._ketones.data.get(pet_id, [])
+
+    def get_ketone_records_between(
+        self, pet_id: str, start: datetime | None = None, end: datetime | None = None
+    ) -> list[KetoneRecord]:
+        """Get ketone records for a pet within a time range."""
+        return self._ketones.between(pet_id, start, end)
+
+    def get_ketone_stats(
+        self, pet_id: str, start: datetime | None = None, end: datetime | None = None
+    ) -> SeriesStats | None:
+        """Summarize a pet's ketone values within a time range."""
+        return self._ketones.series(pet_id).stats(start, end)
+
+    def _log_change(
+        self, record_type: str, operation: str, record: Any, pet_id: str
+    ) -> None:
+        """Number a change to a hot record for delta syncs."""
+        self._change_seq += 1
+        self._changes.append((self._change_seq, operation, record_type, pet_id, record))
+        for listener in list(self._change_listeners):
+            listener(operation, record_type, pet_id, record)
+
+    @property
+    def change_cursor(self) -> str:
+        """Return the cursor of the latest change, as epoch:sequence."""
+        return f"{self._change_epoch}:{self._change_seq}"
+
+    def get_changes_since(
+        self, cursor: str | None, pet_id: str | None = None
+    ) -> list[tuple[str, str, str, Any]] | None:
+        """Get the records inserted, updated and deleted after a cursor.
+
+        Returns (operation, record type, pet ID, record) oldest first, with
+        several changes to one record of a pet merged into one. Returns None
+        if the changes are not known, because the cursor is malformed, from
+        before a restart or older than the last CHANGE_LOG_SIZE changes.
+        """
+        epoch, _, seq = (cursor or "").partition(":")
+        if epoch != self._change_epoch or not seq.isdigit():
+            return None
+        since = int(seq)
+        if since > self._change_seq:
+            return None
+        first = self._changes[0][0] if self._changes else self._change_seq + 1
+        if since < first - 1:
+            return None
+
+        changes = merge_changes(
+            change[1:] for change in islice(self._changes, since - first + 1, None)
+        )
+        if pet_id is not None:
+            return [change for change in changes if change[2] == pet_id]
+        return changes
+
+    def add_change_listener(
+        self, listener: Callable[[str, str, str, Any], None]
+    ) -> Callable[[], None]:
+        """Call a listener with (operation, record type, pet ID, record) on changes.
+
+        Returns a function removing the listener.
+        """
+        self._change_listeners.append(listener)
+        return partial(self._change_listeners.remove, listener)
+
+    def register_update_callback(
+        self,
+        pet_id: str,
+        callback: Callable[[str], None],
+        record_types: Iterable[str] | None = None,
+    ) -> None:
+        """Register a callback for when data is updated.
+
+        The callback gets the type of the changed records. With
+        record_types it is only called for changes to those types.
+        """
+        if record_types is not None:
+            record_types = frozenset(record_types)
+            if unknown := record_types - self._collections.keys():
+                raise ValueError(f"Unknown record types: {', '.join(sorted(unknown))}")
         if pet_id not in self._callbacks:
             self._callbacks[pet_id] = []
-        self._callbacks[pet_id].append(callback)
+        self._callbacks[pet_id].append((callback, record_types))
 
-    def unregister_update_callback(self, pet_id: str, callback: Callable) -> None:
+    def unregister_update_callback(
+        self, pet_id: str, callback: Callable[[str], None]
+    ) -> None:
         """Unregister a callback."""
-        if pet_id in self._callbacks and callback in self._callbacks[pet_id]:
-            self._callbacks[pet_id].remove(callback)
-
-    def _notify_callbacks(self, pet_id: str) -> None:
-        """Notify all callbacks for a pet."""
         if pet_id in self._callbacks:
-            for callback in self._callbacks[pet_id]:
-                callback()
+            self._callbacks[pet_id] = [
+                registered
+                for registered in self._callbacks[pet_id]
+                if registered[0] != callback
+            ]
+
+    def _notify_callbacks(self, pet_id: str, record_type: str) -> None:
+        """Notify the callbacks of a pet about changed records of a type."""
+        if pet_id in self._callbacks:
+            for callback, record_types in self._callbacks[pet_id]:
+                if record_types is None or record_type in record_types:
+                    callback(record_type)
@@ -2,16 +2,24 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable
+from datetime import timedelta
+from itertools import takewhile
 from typing import Any
 
 import voluptuous as vol
 
 from homeassistant.components import websocket_api
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.json import json_dumps
+from homeassistant.util import dt as dt_util
 import logging
 
 from .const import DOMAIN, CONF_GENERIC_LOG_CATEGORIES
-from .store import PetHealthStore
+from .models import BathroomVisit
+from .rollup import BUCKETS
+from .store import PetHealthStore, hot_window_start, merge_changes
 
 
 @callback
@@ -22,15 +30,97 @@ def async_register_websocket_api(hass: HomeAssistant) -> None:
     websocket_api.async_register_command(hass, handle_get_medications)
     websocket_api.async_register_command(hass, handle_get_store_dump)
     websocket_api.async_register_command(hass, handle_get_unknown_visits)
+    websocket_api.async_register_command(hass, handle_get_daily_rollups)
+    websocket_api.async_register_command(hass, handle_get_aggregates)
+    websocket_api.async_register_command(hass, handle_get_unconfirmed_visits)
+    websocket_api.async_register_command(hass, handle_get_changes_since)
+    websocket_api.async_register_command(hass, handle_subscribe)
 
 
 _LOGGER = logging.getLogger(__name__)
 
+# Page size of pet_health/get_unconfirmed_visits
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+
+
+# Reading records newest first, a page at a time, see _async_get_page
+PAGE_SCHEMA = {
+    vol.Optional("start_time"): cv.datetime,
+    vol.Optional("end_time"): cv.datetime,
+    vol.Optional("before"): cv.datetime,
+    vol.Optional("limit"): vol.All(int, vol.Range(min=1)),
+}
+
+
+async def _async_get_page(
+    store: PetHealthStore,
+    record_type: str,
+    pet_ids: Iterable[str],
+    msg: dict[str, Any],
+) -> tuple[list[Any], str | None]:
+    """Read a page of some pets' records of a type, newest first.
+
+    The page is taken from the start_time to end_time range, before the
+    before timestamp (exclusive) and holds up to limit records. Records
+    sharing the timestamp of the oldest one on the page are all included,
+    so none are skipped. Returns the page and the before to request the
+    next one with, None if there are no older records.
+    """
+    start = msg.get("start_time")
+    end = msg.get("end_time")
+    if (before := msg.get("before")) is not None:
+        before = dt_util.as_utc(before) - timedelta(microseconds=1)
+        end = before if end is None else min(dt_util.as_utc(end), before)
+    limit = msg.get("limit")
+    pet_ids = list(pet_ids)
+
+    records: list[Any] = []
+    for pet_id in pet_ids:
+        # One more than the page, to know if there are older records
+        records.extend(
+            await store.async_get_records(
+                record_type, pet_id, start, end, limit and limit + 1
+            )
+        )
+    records.sort(key=lambda record: record.timestamp, reverse=True)
+    if limit is None or len(records) <= limit:
+        return records, None
+    oldest = records[limit - 1].timestamp
+    page = list(takewhile(lambda record: record.timestamp >= oldest, records))
+    if len(page) == len(records):
+        # Records sharing the oldest timestamp took up the extra record read,
+        # there is only a next page if a record older than them exists
+        end = oldest - timedelta(microseconds=1)
+        for pet_id in pet_ids:
+            if await store.async_get_records(record_type, pet_id, start, end, 1):
+                break
+        else:
+            return page, None
+    return page, page[-1].timestamp.isoformat()
+
+
+def _visit_to_dict(visit: BathroomVisit) -> dict[str, Any]:
+    """Convert a visit to its JSON-serializable format."""
+    return {
+        "visit_id": visit.visit_id,
+        "timestamp": visit.timestamp.isoformat(),
+        "pet_id": visit.pet_id,
+        "did_pee": visit.did_pee,
+        "did_poop": visit.did_poop,
+        "confirmed": visit.confirmed,
+        "poop_consistencies": visit.poop_consistencies,
+        "poop_color": visit.poop_color,
+        "urine_amount": visit.urine_amount,
+        "notes": visit.notes,
+    }
+
 
 @websocket_api.websocket_command(
     {
         vol.Required("type"): "pet_health/get_visits",
         vol.Optional("pet_id"): str,
+        **PAGE_SCHEMA,
     }
 )
 @websocket_api.async_response
@@ -46,42 +136,27 @@ async def handle_get_visits(
 
     _LOGGER.debug("pet_health.get_visits called with msg=%s", msg)
 
-    all_visits = []
-
     if pet_id:
-        visits = store.get_visits(pet_id)
-        all_visits = visits
+        pet_ids = [pet_id]
     else:
         # Get all visits from all pets
-        for entry in hass.config_entries.async_entries(DOMAIN):
-            entry_pet_id = entry.data.get("pet_id")
-            if entry_pet_id:
-                visits = store.get_visits(entry_pet_id)
-                all_visits.extend(visits)
+        pet_ids = [
+            entry.data["pet_id"]
+            for entry in hass.config_entries.async_entries(DOMAIN)
+            if entry.data.get("pet_id")
+        ]
 
-    # Convert visits to JSON-serializable format
-    visits_data = [
-        {
-            "visit_id": visit.visit_id,
-            "timestamp": visit.timestamp.isoformat(),
-            "pet_id": visit.pet_id,
-            "did_pee": visit.did_pee,
-            "did_poop": visit.did_poop,
-            "confirmed": visit.confirmed,
-            "poop_consistencies": visit.poop_consistencies,
-            "poop_color": visit.poop_color,
-            "urine_amount": visit.urine_amount,
-            "notes": visit.notes,
-        }
-        for visit in all_visits
-    ]
+    # Frozen history is only read for the requested range and page, newest first
+    all_visits, next_before = await _async_get_page(store, "visits", pet_ids, msg)
 
-    # Sort by timestamp descending
-    visits_data.sort(key=lambda v: v["timestamp"], reverse=True)
+    # Convert visits to JSON-serializable format
+    visits_data = [_visit_to_dict(visit) for visit in all_visits]
 
     _LOGGER.debug("pet_health.get_visits: returning %d visits", len(visits_data))
 
-    connection.send_result(msg["id"], {"visits": visits_data})
+    connection.send_result(
+        msg["id"], {"visits": visits_data, "next_before": next_before}
+    )
 
 
 @websocket_api.websocket_command(
@@ -132,6 +207,10 @@ async def handle_get_pet_data(
                 }
             )
 
+        # Sensor state writes skipped because nothing changed, once loaded
+        pet_data = getattr(entry, "runtime_data", None)
+        coordinator = pet_data and pet_data.coordinator
+
         # Include fields at both root and in data object for backward compatibility
         # Frontend accesses entry.data.pet_image_path, while some code may use root-level fields
         entries.append(
@@ -150,6 +229,7 @@ async def handle_get_pet_data(
                 },
                 "medications": pet_medications,
                 "generic_log_categories": pet_categories,
+                "suppressed_writes": coordinator and coordinator.suppressed_writes,
             }
         )
 
@@ -160,6 +240,7 @@ async def handle_get_pet_data(
     {
         vol.Required("type"): "pet_health/get_medications",
         vol.Optional("pet_id"): str,
+        **PAGE_SCHEMA,
     }
 )
 @websocket_api.async_response
@@ -175,22 +256,25 @@ async def handle_get_medications(
 
     _LOGGER.debug("pet_health.get_medications called with msg=%s", msg)
 
-    all_medications = []
-
     if pet_id:
-        meds = store.get_medications(pet_id)
-        all_medications = meds
+        pet_ids = [pet_id]
     else:
-        for entry in hass.config_entries.async_entries(DOMAIN):
-            entry_pet_id = entry.data.get("pet_id")
-            if entry_pet_id:
-                meds = store.get_medications(entry_pet_id)
-                all_medications.extend(meds)
+        pet_ids = [
+            entry.data["pet_id"]
+            for entry in hass.config_entries.async_entries(DOMAIN)
+            if entry.data.get("pet_id")
+        ]
+
+    # Frozen history is only read for the requested range and page, newest first
+    all_medications, next_before = await _async_get_page(
+        store, "medications", pet_ids, msg
+    )
 
     meds_data = [
         {
             "timestamp": med.timestamp.isoformat(),
             "pet_id": med.pet_id,
+            "medication_id": med.medication_id,
             "medication_name": med.medication_name,
             "dosage": med.dosage,
             "unit": med.unit,
@@ -199,21 +283,24 @@ async def handle_get_medications(
         for med in all_medications
     ]
 
-    meds_data.sort(key=lambda m: m["timestamp"], reverse=True)
-
     _LOGGER.debug(
         "pet_health.get_medications: returning %d records for %d pets",
         len(meds_data),
         len({m["pet_id"] for m in meds_data}),
     )
 
-    connection.send_result(msg["id"], {"medications": meds_data})
+    connection.send_result(
+        msg["id"], {"medications": meds_data, "next_before": next_before}
+    )
 
 
 @websocket_api.websocket_command(
     {
         vol.Required("type"): "pet_health/get_store_dump",
         vol.Optional("pet_id"): str,
+        vol.Optional("types"): [str],
+        vol.Optional("fields"): [str],
+        **PAGE_SCHEMA,
     }
 )
 @websocket_api.async_response
@@ -222,8 +309,50 @@ async def handle_get_store_dump(
     connection: websocket_api.ActiveConnection,
     msg: dict[str, Any],
 ) -> None:
-    """Return all stored pet health data for one or all pets."""
+    """Return stored pet health data for one or all pets.
+
+    types selects the record types to return and fields the fields of each
+    record, the timestamp is always included. Other lists and fields are
+    never built. Without a range or limit only the records since
+    hot_window_start are returned, which are never read from disk, and
+    next_before pages into the older ones.
+    """
     store: PetHealthStore = hass.data[DOMAIN]["store"]
+    # Taken first, so changes made while reading are sent again
+    cursor = store.change_cursor
+
+    record_types = store.record_types()
+    if (types := msg.get("types")) is not None:
+        if unknown := set(types) - set(record_types):
+            connection.send_error(
+                msg["id"],
+                websocket_api.ERR_INVALID_FORMAT,
+                f"Unknown record types: {', '.join(sorted(unknown))}",
+            )
+            return
+        record_types = [
+            record_type for record_type in record_types if record_type in types
+        ]
+
+    if (fields := msg.get("fields")) is not None:
+        known = {
+            name
+            for record_type in record_types
+            for name in store.get_record_fields(record_type)
+        }
+        if unknown := set(fields) - known:
+            connection.send_error(
+                msg["id"],
+                websocket_api.ERR_INVALID_FORMAT,
+                f"Unknown fields: {', '.join(sorted(unknown))}",
+            )
+            return
+        fields = {"timestamp", *fields}
+
+    hot_start = None
+    if not any(key in msg for key in ("start_time", "end_time", "before", "limit")):
+        hot_start = hot_window_start()
+        msg = {**msg, "start_time": hot_start}
 
     requested_pet = msg.get("pet_id")
 
@@ -235,94 +364,39 @@ async def handle_get_store_dump(
             pet_ids.add(pid)
 
     # include any pets that have data in store stores
-    pet_ids.update(getattr(store, "_visits_data", {}).keys())
-    pet_ids.update(getattr(store, "_medications_data", {}).keys())
-    pet_ids.update(getattr(store, "_drinks_data", {}).keys())
-    pet_ids.update(getattr(store, "_meals_data", {}).keys())
-    pet_ids.update(getattr(store, "_thirst_levels_data", {}).keys())
-    pet_ids.update(getattr(store, "_appetite_levels_data", {}).keys())
-    pet_ids.update(getattr(store, "_wellbeing_data", {}).keys())
-    pet_ids.update(getattr(store, "_weight_data", {}).keys())
-    pet_ids.update(getattr(store, "_vomit_data", {}).keys())
-    pet_ids.update(getattr(store, "_generic_logs_data", {}).keys())
-    pet_ids.update(getattr(store, "_blood_glucose_data", {}).keys())
-    pet_ids.update(getattr(store, "_glycated_hemoglobin_data", {}).keys())
-    pet_ids.update(getattr(store, "_ketones_data", {}).keys())
+    pet_ids.update(store.pet_ids())
 
     if requested_pet:
         pet_ids = {requested_pet}
 
-    result: dict[str, Any] = {"data": {}}
+    # Per pet and record type, the before to request older records with
+    result: dict[str, Any] = {"data": {}, "cursor": cursor, "next_before": {}}
 
     for pid in pet_ids:
-        visits = [v.to_dict() for v in store.get_visits(pid)]
-        medications = [m.to_dict() for m in store.get_medications(pid)]
-        drinks = [d.to_dict() for d in store.get_drink_records(pid)]
-        meals = [m.to_dict() for m in store.get_meal_records(pid)]
-        thirst = [t.to_dict() for t in store.get_thirst_level_records(pid)]
-        appetite = [a.to_dict() for a in store.get_appetite_level_records(pid)]
-        wellbeing = [w.to_dict() for w in store.get_wellbeing_records(pid)]
-        weight = [w.to_dict() for w in store.get_weight_records(pid)]
-        vomit = [v.to_dict() for v in store.get_vomit_records(pid)]
-        generic_logs = [g.to_dict() for g in store.get_generic_logs(pid)]
-        blood_glucose = [b.to_dict() for b in store.get_blood_glucose_records(pid)]
-        glycated_hemoglobin = [
-            g.to_dict() for g in store.get_glycated_hemoglobin_records(pid)
-        ]
-        ketones = [k.to_dict() for k in store.get_ketone_records(pid)]
-
-        # sort each list by timestamp desc
-        for lst in (
-            visits,
-            medications,
-            drinks,
-            meals,
-            thirst,
-            appetite,
-            wellbeing,
-            weight,
-            vomit,
-            generic_logs,
-            blood_glucose,
-            glycated_hemoglobin,
-            ketones,
-        ):
-            lst.sort(key=lambda x: x.get("timestamp", ""), reverse=True)
-
-        result["data"][pid] = {
-            "visits": visits,
-            "medications": medications,
-            "drinks": drinks,
-            "meals": meals,
-            "thirst_levels": thirst,
-            "appetite_levels": appetite,
-            "wellbeing": wellbeing,
-            "weight": weight,
-            "vomit": vomit,
-            "generic_logs": generic_logs,
-            "blood_glucose": blood_glucose,
-            "glycated_hemoglobin": glycated_hemoglobin,
-            "ketones": ketones,
-        }
+        pet_data: dict[str, list[dict[str, Any]]] = {}
+        next_before: dict[str, str | None] = {}
+        for record_type in record_types:
+            # Frozen history is only read for the requested range and page,
+            # each list is sorted by timestamp desc
+            records, next_before[record_type] = await _async_get_page(
+                store, record_type, [pid], msg
+            )
+            if hot_start is not None and store.has_records_before(
+                record_type, pid, hot_start
+            ):
+                next_before[record_type] = hot_start.isoformat()
+            if fields is None:
+                pet_data[record_type] = [r.to_dict() for r in records]
+            else:
+                pet_data[record_type] = [r.to_partial_dict(fields) for r in records]
+
+        result["data"][pid] = pet_data
+        result["next_before"][pid] = next_before
 
         _LOGGER.debug(
             "pet_health.get_store_dump: pet=%s counts=%s",
             pid,
-            {
-                "visits": len(visits),
-                "medications": len(medications),
-                "drinks": len(drinks),
-                "meals": len(meals),
-                "thirst": len(thirst),
-                "appetite": len(appetite),
-                "wellbeing": len(wellbeing),
-                "weight": len(weight),
-                "vomit": len(vomit),
-                "generic_logs": len(generic_logs),
-                "blood_glucose": len(blood_glucose),
-                "glycated_hemoglobin": len(glycated_hemoglobin),
-                "ketones": len(ketones),
-            },
+            {record_type: len(records) for record_type, records in pet_data.items()},
         )
 
     _LOGGER.debug("pet_health.get_store_dump: returning %d pets", len(result["data"]))
@@ -352,21 +426,7 @@ async def handle_get_unknown_visits(
     unknown_visits = store.get_visits(UNKNOWN_ENTRY_ID)
 
     # Convert visits to JSON-serializable format
-    visits_data = [
-        {
-            "visit_id": visit.visit_id,
-            "timestamp": visit.timestamp.isoformat(),
-            "pet_id": visit.pet_id,
-            "did_pee": visit.did_pee,
-            "did_poop": visit.did_poop,
-            "confirmed": visit.confirmed,
-            "poop_consistencies": visit.poop_consistencies,
-            "poop_color": visit.poop_color,
-            "urine_amount": visit.urine_amount,
-            "notes": visit.notes,
-        }
-        for visit in unknown_visits
-    ]
+    visits_data = [_visit_to_dict(visit) for visit in unknown_visits]
 
     # Sort by timestamp descending
     visits_data.sort(key=lambda v: v["timestamp"], reverse=True)
@@ -374,3 +434,318 @@ async def handle_get_unknown_visits(
     _LOGGER.debug("pet_health.get_unknown_visits: returning %d visits", len(visits_data))
 
     connection.send_result(msg["id"], {"visits": visits_data})
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "pet_health/get_daily_rollups",
+        vol.Required("pet_id"): str,
+        vol.Optional("record_type"): str,
+        vol.Optional("start_date"): cv.date,
+        vol.Optional("end_date"): cv.date,
+    }
+)
+@callback
+def handle_get_daily_rollups(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Return the daily rollups of records compacted by the retention policy."""
+    store: PetHealthStore = hass.data[DOMAIN]["store"]
+
+    record_types = store.record_types()
+    if record_type := msg.get("record_type"):
+        if record_type not in record_types:
+            connection.send_error(
+                msg["id"],
+                websocket_api.ERR_INVALID_FORMAT,
+                f"Unknown record type: {record_type}",
+            )
+            return
+        record_types = [record_type]
+
+    rollups = {
+        record_type: store.get_daily_rollups(
+            record_type, msg["pet_id"], msg.get("start_date"), msg.get("end_date")
+        )
+        for record_type in record_types
+    }
+
+    connection.send_result(msg["id"], {"rollups": rollups})
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "pet_health/get_aggregates",
+        vol.Required("pet_id"): str,
+        vol.Required("record_type"): str,
+        vol.Optional("bucket", default="day"): vol.In(BUCKETS),
+        vol.Optional("start_time"): cv.datetime,
+        vol.Optional("end_time"): cv.datetime,
+        vol.Optional("metrics"): [str],
+    }
+)
+@websocket_api.async_response
+async def handle_get_aggregates(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Return a pet's records of one type aggregated per time bucket.
+
+    Each bucket holds the record count and the requested metrics, all of
+    the record type's by default, so charts don't need the records. The
+    range runs from start_time to before end_time.
+    """
+    store: PetHealthStore = hass.data[DOMAIN]["store"]
+
+    record_type = msg["record_type"]
+    if record_type not in store.record_types():
+        connection.send_error(
+            msg["id"],
+            websocket_api.ERR_INVALID_FORMAT,
+            f"Unknown record type: {record_type}",
+        )
+        return
+    metrics = msg.get("metrics")
+    if metrics is not None and (
+        unknown := set(metrics) - set(store.get_aggregate_metrics(record_type))
+    ):
+        connection.send_error(
+            msg["id"],
+            websocket_api.ERR_INVALID_FORMAT,
+            f"Unknown metrics for {record_type}: {', '.join(sorted(unknown))}",
+        )
+        return
+
+    try:
+        buckets = await store.async_get_aggregates(
+            record_type,
+            msg["pet_id"],
+            msg["bucket"],
+            msg.get("start_time"),
+            msg.get("end_time"),
+            metrics,
+        )
+    except ValueError as err:
+        connection.send_error(msg["id"], websocket_api.ERR_INVALID_FORMAT, str(err))
+        return
+
+    connection.send_result(msg["id"], {"bucket": msg["bucket"], "buckets": buckets})
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "pet_health/get_unconfirmed_visits",
+        vol.Optional("pet_id"): str,
+        vol.Optional("offset", default=0): vol.All(int, vol.Range(min=0)),
+        vol.Optional("limit", default=DEFAULT_PAGE_SIZE): vol.All(
+            int, vol.Range(min=1, max=MAX_PAGE_SIZE)
+        ),
+    }
+)
+@callback
+def handle_get_unconfirmed_visits(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Return a page of the unconfirmed visit queue, oldest first."""
+    store: PetHealthStore = hass.data[DOMAIN]["store"]
+
+    if pet_id := msg.get("pet_id"):
+        pet_ids = [pet_id]
+    else:
+        pet_ids = store.pet_ids()
+
+    unconfirmed = [
+        visit
+        for pid in pet_ids
+        for visit in store.get_visits(pid)
+        if not visit.confirmed
+    ]
+    if len(pet_ids) > 1:
+        unconfirmed.sort(key=lambda visit: visit.timestamp)
+
+    offset = msg["offset"]
+    limit = msg["limit"]
+    connection.send_result(
+        msg["id"],
+        {
+            "visits": [
+                _visit_to_dict(visit) for visit in unconfirmed[offset : offset + limit]
+            ],
+            "total": len(unconfirmed),
+            "offset": offset,
+            "has_more": offset + limit < len(unconfirmed),
+        },
+    )
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "pet_health/get_changes_since",
+        vol.Optional("cursor"): str,
+        vol.Optional("pet_id"): str,
+    }
+)
+@callback
+def handle_get_changes_since(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Return the records changed after a cursor and the cursor to continue from.
+
+    When the changes are no longer known reset is set, the client then
+    reloads everything with pet_health/get_store_dump. Apply deleted
+    records first, a record moved to another pet is deleted and inserted.
+    """
+    store: PetHealthStore = hass.data[DOMAIN]["store"]
+
+    cursor = store.change_cursor
+    changes = store.get_changes_since(msg.get("cursor"), msg.get("pet_id"))
+    result: dict[str, Any] = {
+        "cursor": cursor,
+        "reset": changes is None,
+        "deleted": [],
+        "inserted": [],
+        "updated": [],
+    }
+    for operation, record_type, pet_id, record in changes or ():
+        result[operation].append(
+            {"record_type": record_type, "pet_id": pet_id, "record": record.to_dict()}
+        )
+
+    connection.send_result(msg["id"], result)
+
+
+class _ChangeStream:
+    """Push record changes to the pet_health/subscribe subscriptions.
+
+    Changes made together, like a bulk confirm, are sent as one event once
+    the current call is done. Each changed record is serialized once, no
+    matter how many connections are subscribed.
+    """
+
+    def __init__(self, hass: HomeAssistant, store: PetHealthStore) -> None:
+        """Initialize the stream."""
+        self._hass = hass
+        self._store = store
+        # Message ID, connection, pet and record types of each subscription
+        self._subscriptions: list[
+            tuple[int, websocket_api.ActiveConnection, str | None, set[str] | None]
+        ] = []
+        self._pending: list[tuple[str, str, str, Any]] = []
+        self._remove_listener: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_subscribe(
+        self,
+        msg_id: int,
+        connection: websocket_api.ActiveConnection,
+        pet_id: str | None,
+        record_types: set[str] | None,
+    ) -> CALLBACK_TYPE:
+        """Send changes to a connection, returns a function to unsubscribe."""
+        subscription = (msg_id, connection, pet_id, record_types)
+        self._subscriptions.append(subscription)
+        if self._remove_listener is None:
+            self._remove_listener = self._store.add_change_listener(self._async_changed)
+
+        @callback
+        def unsubscribe() -> None:
+            self._subscriptions.remove(subscription)
+            if not self._subscriptions and self._remove_listener is not None:
+                self._remove_listener()
+                self._remove_listener = None
+
+        return unsubscribe
+
+    @callback
+    def _async_changed(
+        self, operation: str, record_type: str, pet_id: str, record: Any
+    ) -> None:
+        """Queue a change, to be sent with the others of the same call."""
+        if not self._pending:
+            self._hass.loop.call_soon(self._async_send)
+        self._pending.append((operation, record_type, pet_id, record))
+
+    @callback
+    def _async_send(self) -> None:
+        """Send the queued changes to the matching subscriptions."""
+        changes = merge_changes(self._pending)
+        self._pending = []
+        cursor = json_dumps(self._store.change_cursor)
+        serialized = [
+            (
+                operation,
+                record_type,
+                pet_id,
+                json_dumps(
+                    {
+                        "record_type": record_type,
+                        "pet_id": pet_id,
+                        "record": record.to_dict(),
+                    }
+                ),
+            )
+            for operation, record_type, pet_id, record in changes
+        ]
+        for msg_id, connection, pet_id, record_types in self._subscriptions:
+            event: dict[str, list[str]] = {"deleted": [], "inserted": [], "updated": []}
+            for operation, record_type, change_pet_id, change in serialized:
+                if (pet_id is None or change_pet_id == pet_id) and (
+                    record_types is None or record_type in record_types
+                ):
+                    event[operation].append(change)
+            if any(event.values()):
+                # Assembled from the serialized changes, same as event_message
+                connection.send_message(
+                    f'{{"id":{msg_id},"type":"event","event":{{"cursor":{cursor}'
+                    + "".join(
+                        f',"{operation}":[{",".join(entries)}]'
+                        for operation, entries in event.items()
+                    )
+                    + "}}"
+                )
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "pet_health/subscribe",
+        vol.Optional("pet_id"): str,
+        vol.Optional("record_types"): [str],
+    }
+)
+@callback
+def handle_subscribe(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Push the records that change, as in pet_health/get_changes_since.
+
+    The result holds the cursor to catch up from with get_changes_since
+    after a reconnect, every event the cursor after its changes.
+    """
+    store: PetHealthStore = hass.data[DOMAIN]["store"]
+
+    record_types = msg.get("record_types")
+    if record_types is not None:
+        if unknown := set(record_types) - set(store.record_types()):
+            connection.send_error(
+                msg["id"],
+                websocket_api.ERR_INVALID_FORMAT,
+                f"Unknown record types: {', '.join(sorted(unknown))}",
+            )
+            return
+        record_types = set(record_types)
+
+    if (stream := hass.data[DOMAIN].get("change_stream")) is None:
+        stream = hass.data[DOMAIN]["change_stream"] = _ChangeStream(hass, store)
+    connection.subscriptions[msg["id"]] = stream.async_subscribe(
+        msg["id"], connection, msg.get("pet_id"), record_types
+    )
+    connection.send_result(msg["id"], {"cursor": store.change_cursor})